@@ -0,0 +1,79 @@
+"""Encode/decode throughput of the available JSON backends on realistic payloads.
+
+Usage: python benchmarks/bench_codec.py [repeat]
+"""
+
+import base64
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core.codec import BACKEND, available_codecs  # noqa: E402
+
+
+def _payloads() -> dict:
+    rng = random.Random(0)
+    tools = [
+        {
+            "name": f"blender.tool_{index}",
+            "description": "Apply an operation to the current Blender scene. " * 2,
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "object": {"type": "string"},
+                    "location": {"type": "array", "items": {"type": "number"}},
+                    "mode": {"enum": ["fast", "exact"]},
+                },
+                "required": ["object"],
+            },
+        }
+        for index in range(200)
+    ]
+    vertices = [[rng.uniform(-10, 10) for _ in range(3)] for _ in range(50000)]
+    packed = base64.b64encode(bytes(rng.getrandbits(8) for _ in range(600000))).decode("ascii")
+    return {
+        "tools/call request": {
+            "jsonrpc": "2.0",
+            "id": 7,
+            "method": "tools/call",
+            "params": {"name": "blender.ping", "arguments": {}},
+        },
+        "tools/list (200 tools)": {"jsonrpc": "2.0", "id": 1, "result": {"tools": tools}},
+        "mesh result (50k float lists)": {"jsonrpc": "2.0", "id": 2, "result": {"ok": True, "data": {"co": vertices}}},
+        "mesh result (base64 600KB)": {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "result": {"ok": True, "data": {"co": {"dtype": "float32", "shape": [50000, 3], "data": packed}}},
+        },
+    }
+
+
+def _time(fn, arg, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    codecs = available_codecs()
+    print(f"selected backend: {BACKEND}")
+    print(f"{'payload':<32} {'backend':<8} {'size':>9} {'dumps us':>11} {'loads us':>11}")
+    for label, payload in _payloads().items():
+        for name, codec in codecs.items():
+            data = codec.dumps(payload)
+            count = repeat * 500 if len(data) < 1024 else repeat
+            encode = _time(codec.dumps, payload, count)
+            decode = _time(codec.loads, data, count)
+            print(f"{label:<32} {name:<8} {len(data):>9} {encode:>11.1f} {decode:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""handle_request throughput with 10, 100 and 1000 registered tools.
+
+Compares registry dispatch (dict lookup) against the former linear
+``if tool_name == ...`` chain, calling the last-registered tool so the chain
+pays its worst case.
+
+Usage: python benchmarks/bench_dispatch.py [calls]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from blender_tools.registry import ToolRegistry  # noqa: E402
+from mcp_core.server import handle_request  # noqa: E402
+
+
+def _build(count: int):
+    registry = ToolRegistry()
+    names = [f"bench.tool_{index}" for index in range(count)]
+    for name in names:
+        registry.register(name, lambda arguments: {}, f"Benchmark tool {name}")
+
+    def chain_executor(tool_name, arguments):
+        for name in names:
+            if tool_name == name:
+                return {}
+        raise KeyError(tool_name)
+
+    return registry, chain_executor, names[-1]
+
+
+def _throughput(executor, lister, tool_name: str, calls: int) -> float:
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": tool_name, "arguments": {}},
+    }
+    start = time.perf_counter()
+    for _ in range(calls):
+        handle_request(request, tool_executor=executor, tool_lister=lister)
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    print(f"{'tools':>6} {'registry req/s':>16} {'if-chain req/s':>16}")
+    for count in (10, 100, 1000):
+        registry, chain_executor, last = _build(count)
+        registry_rate = _throughput(registry.execute, registry.list_tools, last, calls)
+        chain_rate = _throughput(chain_executor, registry.list_tools, last, calls)
+        print(f"{count:>6} {registry_rate:>16,.0f} {chain_rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Per-call overhead of the daemon's HTTP proxy: urlopen per call vs keep-alive pool.
+
+Usage: python benchmarks/bench_proxy_latency.py [calls]
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from urllib import request
+
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core.transport_http import run_http  # noqa: E402
+from mcp_daemon import main as daemon  # noqa: E402
+
+
+def _urlopen_call(url: str, payload: dict) -> dict:
+    """The pre-pool proxy path: new Request and TCP connection on every call."""
+    data = json.dumps(payload).encode("utf-8")
+    req = request.Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
+    with request.urlopen(req) as resp:
+        return json.loads(resp.read().decode("utf-8"))
+
+
+def _measure(label: str, fn, calls: int) -> float:
+    for _ in range(min(50, calls)):
+        fn()
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    per_call_us = (time.perf_counter() - start) / calls * 1e6
+    print(f"{label:<24} {per_call_us:10.1f} us/call")
+    return per_call_us
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    server = run_http(port=0, tool_executor=lambda name, arguments: {"message": "pong"})
+    host, port = server.server_address
+    url = f"http://{host}:{port}/mcp"
+    os.environ["BLENDER_MCP_HTTP_URL"] = url
+    payload = {
+        "jsonrpc": "2.0",
+        "id": "1",
+        "method": "tools/call",
+        "params": {"tool": "blender.ping", "arguments": {}},
+    }
+    try:
+        before = _measure("urlopen per call", lambda: _urlopen_call(url, payload), calls)
+        after = _measure("keep-alive pool", lambda: daemon.execute_tool("blender.ping", {}), calls)
+        print(f"{'speedup':<24} {before / after:10.2f}x")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""stdio throughput in messages/sec: newline-delimited JSON vs length-prefixed frames.
+
+Usage: python benchmarks/bench_stdio_framing.py [messages]
+"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core.codec import dumps  # noqa: E402
+from mcp_core.framing import encode_frame  # noqa: E402
+from mcp_core.transport_stdio import LENGTH_PREFIXED, NEWLINE, run_stdio  # noqa: E402
+
+
+def _requests(count: int):
+    return [
+        dumps({"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"tool": "blender.ping", "arguments": {}}})
+        for i in range(count)
+    ]
+
+
+def _pump(fd: int, data: bytes) -> None:
+    with os.fdopen(fd, "wb") as stream:
+        stream.write(data)
+
+
+def _drain(fd: int) -> None:
+    with os.fdopen(fd, "rb") as stream:
+        while stream.read(1 << 16):
+            pass
+
+
+def _measure(label: str, framing: str, data: bytes, count: int, max_in_flight: int) -> float:
+    """Serve count requests over real pipes, so write and flush costs are system calls."""
+    in_read, in_write = os.pipe()
+    out_read, out_write = os.pipe()
+    feeder = threading.Thread(target=_pump, args=(in_write, data))
+    drainer = threading.Thread(target=_drain, args=(out_read,))
+    stdin, stdout = sys.stdin, sys.stdout
+    sys.stdin = SimpleNamespace(buffer=os.fdopen(in_read, "rb"))
+    sys.stdout = SimpleNamespace(buffer=os.fdopen(out_write, "wb"))
+    feeder.start()
+    drainer.start()
+    try:
+        start = time.perf_counter()
+        run_stdio(
+            tool_executor=lambda name, arguments: {"message": "pong"},
+            tool_lister=lambda: [],
+            max_in_flight=max_in_flight,
+            framing=framing,
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        sys.stdin.buffer.close()
+        sys.stdout.buffer.close()
+        sys.stdin, sys.stdout = stdin, stdout
+        feeder.join()
+        drainer.join()
+    rate = count / elapsed
+    print(f"{label:<28} {rate:12.0f} msg/s")
+    return rate
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    messages = _requests(count)
+    lines = b"".join(message + b"\n" for message in messages)
+    frames = b"".join(encode_frame(message) for message in messages)
+    for max_in_flight in (1, 4):
+        newline = _measure(f"newline, in-flight {max_in_flight}", NEWLINE, lines, count, max_in_flight)
+        framed = _measure(f"length-prefixed, in-flight {max_in_flight}", LENGTH_PREFIXED, frames, count, max_in_flight)
+        print(f"{'speedup':<28} {framed / newline:12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
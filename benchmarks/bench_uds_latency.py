@@ -0,0 +1,55 @@
+"""Round-trip latency of the daemon's provider link: keep-alive HTTP vs Unix socket.
+
+Usage: python benchmarks/bench_uds_latency.py [calls]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core.transport_http import run_http  # noqa: E402
+from mcp_core.transport_uds import run_uds  # noqa: E402
+from mcp_daemon import main as daemon  # noqa: E402
+
+
+def _pong(name, arguments):
+    return {"message": "pong"}
+
+
+def _measure(label: str, url: str, calls: int) -> float:
+    os.environ["BLENDER_MCP_HTTP_URL"] = url
+    for _ in range(min(50, calls)):
+        daemon.execute_tool("blender.ping", {})
+    start = time.perf_counter()
+    for _ in range(calls):
+        daemon.execute_tool("blender.ping", {})
+    per_call_us = (time.perf_counter() - start) / calls * 1e6
+    print(f"{label:<24} {per_call_us:10.1f} us/call")
+    return per_call_us
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    http_server = run_http(port=0, tool_executor=_pong)
+    socket_dir = tempfile.mkdtemp()
+    uds_server = run_uds(os.path.join(socket_dir, "bench.sock"), tool_executor=_pong)
+    host, port = http_server.server_address
+    try:
+        http = _measure("http keep-alive", f"http://{host}:{port}/mcp", calls)
+        uds = _measure("unix socket", f"unix://{uds_server.server_address}", calls)
+        print(f"{'speedup':<24} {http / uds:10.2f}x")
+    finally:
+        for server in (http_server, uds_server):
+            server.shutdown()
+            server.server_close()
+        os.rmdir(socket_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Main-thread dispatch queue for tool calls that touch bpy."""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from mcp_core.cancellation import RequestContext, current_request
+
+
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_TIME_BUDGET = 0.010
+DEFAULT_INTERVAL = 0.010
+
+ToolExecutor = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+TimingObserver = Optional[Callable[[str, float, float], None]]
+# Called with the tick deadline once queued calls are drained; returns True while it has work left.
+BackgroundWork = Optional[Callable[[float], bool]]
+
+
+class _WorkItem:
+    __slots__ = (
+        "tool_name",
+        "arguments",
+        "context",
+        "enqueued",
+        "started",
+        "ended",
+        "done",
+        "finished",
+        "abandoned",
+        "result",
+        "error",
+    )
+
+    def __init__(self, tool_name: str, arguments: Dict[str, Any], context: Optional[RequestContext]) -> None:
+        self.tool_name = tool_name
+        self.arguments = arguments
+        self.context = context
+        self.enqueued = time.perf_counter()
+        self.started: Optional[float] = None
+        self.ended = 0.0
+        self.done = threading.Event()
+        self.finished = False
+        self.abandoned = False
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def interrupted(self) -> bool:
+        context = self.context
+        return self.abandoned or (context is not None and (context.cancelled or context.expired))
+
+
+class _Timing:
+    __slots__ = ("total", "max", "last")
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def snapshot(self, calls: int) -> Dict[str, float]:
+        return {
+            "total_ms": self.total * 1000.0,
+            "mean_ms": self.total * 1000.0 / calls if calls else 0.0,
+            "max_ms": self.max * 1000.0,
+            "last_ms": self.last * 1000.0,
+        }
+
+
+class MainThreadDispatcher:
+    """
+    Queue tool calls from server threads and run them on Blender's main thread.
+
+    submit() blocks the calling thread until the call has run. tick() is
+    driven by a bpy.app.timers callback on the main thread and runs at most
+    batch_size queued calls, stopping early once time_budget seconds have
+    been spent. Time spent waiting in the queue and time spent executing are
+    tracked separately, reported by stats() and, for a traced request,
+    recorded as its dispatch.wait and tool.execute spans.
+
+    Calls submitted under a request context (mcp_core.cancellation) stop
+    waiting when the request is cancelled or times out; if they are still
+    queued at that point they are dropped without running.
+
+    background, when given, gets the rest of a tick once no calls are queued
+    (the job manager), so long-running work never delays interactive calls
+    by more than one of its steps.
+    """
+
+    def __init__(
+        self,
+        tool_executor: ToolExecutor,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+        interval: float = DEFAULT_INTERVAL,
+        observer: TimingObserver = None,
+        background: BackgroundWork = None,
+    ) -> None:
+        self.tool_executor = tool_executor
+        self.batch_size = max(1, batch_size)
+        self.time_budget = time_budget
+        self.interval = interval
+        self.observer = observer
+        self.background = background
+        self._queue: "queue.SimpleQueue[_WorkItem]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._errors = 0
+        self._dropped = 0
+        self._ticks = 0
+        self._queue_wait = _Timing()
+        self._execution = _Timing()
+
+    def submit(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a tool call for the main thread and wait for its result."""
+        context = current_request()
+        item = _WorkItem(tool_name, arguments, context)
+        self._queue.put(item)
+        if context is None:
+            item.done.wait()
+        else:
+            # Cancellation also sets item.done to wake us, so check finished.
+            context.wait(item.done)
+            if not item.finished:
+                item.abandoned = True
+                raise context.interruption()
+            if context.span is not None and item.started is not None:
+                context.span.record("dispatch.wait", item.enqueued, item.started)
+                context.span.record("tool.execute", item.started, item.ended, tool=tool_name)
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    def tick(self) -> float:
+        """Drain queued work within the batch and time budget; return the next timer interval."""
+        started = time.perf_counter()
+        deadline = started + self.time_budget
+        processed = 0
+        while processed < self.batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item.interrupted():
+                self._drop(item)
+                continue
+            self._run(item)
+            processed += 1
+            if time.perf_counter() >= deadline:
+                break
+        busy = False
+        if self.background is not None and self._queue.empty():
+            busy = self.background(deadline)
+        with self._lock:
+            self._ticks += 1
+        # Come straight back when work is still waiting.
+        return 0.0 if busy or not self._queue.empty() else self.interval
+
+    def register(self) -> None:
+        """Start draining the queue from a persistent bpy.app.timers callback."""
+        import bpy
+
+        if not bpy.app.timers.is_registered(self.tick):
+            bpy.app.timers.register(self.tick, first_interval=0.0, persistent=True)
+
+    def unregister(self) -> None:
+        import bpy
+
+        if bpy.app.timers.is_registered(self.tick):
+            bpy.app.timers.unregister(self.tick)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call counts plus queue-wait and execution timings."""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "errors": self._errors,
+                "dropped": self._dropped,
+                "ticks": self._ticks,
+                "queue_depth": self._queue.qsize(),
+                "queue_wait": self._queue_wait.snapshot(self._calls),
+                "execution": self._execution.snapshot(self._calls),
+            }
+
+    def _drop(self, item: _WorkItem) -> None:
+        item.error = item.context.interruption() if item.context is not None else None
+        with self._lock:
+            self._dropped += 1
+        item.finished = True
+        item.done.set()
+
+    def _run(self, item: _WorkItem) -> None:
+        started = time.perf_counter()
+        try:
+            item.result = self.tool_executor(item.tool_name, item.arguments)
+        except Exception as exc:  # noqa: BLE001
+            item.error = exc
+        finished = time.perf_counter()
+        item.started = started
+        item.ended = finished
+        queue_wait = started - item.enqueued
+        execution = finished - started
+        with self._lock:
+            self._calls += 1
+            if item.error is not None:
+                self._errors += 1
+            self._queue_wait.add(queue_wait)
+            self._execution.add(execution)
+        item.finished = True
+        item.done.set()
+        if self.observer is not None:
+            try:
+                self.observer(item.tool_name, queue_wait, execution)
+            except Exception:  # noqa: BLE001
+                pass
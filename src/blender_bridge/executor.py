@@ -1,18 +1,23 @@
 """Tool executor mapping Blender tools to MCP calls."""
 
-import bpy
+from blender_tools import REGISTRY
 
 
 def execute_tool(tool_name: str, arguments: dict) -> dict:
     """
-    Execute a Blender tool by name.
+    Execute a Blender tool by name through the tool registry.
 
     Raises:
         KeyError: when tool_name is not supported.
     """
-    if tool_name == "blender.ping":
-        return {"message": "pong"}
-    if tool_name == "blender.add_cube":
-        bpy.ops.mesh.primitive_cube_add()
-        return {"object": "Cube"}
-    raise KeyError(tool_name)
+    return REGISTRY.execute(tool_name, arguments)
+
+
+def start_tool(tool_name: str, arguments: dict) -> object:
+    """
+    Start a Blender tool by name; stepwise tools return their generator unstarted.
+
+    Raises:
+        KeyError: when tool_name is not supported.
+    """
+    return REGISTRY.start(tool_name, arguments)
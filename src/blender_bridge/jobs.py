@@ -0,0 +1,303 @@
+"""Background jobs for long-running tools (render, bake, export)."""
+
+import heapq
+import itertools
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from types import GeneratorType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mcp_core.schema import ValidatorCache
+from mcp_core.server import ServerOverloaded
+
+
+DEFAULT_MAX_QUEUED = 64
+DEFAULT_MAX_FINISHED = 256
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+ToolStarter = Callable[[str, Dict[str, Any]], Any]
+
+
+class Job:
+    __slots__ = (
+        "job_id",
+        "tool_name",
+        "arguments",
+        "priority",
+        "state",
+        "progress",
+        "message",
+        "result",
+        "error",
+        "cancel_requested",
+        "created",
+        "started",
+        "finished",
+        "steps",
+    )
+
+    def __init__(self, tool_name: str, arguments: Dict[str, Any], priority: int) -> None:
+        self.job_id = uuid.uuid4().hex
+        self.tool_name = tool_name
+        self.arguments = arguments
+        self.priority = priority
+        self.state = QUEUED
+        self.progress = 0.0
+        self.message = ""
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.cancel_requested = False
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.steps: Any = None
+
+    def status(self) -> Dict[str, Any]:
+        status = {
+            "job_id": self.job_id,
+            "tool": self.tool_name,
+            "state": self.state,
+            "priority": self.priority,
+            "progress": self.progress,
+            "message": self.message,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+        }
+        if self.error is not None:
+            status["error"] = self.error
+        return status
+
+
+class JobManager:
+    """
+    Priority queue of background tool calls run on Blender's main thread.
+
+    submit(), status(), cancel() and result() return immediately and are safe
+    from any server thread. run() is the dispatcher's background callback: it
+    gets the main thread only once the interactive queue is empty, and runs
+    one job at a time, highest priority first and FIFO within a priority.
+
+    A stepwise tool (a generator function, see ToolRegistry) advances one
+    step per iteration, so interactive calls get in between its steps, its
+    yields are reported as progress and it can be cancelled between steps.
+    A plain tool runs in one go; cancelling it discards its result.
+
+    At most max_queued jobs wait to start (ServerOverloaded beyond that) and
+    the last max_finished finished jobs are kept for status and result.
+    """
+
+    def __init__(
+        self,
+        tool_starter: ToolStarter,
+        tool_lister: Optional[Callable[[], list]] = None,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        max_finished: int = DEFAULT_MAX_FINISHED,
+    ) -> None:
+        self.tool_starter = tool_starter
+        self.tool_lister = tool_lister
+        self.max_queued = max(1, max_queued)
+        self.max_finished = max(1, max_finished)
+        self._validators = ValidatorCache()
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[int, int, Job]] = []
+        self._order = itertools.count()
+        self._jobs: Dict[str, Job] = {}
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self._queued = 0
+        self._current: Optional[Job] = None
+
+    def submit(self, tool_name: str, arguments: Dict[str, Any], priority: int = 0) -> Dict[str, Any]:
+        """Queue a tool call as a job and return its status; raises ValueError for an invalid call."""
+        self._check_call(tool_name, arguments)
+        with self._lock:
+            if self._queued >= self.max_queued:
+                raise ServerOverloaded("job queue full")
+            job = Job(tool_name, arguments, priority)
+            self._jobs[job.job_id] = job
+            heapq.heappush(self._heap, (-priority, next(self._order), job))
+            self._queued += 1
+            return job.status()
+
+    def status(self, job_id: Optional[str] = None) -> Dict[str, Any]:
+        """Return one job's status, or every known job's when job_id is None."""
+        with self._lock:
+            if job_id is not None:
+                return self._get(job_id).status()
+            return {
+                "jobs": [job.status() for job in self._jobs.values()],
+                "queued": self._queued,
+                "running": self._current.job_id if self._current is not None else None,
+            }
+
+    def cancel(self, job_id: str) -> Dict[str, Any]:
+        """Cancel a queued job at once, or a running one at its next step."""
+        with self._lock:
+            job = self._get(job_id)
+            if job.state == QUEUED:
+                # Its heap entry is skipped when reached.
+                self._queued -= 1
+                self._finish(job, CANCELLED)
+            elif job.state == RUNNING:
+                job.cancel_requested = True
+            return job.status()
+
+    def result(self, job_id: str) -> Dict[str, Any]:
+        """Return the job's status, with its result once it has succeeded."""
+        with self._lock:
+            job = self._get(job_id)
+            status = job.status()
+            if job.state == SUCCEEDED:
+                status["result"] = job.result
+            return status
+
+    def run(self, deadline: float) -> bool:
+        """
+        Advance jobs on the main thread until deadline (perf_counter time).
+
+        At least one step runs per call, so jobs progress under steady
+        interactive load. Returns True while jobs remain.
+        """
+        while True:
+            job = self._current or self._start_next()
+            if job is None:
+                return False
+            self._step(job)
+            if time.perf_counter() >= deadline:
+                with self._lock:
+                    return self._current is not None or self._queued > 0
+
+    def handlers(self) -> Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]:
+        """Return the JOB_TOOLS implementations keyed by tool name."""
+        return {
+            "blender.job_submit": lambda arguments: self.submit(
+                arguments["tool"], arguments.get("arguments", {}), arguments.get("priority", 0)
+            ),
+            "blender.job_status": lambda arguments: self.status(arguments.get("job_id")),
+            "blender.job_cancel": lambda arguments: self.cancel(arguments["job_id"]),
+            "blender.job_result": lambda arguments: self.result(arguments["job_id"]),
+        }
+
+    def _check_call(self, tool_name: str, arguments: Dict[str, Any]) -> None:
+        if self.tool_lister is None:
+            return
+        tools = self.tool_lister()
+        if not any(tool.get("name") == tool_name for tool in tools):
+            raise ValueError(f"unknown tool: {tool_name}")
+        error = self._validators.validate(tools, tool_name, arguments)
+        if error is not None:
+            raise ValueError(error)
+
+    def _get(self, job_id: str) -> Job:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"unknown job: {job_id}")
+        return job
+
+    def _start_next(self) -> Optional[Job]:
+        with self._lock:
+            while self._heap:
+                job = heapq.heappop(self._heap)[2]
+                if job.state != QUEUED:
+                    continue
+                self._queued -= 1
+                job.state = RUNNING
+                job.started = time.time()
+                self._current = job
+                return job
+            return None
+
+    def _step(self, job: Job) -> None:
+        if job.cancel_requested:
+            if job.steps is not None:
+                job.steps.close()
+            self._complete(job, CANCELLED)
+            return
+        try:
+            if job.steps is None:
+                started = self.tool_starter(job.tool_name, job.arguments)
+                if not isinstance(started, GeneratorType):
+                    self._complete(job, SUCCEEDED, result=started)
+                    return
+                job.steps = started
+            update = next(job.steps)
+        except StopIteration as stop:
+            self._complete(job, SUCCEEDED, result=stop.value)
+        except Exception as exc:  # noqa: BLE001
+            self._complete(job, FAILED, error=str(exc) or type(exc).__name__)
+        else:
+            self._report(job, update)
+
+    def _report(self, job: Job, update: Any) -> None:
+        """Record a step's yield: a fraction done, or a dict with progress and/or message."""
+        if isinstance(update, dict):
+            progress = update.get("progress")
+            if isinstance(update.get("message"), str):
+                job.message = update["message"]
+        else:
+            progress = update
+        if isinstance(progress, (int, float)) and not isinstance(progress, bool):
+            job.progress = min(1.0, max(0.0, float(progress)))
+
+    def _complete(self, job: Job, state: str, result: Any = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            job.steps = None
+            self._current = None
+            if job.cancel_requested:
+                state = CANCELLED
+            elif state == SUCCEEDED:
+                job.result = result
+                job.progress = 1.0
+            job.error = error if state == FAILED else None
+            self._finish(job, state)
+
+    def _finish(self, job: Job, state: str) -> None:
+        job.state = state
+        job.finished = time.time()
+        self._finished[job.job_id] = None
+        while len(self._finished) > self.max_finished:
+            expired, _ = self._finished.popitem(last=False)
+            del self._jobs[expired]
+
+
+_JOB_ID_SCHEMA = {"type": "string", "minLength": 1}
+
+JOB_TOOLS = [
+    {
+        "name": "blender.job_submit",
+        "description": "Queue a tool call (typically render, bake or export) as a background job and return "
+        "its job_id at once. Higher priority jobs start first. Poll blender.job_status and fetch the "
+        "outcome with blender.job_result.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "tool": {"type": "string", "minLength": 1},
+                "arguments": {"type": "object"},
+                "priority": {"type": "integer"},
+            },
+            "required": ["tool"],
+        },
+    },
+    {
+        "name": "blender.job_status",
+        "description": "Report a job's state and progress, or every known job when job_id is omitted.",
+        "input_schema": {"type": "object", "properties": {"job_id": _JOB_ID_SCHEMA}, "required": []},
+    },
+    {
+        "name": "blender.job_cancel",
+        "description": "Cancel a queued job, or stop a running one at its next step.",
+        "input_schema": {"type": "object", "properties": {"job_id": _JOB_ID_SCHEMA}, "required": ["job_id"]},
+    },
+    {
+        "name": "blender.job_result",
+        "description": "Return a job's status, including its result once it has succeeded.",
+        "input_schema": {"type": "object", "properties": {"job_id": _JOB_ID_SCHEMA}, "required": ["job_id"]},
+    },
+]
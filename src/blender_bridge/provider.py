@@ -10,11 +10,15 @@ def main() -> None:
         if src_dir and str(src_dir) not in sys.path:
             sys.path.insert(0, str(src_dir))
 
+        from mcp_core.metrics import with_metrics_tool
+        from mcp_core.tracing import TRACER
         from mcp_core.transport_stdio import run_stdio
         from blender_bridge.executor import execute_tool
         from blender_tools import list_tools
 
-        run_stdio(tool_executor=execute_tool, tool_lister=list_tools)
+        TRACER.service = "provider"
+        tool_executor, tool_lister = with_metrics_tool(execute_tool, list_tools)
+        run_stdio(tool_executor=tool_executor, tool_lister=tool_lister)
     except KeyboardInterrupt:
         return
     except Exception as exc:  # noqa: BLE001
@@ -1,31 +1,120 @@
 """Blender MCP HTTP provider entrypoint."""
 
+import os
 import sys
-import threading
 from pathlib import Path
 
 
+STATS_TOOL = {
+    "name": "blender.dispatch_stats",
+    "description": "Report main-thread queue-wait and execution timings.",
+    "input_schema": {
+        "type": "object",
+        "properties": {},
+        "required": [],
+    },
+}
+
+
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE_SIZE = 32
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def _pool_options() -> dict:
+    """
+    Worker pool of the provider's server: BLENDER_MCP_PROVIDER_WORKERS threads
+    run tools/call with at most BLENDER_MCP_PROVIDER_QUEUE more waiting; calls
+    beyond that are answered with SERVER_OVERLOADED. 0 workers lifts the bound.
+    """
+    workers = _env_number("BLENDER_MCP_PROVIDER_WORKERS", DEFAULT_WORKERS, int)
+    if workers <= 0:
+        return {"workers": None}
+    return {"workers": workers, "queue_size": _env_number("BLENDER_MCP_PROVIDER_QUEUE", DEFAULT_QUEUE_SIZE, int)}
+
+
+def _build_provider():
+    """Return the (tool_executor, tool_lister) pair shared by the provider transports."""
+    from blender_bridge.dispatcher import (
+        DEFAULT_BATCH_SIZE,
+        DEFAULT_TIME_BUDGET,
+        MainThreadDispatcher,
+    )
+    from blender_bridge.executor import execute_tool, start_tool
+    from blender_bridge.jobs import DEFAULT_MAX_QUEUED, JOB_TOOLS, JobManager
+    from blender_tools import list_tools, scene_index
+    from mcp_core.tracing import TRACER
+
+    TRACER.service = "provider"
+    jobs = JobManager(
+        start_tool,
+        tool_lister=list_tools,
+        max_queued=_env_number("BLENDER_MCP_JOB_QUEUE", DEFAULT_MAX_QUEUED, int),
+    )
+    job_handlers = jobs.handlers()
+    # bpy is only safe on the main thread: the server threads queue calls
+    # and a bpy.app.timers callback drains them, then advances jobs.
+    dispatcher = MainThreadDispatcher(
+        execute_tool,
+        batch_size=_env_number("BLENDER_MCP_DISPATCH_BATCH", DEFAULT_BATCH_SIZE, int),
+        time_budget=_env_number("BLENDER_MCP_DISPATCH_BUDGET_MS", DEFAULT_TIME_BUDGET * 1000.0, float) / 1000.0,
+        background=jobs.run,
+    )
+    dispatcher.register()
+    # Runs on the main thread at startup, so the first query does not pay for the build.
+    scene_index.install()
+
+    def provider_executor(tool_name: str, arguments: dict) -> dict:
+        if tool_name == STATS_TOOL["name"]:
+            return dispatcher.stats()
+        # Job calls only touch the job queue, so they answer without waiting for the main thread.
+        job_handler = job_handlers.get(tool_name)
+        if job_handler is not None:
+            return job_handler(arguments)
+        return dispatcher.submit(tool_name, arguments)
+
+    # One (source, listing) pair: the listing keeps its identity until the
+    # registry's list changes, so the server's cached validators stay valid.
+    listing: list = [(None, [])]
+
+    def provider_lister() -> list:
+        source = list_tools()
+        cached, tools = listing[0]
+        if cached is not source:
+            tools = source + [STATS_TOOL] + JOB_TOOLS
+            listing[0] = (source, tools)
+        return tools
+
+    return provider_executor, provider_lister
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765):
+    """Build the provider and serve it over HTTP; returns the server (None when it cannot listen)."""
+    from mcp_core.transport_http import run_http
+
+    provider_executor, provider_lister = _build_provider()
+    return run_http(
+        host=host,
+        port=port,
+        tool_executor=provider_executor,
+        tool_lister=provider_lister,
+        **_pool_options(),
+    )
+
+
 def main() -> None:
     try:
         src_dir = Path(__file__).resolve().parents[1]
         if src_dir and str(src_dir) not in sys.path:
             sys.path.insert(0, str(src_dir))
 
-        from mcp_core.transport_http import run_http
-        from blender_bridge.executor import execute_tool
-        from blender_tools import list_tools
-
-        thread = threading.Thread(
-            target=run_http,
-            kwargs={
-                "host": "127.0.0.1",
-                "port": 8765,
-                "tool_executor": execute_tool,
-                "tool_lister": list_tools,
-            },
-            daemon=True,
-        )
-        thread.start()
+        serve()
     except Exception as exc:  # noqa: BLE001
         try:
             sys.stderr.write(f"provider_http error: {exc}\n")
@@ -0,0 +1,45 @@
+"""Blender MCP Unix domain socket provider entrypoint.
+
+Serves the same tools as provider_http on a socket file instead of a TCP
+port; point the daemon at it with BLENDER_MCP_HTTP_URL=unix:///path/to.sock.
+The path comes from BLENDER_MCP_UDS_PATH, so several Blender instances on
+one host can each listen on their own socket.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+
+DEFAULT_SOCKET_NAME = "hephaestus.sock"
+
+
+def socket_path() -> str:
+    return os.getenv("BLENDER_MCP_UDS_PATH") or os.path.join(tempfile.gettempdir(), DEFAULT_SOCKET_NAME)
+
+
+def main() -> None:
+    try:
+        src_dir = Path(__file__).resolve().parents[1]
+        if src_dir and str(src_dir) not in sys.path:
+            sys.path.insert(0, str(src_dir))
+
+        from mcp_core.transport_uds import run_uds
+        from blender_bridge.provider_http import _build_provider, _pool_options
+
+        provider_executor, provider_lister = _build_provider()
+        server = run_uds(
+            socket_path(), tool_executor=provider_executor, tool_lister=provider_lister, **_pool_options()
+        )
+        if server is None:
+            sys.stderr.write(f"provider_uds error: cannot listen on {socket_path()}\n")
+    except Exception as exc:  # noqa: BLE001
+        try:
+            sys.stderr.write(f"provider_uds error: {exc}\n")
+        except Exception:
+            pass
+
+
+if __name__ == "__main__":
+    main()
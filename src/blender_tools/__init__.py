@@ -1,3 +1,4 @@
 """Tool metadata for Blender MCP provider."""
 
+from .registry import REGISTRY, ToolRegistry, tool  # noqa: F401
 from .tools import list_tools  # noqa: F401
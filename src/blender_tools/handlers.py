@@ -0,0 +1,52 @@
+"""Fan-out for bpy.app.handlers: one persistent Blender handler per event, many subscribers.
+
+Modules that keep derived scene state (the object index, the scene
+snapshot) subscribe here instead of appending their own handlers, so
+Blender calls into Python once per event however many consumers exist.
+"""
+
+from typing import Any, Callable, Dict, List
+
+
+Callback = Callable[..., None]
+
+_SUBSCRIBERS: Dict[str, List[Callback]] = {}
+_DISPATCHERS: Dict[str, Callback] = {}
+
+
+def subscribe(event: str, callback: Callback) -> None:
+    """Call callback with the handler arguments on every bpy.app.handlers.<event>."""
+    import bpy
+
+    callbacks = _SUBSCRIBERS.setdefault(event, [])
+    if callback not in callbacks:
+        callbacks.append(callback)
+    if event in _DISPATCHERS:
+        return
+
+    @bpy.app.handlers.persistent
+    def dispatch(*args: Any) -> None:
+        for subscriber in list(_SUBSCRIBERS.get(event, ())):
+            try:
+                subscriber(*args)
+            except Exception:  # noqa: BLE001
+                # A failing consumer must not break Blender's update loop.
+                pass
+
+    getattr(bpy.app.handlers, event).append(dispatch)
+    _DISPATCHERS[event] = dispatch
+
+
+def unsubscribe(event: str, callback: Callback) -> None:
+    """Stop calling callback; the Blender handler goes away with the last subscriber."""
+    import bpy
+
+    callbacks = _SUBSCRIBERS.get(event, [])
+    if callback in callbacks:
+        callbacks.remove(callback)
+    if callbacks or event not in _DISPATCHERS:
+        return
+    dispatch = _DISPATCHERS.pop(event)
+    handlers = getattr(bpy.app.handlers, event)
+    if dispatch in handlers:
+        handlers.remove(dispatch)
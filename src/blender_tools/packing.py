@@ -0,0 +1,102 @@
+"""Packed typed arrays: flat numeric buffers carried as base64 in JSON.
+
+A packed array is {"dtype": "float32", "shape": [n, 3], "data": "<base64>"}
+with little-endian element bytes in row-major order. Buffers are plain
+array.array objects, which foreach_get/foreach_set fill and read directly.
+"""
+
+import base64
+import sys
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+
+
+# dtype name -> array typecode; every typecode below has the same size on all
+# platforms Blender ships for.
+DTYPES = {
+    "float32": "f",
+    "float64": "d",
+    "int8": "b",
+    "uint8": "B",
+    "int16": "h",
+    "uint16": "H",
+    "int32": "i",
+    "uint32": "I",
+}
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def new_buffer(dtype: str, length: int) -> array:
+    """Return a zero-filled buffer of length elements of dtype."""
+    typecode = _typecode(dtype)
+    return array(typecode, bytes(length * array(typecode).itemsize))
+
+
+def pack_array(buffer: array, shape: Sequence[int]) -> Dict[str, Any]:
+    """Encode buffer as a packed array of the given shape."""
+    dtype = _dtype_name(buffer.typecode)
+    if _element_count(shape) != len(buffer):
+        raise ValueError(f"shape {list(shape)} does not match {len(buffer)} elements")
+    if not _LITTLE_ENDIAN:
+        buffer = array(buffer.typecode, buffer)
+        buffer.byteswap()
+    return {
+        "dtype": dtype,
+        "shape": list(shape),
+        "data": base64.b64encode(memoryview(buffer)).decode("ascii"),
+    }
+
+
+def unpack_array(packed: Any, dtype: str = "", width: int = 0) -> Tuple[array, List[int]]:
+    """
+    Decode a packed array into (buffer, shape).
+
+    dtype, when given, is the required element type; width, when given, is the
+    required size of the last dimension (3 for positions, 2 for UVs...).
+    Raises ValueError for malformed input.
+    """
+    if not isinstance(packed, dict):
+        raise ValueError("packed array must be an object")
+    name = packed.get("dtype")
+    if dtype and name != dtype:
+        raise ValueError(f"expected dtype {dtype}, got {name}")
+    typecode = _typecode(name)
+    shape = packed.get("shape")
+    if not isinstance(shape, list) or not shape or not all(isinstance(n, int) and n >= 0 for n in shape):
+        raise ValueError("shape must be a non-empty list of non-negative integers")
+    if width and (shape[-1] if len(shape) > 1 else 1) != width:
+        raise ValueError(f"last dimension must be {width}, got shape {shape}")
+    try:
+        raw = base64.b64decode(packed.get("data") or "", validate=True)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("data is not valid base64") from exc
+    buffer = array(typecode)
+    expected = _element_count(shape) * buffer.itemsize
+    if len(raw) != expected:
+        raise ValueError(f"data holds {len(raw)} bytes, shape {shape} of {name} needs {expected}")
+    buffer.frombytes(raw)
+    if not _LITTLE_ENDIAN:
+        buffer.byteswap()
+    return buffer, shape
+
+
+def _typecode(dtype: Any) -> str:
+    try:
+        return DTYPES[dtype]
+    except (KeyError, TypeError):
+        raise ValueError(f"unsupported dtype: {dtype!r}") from None
+
+
+def _dtype_name(typecode: str) -> str:
+    for name, code in DTYPES.items():
+        if code == typecode:
+            return name
+    raise ValueError(f"unsupported array typecode: {typecode!r}")
+
+
+def _element_count(shape: Sequence[int]) -> int:
+    count = 1
+    for size in shape:
+        count *= size
+    return count
@@ -0,0 +1,113 @@
+"""Decorator-based tool registry: one source for dispatch and tools/list."""
+
+from types import GeneratorType
+from typing import Any, Callable, Dict, Optional
+
+
+ToolFunction = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+EMPTY_SCHEMA = {
+    "type": "object",
+    "properties": {},
+    "required": [],
+}
+
+
+class ToolRegistry:
+    """
+    Map tool names to implementations and descriptors.
+
+    Dispatch is a single dict lookup. list_tools() returns a cached list that
+    is rebuilt only after the registry changes; version is bumped on every
+    change so callers can cache data derived from the descriptors.
+
+    A tool may be a generator function that yields progress between units of
+    work and returns its result; execute() runs it to completion, while
+    start() hands the generator to a caller that steps it (the job manager).
+    """
+
+    def __init__(self) -> None:
+        self._functions: Dict[str, ToolFunction] = {}
+        self._descriptors: Dict[str, Dict[str, Any]] = {}
+        self._listing: Optional[list] = None
+        self.version = 0
+
+    def tool(
+        self,
+        name: str,
+        description: str,
+        input_schema: Optional[Dict[str, Any]] = None,
+    ) -> Callable[[ToolFunction], ToolFunction]:
+        """Register the decorated function as the implementation of tool name."""
+
+        def decorator(fn: ToolFunction) -> ToolFunction:
+            self.register(name, fn, description, input_schema)
+            return fn
+
+        return decorator
+
+    def register(
+        self,
+        name: str,
+        fn: ToolFunction,
+        description: str,
+        input_schema: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if name in self._functions:
+            raise ValueError(f"tool already registered: {name}")
+        self._functions[name] = fn
+        self._descriptors[name] = {
+            "name": name,
+            "description": description,
+            "input_schema": input_schema if input_schema is not None else dict(EMPTY_SCHEMA),
+        }
+        self._changed()
+
+    def unregister(self, name: str) -> None:
+        self._functions.pop(name, None)
+        if self._descriptors.pop(name, None) is not None:
+            self._changed()
+
+    def execute(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a registered tool by name.
+
+        Raises:
+            KeyError: when tool_name is not registered.
+        """
+        return run_to_completion(self._functions[tool_name](arguments))
+
+    def start(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Call a registered tool; a stepwise tool's generator is returned unstarted."""
+        return self._functions[tool_name](arguments)
+
+    def list_tools(self) -> list:
+        listing = self._listing
+        if listing is None:
+            listing = self._listing = list(self._descriptors.values())
+        return listing
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._functions
+
+    def __len__(self) -> int:
+        return len(self._functions)
+
+    def _changed(self) -> None:
+        self._listing = None
+        self.version += 1
+
+
+def run_to_completion(result: Any) -> Any:
+    """Return result, first running it to its return value when it is a stepwise tool's generator."""
+    if not isinstance(result, GeneratorType):
+        return result
+    while True:
+        try:
+            next(result)
+        except StopIteration as stop:
+            return stop.value
+
+
+REGISTRY = ToolRegistry()
+tool = REGISTRY.tool
@@ -0,0 +1,352 @@
+"""Incremental index of scene objects by name, type, collection and tag.
+
+The index is built once from bpy.data.objects and then kept current from
+depsgraph_update_post (objects and collections that changed) and load_post
+(full rebuild), so queries never scan the scene. Names, overall and per
+type, collection and tag, are kept sorted for prefix search and cursor
+pagination.
+
+Every change bumps a version and is appended to a bounded change log, so a
+client holding a version token can ask for just what changed since then.
+"""
+
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import handlers
+
+
+# Custom property holding an object's tags: "a,b" or a list of strings.
+TAG_PROPERTY = "tags"
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Changes remembered for scene_diff; older tokens get a full snapshot.
+MAX_CHANGES = 10000
+
+
+class ObjectRecord(NamedTuple):
+    name: str
+    type: str
+    collections: Tuple[str, ...]
+    tags: Tuple[str, ...]
+    parent: Optional[str]
+    location: Tuple[float, ...]
+    rotation: Tuple[float, ...]
+    scale: Tuple[float, ...]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "collections": list(self.collections),
+            "tags": list(self.tags),
+            "parent": self.parent,
+            "location": list(self.location),
+            "rotation": list(self.rotation),
+            "scale": list(self.scale),
+        }
+
+
+def _tags_of(obj: Any) -> Tuple[str, ...]:
+    value = obj.get(TAG_PROPERTY)
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        items: Iterable[Any] = value.split(",")
+    else:
+        try:
+            items = list(value)
+        except TypeError:
+            return ()
+    return tuple(sorted({str(item).strip() for item in items if str(item).strip()}))
+
+
+def record_of(obj: Any) -> ObjectRecord:
+    return ObjectRecord(
+        obj.name,
+        obj.type,
+        tuple(collection.name for collection in obj.users_collection),
+        _tags_of(obj),
+        obj.parent.name if obj.parent is not None else None,
+        tuple(obj.location),
+        tuple(obj.rotation_euler),
+        tuple(obj.scale),
+    )
+
+
+class SceneIndex:
+    """
+    Objects by name with secondary indexes on type, collection and tag.
+
+    Meant to be used from Blender's main thread, where both the handlers and
+    the dispatched tools run. version is bumped on every change.
+    """
+
+    def __init__(self, max_changes: int = MAX_CHANGES) -> None:
+        self.built = False
+        self.version = 0
+        # Tokens from another provider process (or index) never match.
+        self.epoch = uuid.uuid4().hex[:12]
+        # (version, name, whether name existed just before that change)
+        self._changes: Deque[Tuple[int, str, bool]] = deque(maxlen=max_changes)
+        self._changes_since = 0
+        self._clear()
+
+    def _clear(self) -> None:
+        self._records: Dict[str, ObjectRecord] = {}
+        self._names: List[str] = []
+        self._uids: Dict[int, str] = {}
+        self._uid_of: Dict[str, int] = {}
+        # Sorted names per key.
+        self._by_type: Dict[str, List[str]] = {}
+        self._by_collection: Dict[str, List[str]] = {}
+        self._by_tag: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, name: str) -> Optional[ObjectRecord]:
+        return self._records.get(name)
+
+    def rebuild(self, objects: Iterable[Any]) -> None:
+        """Index every object from scratch."""
+        self._clear()
+        for obj in objects:
+            self._add(record_of(obj), obj.session_uid, ordered=False)
+        self._names.sort()
+        for index in (self._by_type, self._by_collection, self._by_tag):
+            for names in index.values():
+                names.sort()
+        self.built = True
+        self.version += 1
+        self._changes.clear()
+        self._changes_since = self.version
+
+    def update_object(self, obj: Any) -> None:
+        """Reindex one object; a rename is detected through its session_uid."""
+        uid = obj.session_uid
+        previous = self._uids.get(uid)
+        if previous is not None and previous != obj.name:
+            self.remove(previous)
+        record = record_of(obj)
+        if self._records.get(record.name) == record:
+            return
+        existed = record.name in self._records
+        if existed:
+            self._unlink(self._records[record.name])
+            self._link(record)
+            self._records[record.name] = record
+            self._uids[uid] = record.name
+            self._uid_of[record.name] = uid
+        else:
+            self._add(record, uid)
+            insort(self._names, record.name)
+        self._changed(record.name, existed)
+
+    def update_collection(self, collection: Any, objects: Any) -> None:
+        """Reindex the members of collection and the objects that just left it."""
+        members = {}
+        for obj in collection.objects:
+            members[obj.name] = obj
+            self.update_object(obj)
+        for name in [name for name in self._by_collection.get(collection.name, ()) if name not in members]:
+            obj = objects.get(name)
+            if obj is not None:
+                self.update_object(obj)
+
+    def remove(self, name: str) -> None:
+        record = self._records.pop(name, None)
+        if record is None:
+            return
+        self._unlink(record)
+        index = bisect_left(self._names, name)
+        if index < len(self._names) and self._names[index] == name:
+            del self._names[index]
+        uid = self._uid_of.pop(name, None)
+        if self._uids.get(uid) == name:
+            del self._uids[uid]
+        self._changed(name, True)
+
+    def reconcile(self, objects: Any) -> None:
+        """Pick up objects added or removed without an update for them (deletions never report one)."""
+        if len(objects) == len(self._records):
+            return
+        present = set(objects.keys())
+        for name in self._records.keys() - present:
+            self.remove(name)
+        for name in present - self._records.keys():
+            self.update_object(objects[name])
+
+    @property
+    def token(self) -> str:
+        """Opaque version token to pass back to diff()."""
+        return f"{self.epoch}:{self.version}"
+
+    def snapshot(self) -> List[ObjectRecord]:
+        return [self._records[name] for name in self._names]
+
+    def diff(self, token: Optional[str]) -> Optional[Dict[str, List[Any]]]:
+        """
+        Return the records added and changed and the names removed since token.
+
+        Returns None when token is missing, foreign or older than the change
+        log, in which case the caller should fall back to snapshot().
+        """
+        since = self._version_of(token)
+        if since is None:
+            return None
+        # Walking back from the newest change leaves each name's first change since then.
+        existed: Dict[str, bool] = {}
+        for version, name, existed_before in reversed(self._changes):
+            if version <= since:
+                break
+            existed[name] = existed_before
+        added, changed, removed = [], [], []
+        for name in sorted(existed):
+            record = self._records.get(name)
+            if record is None:
+                if existed[name]:
+                    removed.append(name)
+            elif existed[name]:
+                changed.append(record)
+            else:
+                added.append(record)
+        return {"added": added, "changed": changed, "removed": removed}
+
+    def _version_of(self, token: Optional[str]) -> Optional[int]:
+        epoch, _, version = (token or "").partition(":")
+        if epoch != self.epoch or not version.isdigit():
+            return None
+        since = int(version)
+        if since < self._changes_since or since > self.version:
+            return None
+        return since
+
+    def _changed(self, name: str, existed: bool) -> None:
+        self.version += 1
+        if len(self._changes) == self._changes.maxlen:
+            self._changes_since = self._changes[0][0]
+        self._changes.append((self.version, name, existed))
+
+    def find(
+        self,
+        type: Optional[str] = None,  # noqa: A002
+        collection: Optional[str] = None,
+        tag: Optional[str] = None,
+        prefix: str = "",
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Tuple[List[ObjectRecord], Optional[str]]:
+        """
+        Return up to limit matching records in name order, and the cursor of the next page.
+
+        cursor is the next_cursor of the previous page (None for the first).
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        filters: List[List[str]] = []
+        for value, index in ((type, self._by_type), (collection, self._by_collection), (tag, self._by_tag)):
+            if value is not None:
+                filters.append(index.get(value, []))
+
+        # Walk the smallest sorted name list from the cursor or prefix.
+        filters.sort(key=len)
+        candidates, others = (filters[0], filters[1:]) if filters else (self._names, [])
+        start = bisect_left(candidates, prefix)
+        if cursor is not None:
+            start = max(start, bisect_right(candidates, cursor))
+        page = []
+        for position in range(start, len(candidates)):
+            name = candidates[position]
+            if not name.startswith(prefix) or len(page) > limit:
+                break
+            if all(_contains(other, name) for other in others):
+                page.append(name)
+
+        next_cursor = page[limit - 1] if len(page) > limit else None
+        return [self._records[name] for name in page[:limit]], next_cursor
+
+    def _add(self, record: ObjectRecord, uid: int, ordered: bool = True) -> None:
+        """Index record; with ordered=False the name lists are left for the caller to sort."""
+        self._records[record.name] = record
+        self._uids[uid] = record.name
+        self._uid_of[record.name] = uid
+        self._names.append(record.name)
+        self._link(record, ordered)
+
+    def _link(self, record: ObjectRecord, ordered: bool = True) -> None:
+        insert = insort if ordered else list.append
+        insert(self._by_type.setdefault(record.type, []), record.name)
+        for collection in record.collections:
+            insert(self._by_collection.setdefault(collection, []), record.name)
+        for tag in record.tags:
+            insert(self._by_tag.setdefault(tag, []), record.name)
+
+    def _unlink(self, record: ObjectRecord) -> None:
+        for index, keys in (
+            (self._by_type, (record.type,)),
+            (self._by_collection, record.collections),
+            (self._by_tag, record.tags),
+        ):
+            for key in keys:
+                names = index.get(key)
+                if names is not None:
+                    position = bisect_left(names, record.name)
+                    if position < len(names) and names[position] == record.name:
+                        del names[position]
+                    if not names:
+                        del index[key]
+
+
+def _contains(names: List[str], name: str) -> bool:
+    position = bisect_left(names, name)
+    return position < len(names) and names[position] == name
+
+
+SCENE_INDEX = SceneIndex()
+
+
+def _on_depsgraph_update(scene: Any, depsgraph: Any) -> None:
+    import bpy
+
+    if not SCENE_INDEX.built:
+        return
+    for update in depsgraph.updates:
+        datablock = getattr(update.id, "original", update.id)
+        if isinstance(datablock, bpy.types.Object):
+            SCENE_INDEX.update_object(datablock)
+        elif isinstance(datablock, bpy.types.Collection):
+            # Linking or unlinking objects reports the collection, not the objects.
+            SCENE_INDEX.update_collection(datablock, bpy.data.objects)
+    SCENE_INDEX.reconcile(bpy.data.objects)
+
+
+def _on_load(*args: Any) -> None:
+    import bpy
+
+    SCENE_INDEX.rebuild(bpy.data.objects)
+
+
+def install() -> None:
+    """Build the index now and keep it current from Blender's handlers."""
+    import bpy
+
+    handlers.subscribe("depsgraph_update_post", _on_depsgraph_update)
+    handlers.subscribe("load_post", _on_load)
+    SCENE_INDEX.rebuild(bpy.data.objects)
+
+
+def ensure_index() -> SceneIndex:
+    """Return the index, installing it on first use."""
+    if not SCENE_INDEX.built:
+        install()
+    return SCENE_INDEX
+
+
+def uninstall() -> None:
+    handlers.unsubscribe("depsgraph_update_post", _on_depsgraph_update)
+    handlers.unsubscribe("load_post", _on_load)
+    SCENE_INDEX.built = False
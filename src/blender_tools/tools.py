@@ -1,27 +1,811 @@
-"""Static tool definitions for the Blender MCP provider."""
+"""Built-in tool definitions for the Blender MCP provider."""
 
-TOOLS = [
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import handlers
+from .packing import new_buffer, pack_array, unpack_array
+from .registry import REGISTRY, tool
+from .scene_index import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ensure_index
+
+
+class ViewLayerUpdates:
+    """
+    View layer updates requested by tools, run at once or held until a batch ends.
+
+    Inside deferred() every request is folded into a single update when the
+    outermost block exits, so a batch of edits pays for one depsgraph evaluation.
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._pending = False
+
+    def request(self, bpy: Any) -> None:
+        if self._depth:
+            self._pending = True
+        else:
+            bpy.context.view_layer.update()
+
+    @contextmanager
+    def deferred(self, bpy: Any) -> Iterator[None]:
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth and self._pending:
+                self._pending = False
+                bpy.context.view_layer.update()
+
+
+VIEW_LAYER_UPDATES = ViewLayerUpdates()
+
+
+@tool("blender.ping", "Respond with a pong message to verify connectivity.")
+def ping(arguments: dict) -> dict:
+    return {"message": "pong"}
+
+
+@tool("blender.add_cube", "Add a cube to the current Blender scene.")
+def add_cube(arguments: dict) -> dict:
+    import bpy
+
+    bpy.ops.mesh.primitive_cube_add()
+    return {"object": "Cube"}
+
+
+# Readable mesh attributes: name -> (domain, foreach property, dtype, values per element).
+# The domain names the mesh collection the attribute is read from.
+MESH_ATTRIBUTES = {
+    "positions": ("vertices", "co", "float32", 3),
+    "normals": ("vertices", "normal", "float32", 3),
+    "edges": ("edges", "vertices", "int32", 2),
+    "loop_vertices": ("loops", "vertex_index", "int32", 1),
+    "uvs": ("uvs", "uv", "float32", 2),
+    "polygon_starts": ("polygons", "loop_start", "int32", 1),
+    "polygon_sizes": ("polygons", "loop_total", "int32", 1),
+    "triangles": ("loop_triangles", "vertices", "int32", 3),
+}
+
+_OBJECT_NAME_SCHEMA = {"type": "string", "minLength": 1}
+
+
+def _mesh_object(name: str) -> Any:
+    import bpy
+
+    obj = bpy.data.objects.get(name)
+    if obj is None:
+        raise ValueError(f"object not found: {name}")
+    if obj.type != "MESH":
+        raise ValueError(f"object {name} is a {obj.type}, not a MESH")
+    return obj
+
+
+def _domain(mesh: Any, domain: str) -> Any:
+    """Return the bpy collection backing domain; UVs come from the active UV map."""
+    if domain == "uvs":
+        layer = mesh.uv_layers.active
+        if layer is None:
+            raise ValueError(f"mesh {mesh.name} has no UV map")
+        return layer.data
+    if domain == "loop_triangles" and mesh.polygons and not mesh.loop_triangles:
+        mesh.calc_loop_triangles()
+    return getattr(mesh, domain)
+
+
+# Whole-domain reads kept for paged get_mesh_data calls.
+MAX_CACHED_READS = 8
+
+
+class MeshReads:
+    """
+    Whole-domain attribute reads kept between pages of blender.get_mesh_data.
+
+    foreach_get has no offset, so every page would otherwise read the whole
+    domain again. Reads are keyed by (mesh name, attribute), least recently
+    used first out, and all dropped on depsgraph_update_post and load_post
+    and by tools that write mesh data, so pages never mix two versions of a
+    mesh.
+    """
+
+    def __init__(self, size: int = MAX_CACHED_READS) -> None:
+        self.size = size
+        self.installed = False
+        self._reads: "OrderedDict[Tuple[str, str], array]" = OrderedDict()
+
+    def read(self, mesh: Any, name: str, collection: Any, prop: str, dtype: str, width: int) -> array:
+        key = (mesh.name, name)
+        buffer = self._reads.get(key)
+        if buffer is not None and len(buffer) == len(collection) * width:
+            self._reads.move_to_end(key)
+            return buffer
+        buffer = _read_domain(collection, prop, dtype, width)
+        if not self.installed:
+            handlers.subscribe("depsgraph_update_post", self.clear)
+            handlers.subscribe("load_post", self.clear)
+            self.installed = True
+        self._reads[key] = buffer
+        while len(self._reads) > self.size:
+            self._reads.popitem(last=False)
+        return buffer
+
+    def clear(self, *args: Any) -> None:
+        self._reads.clear()
+
+    def uninstall(self) -> None:
+        handlers.unsubscribe("depsgraph_update_post", self.clear)
+        handlers.unsubscribe("load_post", self.clear)
+        self.installed = False
+        self.clear()
+
+
+MESH_READS = MeshReads()
+
+
+def _read_domain(collection: Any, prop: str, dtype: str, width: int) -> array:
+    buffer = new_buffer(dtype, len(collection) * width)
+    collection.foreach_get(prop, buffer)
+    return buffer
+
+
+def _read_attribute(mesh: Any, name: str, start: int, count: int) -> Dict[str, Any]:
+    domain, prop, dtype, width = MESH_ATTRIBUTES[name]
+    collection = _domain(mesh, domain)
+    total = len(collection)
+    # foreach_get has no offset, so the whole domain is read in one call and
+    # the requested rows are cut from the flat buffer; pages share that read.
+    if start or 0 <= count < total:
+        buffer = MESH_READS.read(mesh, name, collection, prop, dtype, width)
+    else:
+        buffer = _read_domain(collection, prop, dtype, width)
+    stop = total if count < 0 else min(total, start + count)
+    start = min(start, total)
+    if start or stop != total:
+        buffer = buffer[start * width : stop * width]
+    rows = stop - start
+    packed = pack_array(buffer, [rows, width] if width > 1 else [rows])
+    packed["start"] = start
+    packed["total"] = total
+    return packed
+
+
+@tool(
+    "blender.get_mesh_info",
+    "Report element counts, UV maps and readable attributes of a mesh object.",
+    {
+        "type": "object",
+        "properties": {"object": _OBJECT_NAME_SCHEMA},
+        "required": ["object"],
+    },
+)
+def get_mesh_info(arguments: dict) -> dict:
+    mesh = _mesh_object(arguments["object"]).data
+    return {
+        "object": arguments["object"],
+        "mesh": mesh.name,
+        "counts": {
+            "vertices": len(mesh.vertices),
+            "edges": len(mesh.edges),
+            "loops": len(mesh.loops),
+            "polygons": len(mesh.polygons),
+        },
+        "uv_maps": [layer.name for layer in mesh.uv_layers],
+        "active_uv_map": mesh.uv_layers.active.name if mesh.uv_layers.active is not None else None,
+        "attributes": {
+            name: {"domain": domain, "dtype": dtype, "width": width}
+            for name, (domain, _, dtype, width) in MESH_ATTRIBUTES.items()
+        },
+    }
+
+
+@tool(
+    "blender.get_mesh_data",
+    "Read mesh attributes as packed little-endian typed arrays (base64 with dtype and shape). "
+    "start/count select a row range of each attribute's own domain, so large meshes can be paged.",
+    {
+        "type": "object",
+        "properties": {
+            "object": _OBJECT_NAME_SCHEMA,
+            "attributes": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(MESH_ATTRIBUTES)},
+                "minItems": 1,
+            },
+            "start": {"type": "integer", "minimum": 0},
+            "count": {"type": "integer", "minimum": -1},
+        },
+        "required": ["object"],
+    },
+)
+def get_mesh_data(arguments: dict) -> dict:
+    mesh = _mesh_object(arguments["object"]).data
+    names: List[str] = arguments.get("attributes") or ["positions", "loop_vertices", "polygon_starts", "polygon_sizes"]
+    start = int(arguments.get("start", 0))
+    count = int(arguments.get("count", -1))
+    return {
+        "object": arguments["object"],
+        "mesh": mesh.name,
+        "attributes": {name: _read_attribute(mesh, name, start, count) for name in dict.fromkeys(names)},
+    }
+
+
+_PACKED_ARRAY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "dtype": {"type": "string"},
+        "shape": {"type": "array", "items": {"type": "integer", "minimum": 0}, "minItems": 1},
+        "data": {"type": "string"},
+    },
+    "required": ["dtype", "shape", "data"],
+}
+
+
+def _rows(buffer: array, width: int) -> int:
+    return len(buffer) // width
+
+
+def _check_indices(name: str, indices: array, limit: int) -> None:
+    if indices and (min(indices) < 0 or max(indices) >= limit):
+        raise ValueError(f"{name} must index 0..{limit - 1}")
+
+
+def _topology(arguments: Dict[str, Any], vertex_count: int) -> Optional[tuple]:
+    """Return (loop_vertices, polygon_starts, polygon_sizes), or None when no faces were given."""
+    if "triangles" in arguments:
+        loop_vertices, _ = unpack_array(arguments["triangles"], "int32", 3)
+        polygon_count = _rows(loop_vertices, 3)
+        starts = array("i", range(0, 3 * polygon_count, 3))
+        sizes = array("i", [3]) * polygon_count
+    elif "polygon_sizes" in arguments:
+        if "loop_vertices" not in arguments:
+            raise ValueError("polygon_sizes requires loop_vertices")
+        loop_vertices, _ = unpack_array(arguments["loop_vertices"], "int32", 1)
+        sizes, _ = unpack_array(arguments["polygon_sizes"], "int32", 1)
+        if sizes and min(sizes) < 3:
+            raise ValueError("polygons need at least 3 vertices")
+        if sum(sizes) != len(loop_vertices):
+            raise ValueError("polygon_sizes must add up to the number of loop_vertices")
+        starts = array("i", accumulate(sizes, initial=0))
+        starts.pop()
+    else:
+        return None
+    _check_indices("loop_vertices", loop_vertices, vertex_count)
+    return loop_vertices, starts, sizes
+
+
+def _mesh_target(bpy: Any, name: str, collection_name: Optional[str]) -> tuple:
+    """
+    Return (object, collection) for name: the existing mesh object and None,
+    or None and the collection a new mesh object would be linked to.
+    """
+    obj = bpy.data.objects.get(name)
+    if obj is not None:
+        if obj.type != "MESH":
+            raise ValueError(f"object {name} is a {obj.type}, not a MESH")
+        return obj, None
+    if collection_name:
+        collection = bpy.data.collections.get(collection_name)
+        if collection is None:
+            raise ValueError(f"collection not found: {collection_name}")
+        return None, collection
+    return None, bpy.context.scene.collection
+
+
+@tool(
+    "blender.set_mesh_data",
+    "Create or update a mesh object from packed typed arrays in one pass (no operators). "
+    "positions is float32 [n, 3]; faces come from triangles int32 [m, 3] or polygon_sizes plus "
+    "loop_vertices int32; uvs is float32 [loops, 2]. Without faces, existing topology is kept "
+    "and only positions/uvs are overwritten.",
+    {
+        "type": "object",
+        "properties": {
+            "object": _OBJECT_NAME_SCHEMA,
+            "collection": {"type": "string"},
+            "positions": _PACKED_ARRAY_SCHEMA,
+            "triangles": _PACKED_ARRAY_SCHEMA,
+            "polygon_sizes": _PACKED_ARRAY_SCHEMA,
+            "loop_vertices": _PACKED_ARRAY_SCHEMA,
+            "edges": _PACKED_ARRAY_SCHEMA,
+            "uvs": _PACKED_ARRAY_SCHEMA,
+            "uv_map": {"type": "string", "minLength": 1},
+            "validate": {"type": "boolean"},
+        },
+        "required": ["object"],
+    },
+)
+def set_mesh_data(arguments: dict) -> dict:
+    import bpy
+
+    # Decode and check every buffer before the scene is touched.
+    positions = unpack_array(arguments["positions"], "float32", 3)[0] if "positions" in arguments else None
+    obj, collection = _mesh_target(bpy, arguments["object"], arguments.get("collection"))
+    created = obj is None
+    if created and positions is None:
+        raise ValueError("positions are required to build new geometry")
+    vertex_count = _rows(positions, 3) if positions is not None else len(obj.data.vertices)
+    topology = _topology(arguments, vertex_count)
+    edges = unpack_array(arguments["edges"], "int32", 2)[0] if "edges" in arguments else None
+    if edges is not None:
+        _check_indices("edges", edges, vertex_count)
+    rebuild = created or topology is not None or edges is not None
+    if rebuild and positions is None:
+        raise ValueError("positions are required to build new geometry")
+    if not rebuild and positions is not None and vertex_count != len(obj.data.vertices):
+        raise ValueError(f"positions has {vertex_count} rows, mesh has {len(obj.data.vertices)} vertices")
+    uvs = unpack_array(arguments["uvs"], "float32", 2)[0] if "uvs" in arguments else None
+    if uvs is not None:
+        loop_count = (len(topology[0]) if topology is not None else 0) if rebuild else len(obj.data.loops)
+        if _rows(uvs, 2) != loop_count:
+            raise ValueError(f"uvs has {_rows(uvs, 2)} rows, mesh has {loop_count} loops")
+
+    if created:
+        obj = bpy.data.objects.new(arguments["object"], bpy.data.meshes.new(arguments["object"]))
+        collection.objects.link(obj)
+    mesh = obj.data
+    # Within a batch no depsgraph update runs before the next read.
+    MESH_READS.clear()
+
+    if rebuild:
+        mesh.clear_geometry()
+        mesh.vertices.add(vertex_count)
+        mesh.vertices.foreach_set("co", positions)
+        if edges is not None:
+            mesh.edges.add(_rows(edges, 2))
+            mesh.edges.foreach_set("vertices", edges)
+        if topology is not None:
+            loop_vertices, starts, sizes = topology
+            mesh.loops.add(len(loop_vertices))
+            mesh.loops.foreach_set("vertex_index", loop_vertices)
+            mesh.polygons.add(len(starts))
+            mesh.polygons.foreach_set("loop_start", starts)
+            try:
+                # Read-only since Blender 4.0, where sizes follow from loop_start.
+                mesh.polygons.foreach_set("loop_total", sizes)
+            except (AttributeError, TypeError, RuntimeError):
+                pass
+    elif positions is not None:
+        mesh.vertices.foreach_set("co", positions)
+
+    if uvs is not None:
+        uv_map = arguments.get("uv_map", "UVMap")
+        layer = mesh.uv_layers.get(uv_map) or mesh.uv_layers.new(name=uv_map)
+        layer.data.foreach_set("uv", uvs)
+
+    if arguments.get("validate"):
+        mesh.validate(clean_customdata=False)
+    mesh.update(calc_edges=rebuild and edges is None)
+    return {
+        "object": obj.name,
+        "mesh": mesh.name,
+        "created": created,
+        "rebuilt": rebuild,
+        "counts": {
+            "vertices": len(mesh.vertices),
+            "edges": len(mesh.edges),
+            "loops": len(mesh.loops),
+            "polygons": len(mesh.polygons),
+        },
+    }
+
+
+_VECTOR3_SCHEMA = {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3}
+
+# Unit primitives built with Mesh.from_pydata: (vertices, faces).
+PRIMITIVES = {
+    "cube": (
+        [(x, y, z) for x in (-1.0, 1.0) for y in (-1.0, 1.0) for z in (-1.0, 1.0)],
+        [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)],
+    ),
+    "plane": (
+        [(-1.0, -1.0, 0.0), (1.0, -1.0, 0.0), (1.0, 1.0, 0.0), (-1.0, 1.0, 0.0)],
+        [(0, 1, 2, 3)],
+    ),
+}
+
+
+def _object_data(bpy: Any, entry: Dict[str, Any], shared: Dict[str, Any], share: bool) -> Any:
+    """Resolve an entry's object data: a primitive mesh built once per call, an existing mesh, or None."""
+    if "mesh" in entry:
+        mesh = bpy.data.meshes.get(entry["mesh"])
+        if mesh is None:
+            raise ValueError(f"mesh not found: {entry['mesh']}")
+        return mesh
+    primitive = entry.get("primitive", "cube")
+    if primitive == "empty":
+        return None
+    mesh = shared.get(primitive)
+    if mesh is None:
+        vertices, faces = PRIMITIVES[primitive]
+        mesh = shared[primitive] = bpy.data.meshes.new(primitive.capitalize())
+        mesh.from_pydata(vertices, [], faces)
+        mesh.update()
+        return mesh
+    return mesh if share else mesh.copy()
+
+
+@tool(
+    "blender.create_objects",
+    "Create many objects in one call through bpy.data (no operators, one view layer update). "
+    "Each entry gives a primitive (cube, plane, empty) or an existing mesh name, an optional "
+    "name, location, rotation (XYZ Euler radians), scale and collection. Primitive meshes are "
+    "shared between the objects of a call unless share_data is false.",
+    {
+        "type": "object",
+        "properties": {
+            "objects": {
+                "type": "array",
+                "minItems": 1,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "minLength": 1},
+                        "primitive": {"type": "string", "enum": ["empty"] + list(PRIMITIVES)},
+                        "mesh": {"type": "string", "minLength": 1},
+                        "location": _VECTOR3_SCHEMA,
+                        "rotation": _VECTOR3_SCHEMA,
+                        "scale": _VECTOR3_SCHEMA,
+                        "collection": {"type": "string", "minLength": 1},
+                    },
+                },
+            },
+            "share_data": {"type": "boolean"},
+        },
+        "required": ["objects"],
+    },
+)
+def create_objects(arguments: dict) -> dict:
+    import bpy
+
+    entries = arguments["objects"]
+    share = arguments.get("share_data", True)
+    collections: Dict[Optional[str], Any] = {None: bpy.context.scene.collection}
+    for entry in entries:
+        name = entry.get("collection")
+        if name not in collections:
+            collection = bpy.data.collections.get(name)
+            if collection is None:
+                raise ValueError(f"collection not found: {name}")
+            collections[name] = collection
+
+    shared: Dict[str, Any] = {}
+    created = []
+    for entry in entries:
+        data = _object_data(bpy, entry, shared, share)
+        default_name = entry.get("mesh") or entry.get("primitive", "cube").capitalize()
+        obj = bpy.data.objects.new(entry.get("name", default_name), data)
+        if "location" in entry:
+            obj.location = entry["location"]
+        if "rotation" in entry:
+            obj.rotation_euler = entry["rotation"]
+        if "scale" in entry:
+            obj.scale = entry["scale"]
+        collections[entry.get("collection")].objects.link(obj)
+        created.append(obj.name)
+
+    # One depsgraph evaluation for the whole batch instead of one per object.
+    VIEW_LAYER_UPDATES.request(bpy)
+    return {"objects": created, "count": len(created)}
+
+
+class ObjectLookup:
+    """
+    Name -> object map reused across calls instead of searching bpy.data.objects per name.
+
+    Cached entries are checked on use (a removed object raises ReferenceError,
+    a renamed one reports another name); any miss rebuilds the whole map once.
+    """
+
+    def __init__(self) -> None:
+        self._objects: Dict[str, Any] = {}
+
+    def resolve(self, bpy: Any, names: List[str]) -> List[Any]:
+        objects = self._objects
+        resolved = []
+        rebuilt = False
+        for name in names:
+            obj = objects.get(name)
+            if obj is not None and not _still_named(obj, name):
+                obj = None
+            if obj is None and not rebuilt:
+                objects = self._objects = {candidate.name: candidate for candidate in bpy.data.objects}
+                rebuilt = True
+                obj = objects.get(name)
+            if obj is None:
+                raise ValueError(f"object not found: {name}")
+            resolved.append(obj)
+        return resolved
+
+
+def _still_named(obj: Any, name: str) -> bool:
+    try:
+        return obj.name == name
+    except ReferenceError:
+        return False
+
+
+OBJECT_LOOKUP = ObjectLookup()
+
+
+_ROTATION_MODES = {"rotation_euler": "XYZ", "rotation_quaternion": "QUATERNION"}
+
+
+def _transform_rows(arguments: Dict[str, Any], key: str, row_shape: List[int], count: int) -> Optional[Any]:
+    """Iterate the rows of packed array key as flat tuples, or return None when it was not given."""
+    if key not in arguments:
+        return None
+    buffer, shape = unpack_array(arguments[key], "float32")
+    if shape != [count] + row_shape:
+        raise ValueError(f"{key} must have shape {[count] + row_shape}, got {shape}")
+    values = iter(buffer)
+    # zip over one shared iterator slices the flat buffer into rows at C speed.
+    return zip(*[values] * (len(buffer) // count if count else 1))
+
+
+@tool(
+    "blender.set_transforms",
+    "Set transforms of many objects in one pass and update the depsgraph once. objects lists "
+    "names; locations, rotations (XYZ Euler radians) and scales are float32 [n, 3], quaternions "
+    "float32 [n, 4] (WXYZ) and matrices float32 [n, 4, 4] row-major, applied to matrix_world or, "
+    "with space basis, matrix_basis. Row i applies to objects[i]. rotations and quaternions are "
+    "exclusive and switch rotation_mode to XYZ or QUATERNION.",
+    {
+        "type": "object",
+        "properties": {
+            "objects": {"type": "array", "items": _OBJECT_NAME_SCHEMA, "minItems": 1},
+            "locations": _PACKED_ARRAY_SCHEMA,
+            "rotations": _PACKED_ARRAY_SCHEMA,
+            "quaternions": _PACKED_ARRAY_SCHEMA,
+            "scales": _PACKED_ARRAY_SCHEMA,
+            "matrices": _PACKED_ARRAY_SCHEMA,
+            "space": {"type": "string", "enum": ["world", "basis"]},
+        },
+        "required": ["objects"],
+    },
+)
+def set_transforms(arguments: dict) -> dict:
+    import bpy
+
+    if "rotations" in arguments and "quaternions" in arguments:
+        raise ValueError("rotations and quaternions are mutually exclusive")
+    objects = OBJECT_LOOKUP.resolve(bpy, arguments["objects"])
+    count = len(objects)
+    # Decode and check every buffer before the first object is touched.
+    columns = [
+        ("location", _transform_rows(arguments, "locations", [3], count)),
+        ("rotation_euler", _transform_rows(arguments, "rotations", [3], count)),
+        ("rotation_quaternion", _transform_rows(arguments, "quaternions", [4], count)),
+        ("scale", _transform_rows(arguments, "scales", [3], count)),
+    ]
+    matrices = _transform_rows(arguments, "matrices", [4, 4], count)
+
+    for attribute, rows in columns:
+        if rows is not None:
+            # Blender ignores the rotation channel that does not match rotation_mode.
+            mode = _ROTATION_MODES.get(attribute)
+            for obj, row in zip(objects, rows):
+                if mode is not None:
+                    obj.rotation_mode = mode
+                setattr(obj, attribute, row)
+    if matrices is not None:
+        from mathutils import Matrix
+
+        attribute = "matrix_basis" if arguments.get("space") == "basis" else "matrix_world"
+        for obj, row in zip(objects, matrices):
+            setattr(obj, attribute, Matrix((row[0:4], row[4:8], row[8:12], row[12:16])))
+
+    VIEW_LAYER_UPDATES.request(bpy)
+    return {"count": count}
+
+
+_PAGE_PROPERTIES = {
+    "limit": {"type": "integer", "minimum": 1, "maximum": MAX_PAGE_SIZE},
+    "cursor": {"type": "string"},
+}
+
+
+def _object_page(arguments: Dict[str, Any], **filters: Any) -> Dict[str, Any]:
+    index = ensure_index()
+    records, next_cursor = index.find(
+        cursor=arguments.get("cursor"), limit=arguments.get("limit", DEFAULT_PAGE_SIZE), **filters
+    )
+    return {
+        "objects": [record.as_dict() for record in records],
+        "next_cursor": next_cursor,
+        "total": len(index),
+    }
+
+
+@tool(
+    "blender.list_objects",
+    "List scene objects in name order from the provider's object index. Pass next_cursor back "
+    "as cursor to fetch the following page.",
+    {"type": "object", "properties": dict(_PAGE_PROPERTIES)},
+)
+def list_objects(arguments: dict) -> dict:
+    return _object_page(arguments)
+
+
+@tool(
+    "blender.find_objects",
+    "Find objects by type (MESH, LIGHT...), collection, tag (custom property 'tags') and name "
+    "prefix using the provider's object index, with cursor pagination like blender.list_objects.",
     {
-        "name": "blender.ping",
-        "description": "Respond with a pong message to verify connectivity.",
-        "input_schema": {
-            "type": "object",
-            "properties": {},
-            "required": [],
+        "type": "object",
+        "properties": dict(
+            _PAGE_PROPERTIES,
+            type={"type": "string", "minLength": 1},
+            collection={"type": "string", "minLength": 1},
+            tag={"type": "string", "minLength": 1},
+            name_prefix={"type": "string"},
+        ),
+    },
+)
+def find_objects(arguments: dict) -> dict:
+    return _object_page(
+        arguments,
+        type=arguments.get("type"),
+        collection=arguments.get("collection"),
+        tag=arguments.get("tag"),
+        prefix=arguments.get("name_prefix", ""),
+    )
+
+
+@tool(
+    "blender.scene_diff",
+    "Return the objects added, changed and removed since a version token from an earlier call, "
+    "or a full snapshot when since is omitted, from another session or too old. Pass the returned "
+    "version as since on the next call.",
+    {"type": "object", "properties": {"since": {"type": "string"}}},
+)
+def scene_diff(arguments: dict) -> dict:
+    index = ensure_index()
+    delta = index.diff(arguments.get("since"))
+    if delta is None:
+        return {
+            "version": index.token,
+            "full": True,
+            "objects": [record.as_dict() for record in index.snapshot()],
+        }
+    return {
+        "version": index.token,
+        "full": False,
+        "added": [record.as_dict() for record in delta["added"]],
+        "changed": [record.as_dict() for record in delta["changed"]],
+        "removed": delta["removed"],
+    }
+
+
+@tool(
+    "blender.render_frames",
+    "Render a frame range of the active scene to files (filepath may use # for the frame number). "
+    "Renders one frame per step: submit it with blender.job_submit to keep the provider responsive "
+    "and to follow per-frame progress.",
+    {
+        "type": "object",
+        "properties": {
+            "frame_start": {"type": "integer"},
+            "frame_end": {"type": "integer"},
+            "filepath": {"type": "string", "minLength": 1},
         },
     },
+)
+def render_frames(arguments: dict) -> Iterator[Dict[str, Any]]:
+    import bpy
+
+    scene = bpy.context.scene
+    start = arguments.get("frame_start", scene.frame_start)
+    end = arguments.get("frame_end", scene.frame_end)
+    if end < start:
+        raise ValueError(f"frame_end {end} is before frame_start {start}")
+    original_frame = scene.frame_current
+    original_path = scene.render.filepath
+    if "filepath" in arguments:
+        scene.render.filepath = arguments["filepath"]
+    written = []
+    try:
+        for frame in range(start, end + 1):
+            scene.frame_set(frame)
+            bpy.ops.render.render(write_still=True)
+            written.append(scene.render.frame_path(frame=frame))
+            yield {"progress": len(written) / (end - start + 1), "message": f"rendered frame {frame}"}
+    finally:
+        # Also runs when a job is cancelled between frames.
+        scene.render.filepath = original_path
+        scene.frame_set(original_frame)
+    return {"files": written}
+
+
+# Compiled step validators (mcp_core.schema.ValidatorCache), created on the first batch.
+_STEP_VALIDATORS: Any = None
+
+
+def _step_error(name: str, arguments: Dict[str, Any]) -> Optional[str]:
+    """Why a step would be rejected before running, or None."""
+    global _STEP_VALIDATORS
+    if name not in REGISTRY:
+        return f"unknown tool: {name}"
+    if _STEP_VALIDATORS is None:
+        from mcp_core.schema import ValidatorCache
+
+        _STEP_VALIDATORS = ValidatorCache()
+    # The registry's listing is the same list until a tool changes, so validators stay compiled.
+    return _STEP_VALIDATORS.validate(REGISTRY.list_tools(), name, arguments)
+
+
+def _run_step(name: str, arguments: Dict[str, Any], error: Optional[str] = None) -> Dict[str, Any]:
+    if error is not None:
+        return {"tool": name, "ok": False, "error": error}
+    try:
+        data = REGISTRY.execute(name, arguments)
+    except Exception as exc:  # noqa: BLE001
+        return {"tool": name, "ok": False, "error": str(exc) or type(exc).__name__}
+    return {"tool": name, "ok": True, "data": data}
+
+
+@tool(
+    "blender.batch",
+    "Run an ordered list of tool calls as one undo step, with view layer updates deferred to the "
+    "end. Each step reports its own result or error; on_error 'stop' (default) ends the batch at "
+    "the first failure, 'continue' runs the remaining steps. Step arguments are checked against "
+    "their tool's schema before any step runs; with 'stop' an invalid step rejects the whole batch.",
     {
-        "name": "blender.add_cube",
-        "description": "Add a cube to the current Blender scene.",
-        "input_schema": {
-            "type": "object",
-            "properties": {},
-            "required": [],
+        "type": "object",
+        "properties": {
+            "steps": {
+                "type": "array",
+                "minItems": 1,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tool": {"type": "string", "minLength": 1},
+                        "arguments": {"type": "object"},
+                    },
+                    "required": ["tool"],
+                },
+            },
+            "on_error": {"type": "string", "enum": ["stop", "continue"]},
+            "undo_message": {"type": "string", "minLength": 1},
         },
+        "required": ["steps"],
     },
-]
+)
+def batch(arguments: dict) -> dict:
+    import bpy
+
+    steps = arguments["steps"]
+    if any(step["tool"] == "blender.batch" for step in steps):
+        raise ValueError("blender.batch cannot be nested")
+    stop_on_error = arguments.get("on_error", "stop") == "stop"
+    errors = [_step_error(step["tool"], step.get("arguments", {})) for step in steps]
+    if stop_on_error and any(errors):
+        invalid = "; ".join(f"step {index}: {error}" for index, error in enumerate(errors) if error)
+        raise ValueError(f"invalid batch: {invalid}")
+
+    results = []
+    with VIEW_LAYER_UPDATES.deferred(bpy):
+        for step, error in zip(steps, errors):
+            result = _run_step(step["tool"], step.get("arguments", {}), error)
+            results.append(result)
+            if stop_on_error and not result["ok"]:
+                break
+
+    succeeded = sum(1 for result in results if result["ok"])
+    if succeeded:
+        # Scripted operators and bpy.data edits push no undo steps of their own.
+        bpy.ops.ed.undo_push(message=arguments.get("undo_message", "MCP batch"))
+    return {
+        "results": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "skipped": len(steps) - len(results),
+    }
 
 
 def list_tools() -> list:
     """Return supported tool descriptors."""
-    return TOOLS
+    return REGISTRY.list_tools()
@@ -0,0 +1,179 @@
+"""Per-request deadlines and cancellation shared by transports and executors.
+
+handle_request opens a RequestContext around every tools/call and exposes it
+through current_request(), so executors can honour the deadline and react to
+notifications/cancelled without any change to their call signature. A batch
+executor sees the contexts of its members through current_batch().
+"""
+
+import contextvars
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class RequestCancelled(RuntimeError):
+    """The client cancelled the request with notifications/cancelled."""
+
+
+class RequestTimeout(RuntimeError):
+    """The request's deadline passed before a result was available."""
+
+
+class RequestContext:
+    """
+    Deadline and cancellation state of one in-flight request.
+
+    meta holds the request's params._meta object (empty when absent), so
+    executors can read client-supplied hints such as a session key. span is
+    the request's tracing span (mcp_core.tracing), None when not traced.
+    """
+
+    def __init__(
+        self, request_id: Any, timeout: Optional[float] = None, meta: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.request_id = request_id
+        self.meta: Dict[str, Any] = meta if meta is not None else {}
+        self.span: Any = None
+        self.deadline = None if timeout is None else time.monotonic() + max(0.0, timeout)
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None when there is none."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:  # noqa: BLE001
+                pass
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run callback on cancellation (now, if already cancelled); returns a remover."""
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def interruption(self) -> RuntimeError:
+        """The error to report for work abandoned because of this context."""
+        if self._cancelled:
+            return RequestCancelled("request cancelled")
+        return RequestTimeout("request timed out")
+
+    def check(self) -> None:
+        """Raise when the request was cancelled or its deadline has passed."""
+        if self._cancelled or self.expired:
+            raise self.interruption()
+
+    def wait(self, event: threading.Event) -> None:
+        """
+        Block until event is set, the request is cancelled or the deadline passes.
+
+        Cancellation wakes the waiter by setting event, so callers must check
+        their own completion state rather than event.is_set().
+        """
+        remove = self.on_cancel(event.set)
+        try:
+            event.wait(self.remaining())
+        finally:
+            remove()
+
+    def _remove(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+
+
+class InFlightRequests:
+    """Contexts of the requests currently being executed, by request id."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._contexts: Dict[Any, RequestContext] = {}
+
+    def begin(
+        self, request_id: Any, timeout: Optional[float] = None, meta: Optional[Dict[str, Any]] = None
+    ) -> RequestContext:
+        context = RequestContext(request_id, timeout, meta)
+        if request_id is not None:
+            with self._lock:
+                self._contexts[request_id] = context
+        return context
+
+    def finish(self, context: RequestContext) -> None:
+        with self._lock:
+            if self._contexts.get(context.request_id) is context:
+                del self._contexts[context.request_id]
+
+    def cancel(self, request_id: Any) -> bool:
+        with self._lock:
+            context = self._contexts.get(request_id)
+        if context is None:
+            return False
+        context.cancel()
+        return True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._contexts)
+
+
+IN_FLIGHT = InFlightRequests()
+
+_CURRENT: contextvars.ContextVar[Optional[RequestContext]] = contextvars.ContextVar(
+    "mcp_current_request", default=None
+)
+
+
+_BATCH: contextvars.ContextVar[Optional[List[RequestContext]]] = contextvars.ContextVar(
+    "mcp_current_batch", default=None
+)
+
+
+def current_request() -> Optional[RequestContext]:
+    """Return the context of the tools/call being executed on this thread or task."""
+    return _CURRENT.get()
+
+
+def activate(context: Optional[RequestContext]) -> contextvars.Token:
+    return _CURRENT.set(context)
+
+
+def deactivate(token: contextvars.Token) -> None:
+    _CURRENT.reset(token)
+
+
+def current_batch() -> Optional[List[RequestContext]]:
+    """Return the contexts of the tools/call members a batch executor is running, in call order."""
+    return _BATCH.get()
+
+
+def activate_batch(contexts: Optional[List[RequestContext]]) -> contextvars.Token:
+    return _BATCH.set(contexts)
+
+
+def deactivate_batch(token: contextvars.Token) -> None:
+    _BATCH.reset(token)
@@ -0,0 +1,106 @@
+"""JSON codec shared by all transports, working on UTF-8 bytes.
+
+orjson is used when it is installed; otherwise the stdlib json module.
+BLENDER_MCP_JSON=json (or =orjson) forces a backend.
+
+Both backends read what the stdlib reads, including the non-standard
+NaN, Infinity and -Infinity tokens. Their output differs: orjson writes
+compact separators and raw UTF-8 instead of ", "/": " and \\u escapes,
+which any JSON parser reads the same, and writes non-finite floats as
+null where the stdlib writes NaN/Infinity.
+
+Newline-delimited stdio keeps the stdlib's exact output (line_dumps)
+unless BLENDER_MCP_JSON names a backend explicitly.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, NamedTuple, Union
+
+
+Buffer = Union[bytes, bytearray, memoryview, str]
+
+
+class Codec(NamedTuple):
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Buffer], Any]
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: Buffer) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _load_orjson() -> Codec:
+    import orjson
+
+    orjson_dumps = orjson.dumps
+    orjson_loads = orjson.loads
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return orjson_dumps(obj)
+        except TypeError:
+            # Non-string keys, big ints and other inputs orjson refuses.
+            return _json_dumps(obj)
+
+    def loads(data: Buffer) -> Any:
+        try:
+            return orjson_loads(data)
+        except orjson.JSONDecodeError:
+            # Accept what the stdlib accepts (NaN, Infinity); still ValueError for invalid JSON.
+            return _json_loads(data)
+
+    return Codec("orjson", dumps, loads)
+
+
+STDLIB = Codec("json", _json_dumps, _json_loads)
+
+_BACKENDS: Dict[str, Callable[[], Codec]] = {
+    "orjson": _load_orjson,
+    "json": lambda: STDLIB,
+}
+
+
+def get_codec(name: str) -> Codec:
+    """Return the named backend; raises ImportError when it is not installed."""
+    try:
+        return _BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"unknown json backend: {name}") from None
+
+
+def available_codecs() -> Dict[str, Codec]:
+    codecs = {}
+    for name in _BACKENDS:
+        try:
+            codecs[name] = get_codec(name)
+        except ImportError:
+            continue
+    return codecs
+
+
+def _select() -> Codec:
+    requested = os.getenv("BLENDER_MCP_JSON")
+    for name in ([requested] if requested else []) + ["orjson", "json"]:
+        try:
+            return get_codec(name)
+        except (ImportError, ValueError):
+            continue
+    return STDLIB
+
+
+CODEC = _select()
+BACKEND = CODEC.name
+dumps = CODEC.dumps
+loads = CODEC.loads
+
+# Newline-mode stdio stays byte-identical to json.dumps unless a backend was asked for.
+LINE_CODEC = CODEC if os.getenv("BLENDER_MCP_JSON") else STDLIB
+line_dumps = LINE_CODEC.dumps
@@ -0,0 +1,121 @@
+"""Length-prefixed message framing for stream sockets.
+
+Every frame is a 4-byte big-endian payload length followed by the payload.
+A zero-length frame is a valid, empty message (used for "no response").
+"""
+
+import socket
+import struct
+from typing import BinaryIO, Iterator, Optional
+
+
+HEADER = struct.Struct("!I")
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+READ_CHUNK_SIZE = 256 * 1024
+
+
+class FrameError(ValueError):
+    """The peer sent a frame that cannot be decoded."""
+
+
+def encode_frame(data: bytes) -> bytes:
+    if len(data) > MAX_FRAME_SIZE:
+        raise FrameError(f"frame of {len(data)} bytes exceeds {MAX_FRAME_SIZE}")
+    return HEADER.pack(len(data)) + data
+
+
+def send_frame(sock: socket.socket, data: bytes) -> None:
+    # Header and payload go out in one write so no small segment waits on an ACK.
+    sock.sendall(encode_frame(data))
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> Optional[bytearray]:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            if received == 0:
+                return None
+            raise ConnectionResetError("connection closed mid-frame")
+        received += count
+    return buffer
+
+
+def recv_frame(sock: socket.socket, max_size: int = MAX_FRAME_SIZE) -> Optional[bytes]:
+    """
+    Read one frame; return None when the peer closed the connection between frames.
+
+    The payload is returned as a bytearray to avoid copying large messages.
+    """
+    header = _recv_exactly(sock, HEADER.size)
+    if header is None:
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > max_size:
+        raise FrameError(f"frame of {length} bytes exceeds {max_size}")
+    if length == 0:
+        return b""
+    payload = _recv_exactly(sock, length)
+    if payload is None:
+        raise ConnectionResetError("connection closed mid-frame")
+    return payload
+
+
+class FrameReader:
+    """
+    Split frames out of a binary stream that is read in large chunks.
+
+    One read usually yields many small frames, which are then sliced out of
+    the buffer without any per-message system call. pending() tells whether
+    the next frame is already buffered, so writers can hold back a flush
+    while more requests are ready to process. An oversized length raises
+    FrameError; the stream cannot be resynchronised after that.
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = READ_CHUNK_SIZE, max_size: int = MAX_FRAME_SIZE) -> None:
+        self._read = getattr(stream, "read1", stream.read)
+        self.chunk_size = chunk_size
+        self.max_size = max_size
+        self._buffer = bytearray()
+        self._offset = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        while True:
+            frame = self._take()
+            if frame is not None:
+                return frame
+            chunk = self._read(self.chunk_size)
+            if not chunk:
+                # A truncated trailing frame is dropped with the stream.
+                raise StopIteration
+            if self._offset:
+                del self._buffer[: self._offset]
+                self._offset = 0
+            self._buffer += chunk
+
+    def pending(self) -> bool:
+        """Return True when a complete frame is buffered and next() will not block."""
+        available = len(self._buffer) - self._offset
+        if available < HEADER.size:
+            return False
+        (length,) = HEADER.unpack_from(self._buffer, self._offset)
+        return available - HEADER.size >= length
+
+    def _take(self) -> Optional[bytes]:
+        start = self._offset + HEADER.size
+        if start > len(self._buffer):
+            return None
+        (length,) = HEADER.unpack_from(self._buffer, self._offset)
+        if length > self.max_size:
+            raise FrameError(f"frame of {length} bytes exceeds {self.max_size}")
+        end = start + length
+        if end > len(self._buffer):
+            return None
+        self._offset = end
+        with memoryview(self._buffer) as view:
+            return bytes(view[start:end])
@@ -0,0 +1,218 @@
+"""In-process request metrics: call and error counts with latency histograms.
+
+Series are keyed by (scope, name), e.g. ("method", "tools/call"),
+("tool", "blender.ping") or ("proxy", "blender.ping"). Recording is a dict
+lookup and a few integer updates under one lock; BLENDER_MCP_METRICS=0
+turns it into a single attribute check.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cancellation import activate_batch, current_batch, deactivate_batch
+
+
+# 2**SUB_BUCKET_BITS linear sub-buckets per power of two bound the relative
+# error of a reported percentile to 1/16 (HDR histogram layout).
+SUB_BUCKET_BITS = 4
+_EXACT_LIMIT = 1 << (SUB_BUCKET_BITS + 1)
+
+# Past this many series, new names are folded into "other" so client-chosen
+# names (unknown tools, bogus methods) cannot grow memory without bound.
+MAX_SERIES = 512
+
+PERCENTILES = ((50.0, "p50_ms"), (90.0, "p90_ms"), (99.0, "p99_ms"), (99.9, "p999_ms"))
+
+
+def _bucket(micros: int) -> int:
+    if micros < _EXACT_LIMIT:
+        return micros
+    shift = micros.bit_length() - (SUB_BUCKET_BITS + 1)
+    return (shift << SUB_BUCKET_BITS) + (micros >> shift)
+
+
+def _bucket_midpoint(index: int) -> float:
+    if index < _EXACT_LIMIT:
+        return float(index)
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    mantissa = index - (shift << SUB_BUCKET_BITS)
+    return ((mantissa << shift) + ((mantissa + 1) << shift) - 1) / 2.0
+
+
+class Histogram:
+    """Log-linear latency histogram with microsecond resolution."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = []
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        index = _bucket(max(0, int(seconds * 1_000_000)))
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        if not self.count or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, percent: float) -> float:
+        """Return the latency in seconds below which percent of the samples fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(self.count * percent / 100.0 + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                value = _bucket_midpoint(index) / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, float]:
+        snapshot = {
+            "count": self.count,
+            "mean_ms": self.total * 1000.0 / self.count if self.count else 0.0,
+            "min_ms": self.min * 1000.0,
+            "max_ms": self.max * 1000.0,
+        }
+        for percent, key in PERCENTILES:
+            snapshot[key] = self.percentile(percent) * 1000.0
+        return snapshot
+
+
+class _Series:
+    __slots__ = ("latency", "errors")
+
+    def __init__(self) -> None:
+        self.latency = Histogram()
+        self.errors: Dict[Any, int] = {}
+
+
+class Metrics:
+    """Registry of (scope, name) series; safe to record into from any thread."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+
+    def observe(self, scope: str, name: str, seconds: float, error: Any = None) -> None:
+        """Record one call of name taking seconds; error is its error code, if it failed."""
+        if not self.enabled:
+            return
+        key = (scope, name)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                if len(self._series) >= MAX_SERIES:
+                    key = (scope, "other")
+                series = self._series.setdefault(key, _Series())
+            series.latency.record(seconds)
+            if error is not None:
+                series.errors[error] = series.errors.get(error, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return {"uptime_s": ..., scope: {name: {count, errors, errors_by_code, latencies}}}."""
+        snapshot: Dict[str, Any] = {"uptime_s": time.time() - self.started}
+        with self._lock:
+            for (scope, name), series in sorted(self._series.items()):
+                entry = series.latency.snapshot()
+                entry["errors"] = sum(series.errors.values())
+                entry["errors_by_code"] = {str(code): count for code, count in series.errors.items()}
+                snapshot.setdefault(scope, {})[name] = entry
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self.started = time.time()
+
+
+METRICS = Metrics(enabled=os.getenv("BLENDER_MCP_METRICS", "1") != "0")
+
+
+METRICS_TOOL = {
+    "name": "hephaestus.metrics",
+    "description": "Report call counts, error counts by code and p50/p90/p99 latencies per method, tool and "
+    "proxy hop of this process.",
+    "input_schema": {"type": "object", "properties": {}, "required": []},
+}
+
+
+def with_metrics_tool(
+    tool_executor: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+    tool_lister: Callable[[], list],
+) -> Tuple[Callable[[str, Dict[str, Any]], Dict[str, Any]], Callable[[], list]]:
+    """
+    Return (tool_executor, tool_lister) that also serve hephaestus.metrics locally.
+
+    The lister returns the same list object until tool_lister's list
+    changes, so cached argument validators stay valid.
+    """
+    # One (source, listing) pair, replaced in a single assignment.
+    cache: List[Tuple[Optional[list], list]] = [(None, [])]
+
+    def executor(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if tool_name == METRICS_TOOL["name"]:
+            return METRICS.snapshot()
+        return tool_executor(tool_name, arguments)
+
+    def lister() -> list:
+        source = tool_lister()
+        cached, listing = cache[0]
+        if cached is not source:
+            listing = source + [METRICS_TOOL]
+            cache[0] = (source, listing)
+        return listing
+
+    return executor, lister
+
+
+def with_metrics_batch(
+    batch_executor: Callable[[List[Tuple[str, Dict[str, Any]]]], List[Any]],
+) -> Callable[[List[Tuple[str, Dict[str, Any]]]], List[Any]]:
+    """
+    Return a batch_executor that answers hephaestus.metrics members locally
+    and hands only the other members (and their current_batch() contexts)
+    to batch_executor.
+    """
+
+    def executor(calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        forwarded = [index for index, (name, _) in enumerate(calls) if name != METRICS_TOOL["name"]]
+        if len(forwarded) == len(calls):
+            return batch_executor(calls)
+        results: List[Any] = [None] * len(calls)
+        for index, (name, _) in enumerate(calls):
+            if name == METRICS_TOOL["name"]:
+                results[index] = METRICS.snapshot()
+        if not forwarded:
+            return results
+
+        members = current_batch()
+        token = None
+        if members is not None and len(members) == len(calls):
+            token = activate_batch([members[index] for index in forwarded])
+        try:
+            answered = list(batch_executor([calls[index] for index in forwarded]))
+        finally:
+            if token is not None:
+                deactivate_batch(token)
+        if len(answered) != len(forwarded):
+            raise RuntimeError("batch executor returned wrong number of results")
+        for index, result in zip(forwarded, answered):
+            results[index] = result
+        return results
+
+    return executor
@@ -0,0 +1,207 @@
+"""Compiled validators for the JSON Schema subset used by tool input_schema."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# A validator returns None for valid values and an error message otherwise.
+Validator = Callable[[Any], Optional[str]]
+
+
+def _is_integer(value: Any) -> bool:
+    # 5.0 is refused too: tools use integer arguments as ints (range, slicing).
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": _is_integer,
+    "number": _is_number,
+    "null": lambda value: value is None,
+}
+
+
+def _compile_type(expected: Any, path: str) -> Optional[Validator]:
+    names = [expected] if isinstance(expected, str) else list(expected or [])
+    checks = [_TYPE_CHECKS[name] for name in names if name in _TYPE_CHECKS]
+    if not checks:
+        return None
+    message = f"{path} must be {' or '.join(names)}"
+    if len(checks) == 1:
+        check = checks[0]
+        return lambda value: None if check(value) else message
+    return lambda value: None if any(check(value) for check in checks) else message
+
+
+def _compile_bounds(schema: Dict[str, Any], path: str) -> List[Validator]:
+    validators: List[Validator] = []
+
+    def bound(keyword: str, measure: Callable[[Any], Any], applies: Callable[[Any], bool], fails, text: str) -> None:
+        if keyword not in schema:
+            return
+        limit = schema[keyword]
+        message = f"{path} {text} {limit}"
+        validators.append(lambda value: message if applies(value) and fails(measure(value), limit) else None)
+
+    identity = lambda value: value  # noqa: E731
+    bound("minimum", identity, _is_number, lambda v, lim: v < lim, "must be >=")
+    bound("maximum", identity, _is_number, lambda v, lim: v > lim, "must be <=")
+    bound("exclusiveMinimum", identity, _is_number, lambda v, lim: v <= lim, "must be >")
+    bound("exclusiveMaximum", identity, _is_number, lambda v, lim: v >= lim, "must be <")
+    is_str = _TYPE_CHECKS["string"]
+    bound("minLength", len, is_str, lambda v, lim: v < lim, "length must be >=")
+    bound("maxLength", len, is_str, lambda v, lim: v > lim, "length must be <=")
+    is_list = _TYPE_CHECKS["array"]
+    bound("minItems", len, is_list, lambda v, lim: v < lim, "item count must be >=")
+    bound("maxItems", len, is_list, lambda v, lim: v > lim, "item count must be <=")
+    return validators
+
+
+def _compile_object(schema: Dict[str, Any], path: str) -> List[Validator]:
+    validators: List[Validator] = []
+    required = [name for name in schema.get("required") or [] if isinstance(name, str)]
+    if required:
+
+        def check_required(value: Any) -> Optional[str]:
+            if isinstance(value, dict):
+                for name in required:
+                    if name not in value:
+                        return f"{path}.{name} is required"
+            return None
+
+        validators.append(check_required)
+
+    properties: List[Tuple[str, Validator]] = []
+    for name, subschema in (schema.get("properties") or {}).items():
+        validator = compile_schema(subschema, f"{path}.{name}")
+        if validator is not None:
+            properties.append((name, validator))
+    if properties:
+
+        def check_properties(value: Any) -> Optional[str]:
+            if isinstance(value, dict):
+                for name, validator in properties:
+                    if name in value:
+                        error = validator(value[name])
+                        if error is not None:
+                            return error
+            return None
+
+        validators.append(check_properties)
+
+    additional = schema.get("additionalProperties", True)
+    if additional is not True:
+        known = frozenset((schema.get("properties") or {}).keys())
+        extra = compile_schema(additional, f"{path}.*") if isinstance(additional, dict) else None
+
+        def check_additional(value: Any) -> Optional[str]:
+            if isinstance(value, dict):
+                for name in value.keys() - known:
+                    if extra is None:
+                        return f"{path}.{name} is not allowed"
+                    error = extra(value[name])
+                    if error is not None:
+                        return error
+            return None
+
+        validators.append(check_additional)
+    return validators
+
+
+def compile_schema(schema: Any, path: str = "arguments") -> Optional[Validator]:
+    """
+    Compile schema into a validator closure; None means every value is valid.
+
+    Supports type, enum, const, properties, required, additionalProperties,
+    items and numeric/length/item-count bounds. Other keywords are ignored.
+    """
+    if not isinstance(schema, dict):
+        return None
+
+    validators: List[Validator] = []
+    if "type" in schema:
+        type_validator = _compile_type(schema["type"], path)
+        if type_validator is not None:
+            validators.append(type_validator)
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        message = f"{path} must be one of {allowed}"
+        validators.append(lambda value: None if value in allowed else message)
+    if "const" in schema:
+        constant = schema["const"]
+        message = f"{path} must be {constant!r}"
+        validators.append(lambda value: None if value == constant else message)
+    validators.extend(_compile_bounds(schema, path))
+    validators.extend(_compile_object(schema, path))
+    if isinstance(schema.get("items"), dict):
+        item_validator = compile_schema(schema["items"], f"{path}[]")
+        if item_validator is not None:
+
+            def check_items(value: Any) -> Optional[str]:
+                if isinstance(value, list):
+                    for item in value:
+                        error = item_validator(item)
+                        if error is not None:
+                            return error
+                return None
+
+            validators.append(check_items)
+
+    if not validators:
+        return None
+    if len(validators) == 1:
+        return validators[0]
+
+    def validate(value: Any) -> Optional[str]:
+        for validator in validators:
+            error = validator(value)
+            if error is not None:
+                return error
+        return None
+
+    return validate
+
+
+_UNCOMPILED = object()
+
+
+class ValidatorCache:
+    """
+    Per-tool compiled validators keyed on the identity of the tool list.
+
+    Listers are expected to return the same list object until their tools
+    change (the tool registry does); a different list object drops every
+    cached validator. Schemas are compiled lazily, on a tool's first call.
+    """
+
+    def __init__(self) -> None:
+        self._state: Tuple[Any, Dict[str, Any], Dict[str, Optional[Validator]]] = (None, {}, {})
+
+    def validate(self, tools: list, tool_name: str, arguments: Dict[str, Any]) -> Optional[str]:
+        """Return an error message when arguments do not match the tool's schema."""
+        source, schemas, compiled = self._state
+        if source is not tools:
+            schemas = {
+                tool["name"]: tool.get("input_schema", tool.get("inputSchema"))
+                for tool in tools
+                if isinstance(tool, dict) and isinstance(tool.get("name"), str)
+            }
+            compiled = {}
+            # One tuple assignment keeps concurrent readers consistent.
+            self._state = (tools, schemas, compiled)
+
+        validator = compiled.get(tool_name, _UNCOMPILED)
+        if validator is _UNCOMPILED:
+            if tool_name not in schemas:
+                # Unknown names are left to the executor's not-found error and never cached.
+                return None
+            validator = compiled[tool_name] = compile_schema(schemas[tool_name])
+        if validator is None:
+            return None
+        return validator(arguments)
@@ -1,12 +1,28 @@
 """Minimal MCP Core handler for MCP Contract v1."""
 
-from typing import Any, Callable, Dict, Optional
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+from .cancellation import (
+    IN_FLIGHT,
+    RequestCancelled,
+    RequestContext,
+    RequestTimeout,
+    activate,
+    activate_batch,
+    deactivate,
+    deactivate_batch,
+)
+from .metrics import METRICS
+from .schema import ValidatorCache
+from .tracing import TRACER, Span
 
 
 ErrorResponse = Dict[str, Any]
 SuccessResponse = Dict[str, Any]
 ToolExecutor = Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]]
 ToolLister = Optional[Callable[[], list]]
+BatchExecutor = Optional[Callable[[List[tuple]], List[Any]]]
 
 SERVER_INFO = {"name": "hephaestus", "version": "0.1.0"}
 
@@ -17,6 +33,21 @@ INVALID_PARAMS = -32602
 INTERNAL_ERROR = -32603
 TOOL_NOT_FOUND = -32004
 EXECUTION_ERROR = -32003
+SERVER_OVERLOADED = -32005
+REQUEST_TIMEOUT = -32006
+REQUEST_CANCELLED = -32007
+
+
+class ServerOverloaded(RuntimeError):
+    """Raised by a tool executor that cannot admit more work right now."""
+
+
+# Executor exceptions reported with a dedicated code instead of EXECUTION_ERROR.
+_EXCEPTION_CODES = (
+    (ServerOverloaded, SERVER_OVERLOADED),
+    (RequestTimeout, REQUEST_TIMEOUT),
+    (RequestCancelled, REQUEST_CANCELLED),
+)
 
 
 def _error_response(code: int, message: str, request_id: Any) -> ErrorResponse:
@@ -55,15 +86,112 @@ def _initialize_response(request_id: Any, protocol_version: str) -> SuccessRespo
     }
 
 
-def handle_request(
-    payload: dict,
-    tool_executor: ToolExecutor = None,
-    tool_lister: ToolLister = None,
-) -> dict:
+class _ToolCall(NamedTuple):
+    request_id: Any
+    name: str
+    arguments: Dict[str, Any]
+    timeout: Optional[float] = None
+    meta: Optional[Dict[str, Any]] = None
+
+
+def _requested_timeout(params: Dict[str, Any]) -> Optional[float]:
+    """Read the optional per-request deadline, params._meta.timeout, in seconds."""
+    meta = params.get("_meta")
+    if not isinstance(meta, dict):
+        return None
+    timeout = meta.get("timeout")
+    if isinstance(timeout, (int, float)) and not isinstance(timeout, bool) and timeout > 0:
+        return float(timeout)
+    return None
+
+
+_VALIDATORS = ValidatorCache()
+
+
+def _validate_arguments(tool_lister: Callable[[], list], tool_name: str, arguments: Dict[str, Any]) -> Optional[str]:
+    """Check arguments against the tool's input_schema before anything is dispatched."""
+    try:
+        tools = tool_lister()
+    except Exception:  # noqa: BLE001
+        # Listing failures surface through tools/list; do not block calls on them.
+        return None
+    if not isinstance(tools, list):
+        return None
+    return _VALIDATORS.validate(tools, tool_name, arguments)
+
+
+def _handle_initialize(request_id: Any, params: Dict[str, Any], tool_lister: ToolLister) -> dict:
+    protocol_version = params.get("protocolVersion")
+    if not isinstance(protocol_version, str):
+        protocol_version = ""
+    return _initialize_response(request_id, protocol_version)
+
+
+def _handle_tools_list(request_id: Any, params: Dict[str, Any], tool_lister: ToolLister) -> dict:
+    try:
+        tools = [] if tool_lister is None else tool_lister()
+    except Exception as exc:  # noqa: BLE001
+        return _error_response(EXECUTION_ERROR, str(exc) or "execution error", request_id)
+
+    if not isinstance(tools, list):
+        return _error_response(EXECUTION_ERROR, "tool lister returned non-list", request_id)
+
+    return _list_tools_response(request_id, tools)
+
+
+def _handle_tools_call(
+    request_id: Any, params: Dict[str, Any], tool_lister: ToolLister
+) -> Union[dict, _ToolCall]:
+    tool_name = params.get("name") if "name" in params else params.get("tool")
+    arguments = params.get("arguments", {})
+
+    if not isinstance(tool_name, str):
+        return _error_response(INVALID_PARAMS, "params.name must be string", request_id)
+    if not isinstance(arguments, dict):
+        return _error_response(INVALID_PARAMS, "params.arguments must be object", request_id)
+
+    if tool_lister is not None:
+        error = _validate_arguments(tool_lister, tool_name, arguments)
+        if error is not None:
+            return _error_response(INVALID_PARAMS, error, request_id)
+
+    meta = params.get("_meta")
+    return _ToolCall(
+        request_id, tool_name, arguments, _requested_timeout(params), meta if isinstance(meta, dict) else None
+    )
+
+
+MethodHandler = Callable[[Any, Dict[str, Any], ToolLister], Union[dict, _ToolCall]]
+
+# Method name -> handler; aliases share a handler so lookup is one dict access.
+_METHOD_HANDLERS: Dict[str, MethodHandler] = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools.list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+    "tools.call": _handle_tools_call,
+}
+
+
+def _handle_cancelled(params: Any) -> None:
+    if isinstance(params, dict):
+        request_id = params.get("requestId")
+        if isinstance(request_id, (str, int, float)):
+            IN_FLIGHT.cancel(request_id)
+
+
+# Notifications never produce a response; unknown ones are ignored.
+_NOTIFICATION_HANDLERS: Dict[str, Callable[[Any], None]] = {
+    "notifications/cancelled": _handle_cancelled,
+}
+
+
+def _route(payload: Any, tool_lister: ToolLister) -> Union[None, dict, _ToolCall]:
     """
-    Handle a single MCP request payload according to MCP Contract v1.
+    Validate a single request envelope and answer everything except tools/call.
 
-    All validation and execution errors are converted to MCP error responses.
+    Valid tools/call requests are returned as a _ToolCall so the caller decides
+    how (and in which batch) the tool executor runs.
     """
     request_id: Any = None
     try:
@@ -71,6 +199,10 @@ def handle_request(
             return _error_response(INVALID_REQUEST, "payload must be object", None)
 
         if "method" in payload and "id" not in payload:
+            method = payload["method"]
+            notification_handler = _NOTIFICATION_HANDLERS.get(method) if isinstance(method, str) else None
+            if notification_handler is not None:
+                notification_handler(payload.get("params"))
             return None
 
         if payload.get("jsonrpc") != "2.0":
@@ -94,46 +226,176 @@ def handle_request(
         if not isinstance(params, dict):
             return _error_response(INVALID_REQUEST, "params must be object", request_id)
 
-        if method in {"initialize"}:
-            protocol_version = params.get("protocolVersion")
-            if not isinstance(protocol_version, str):
-                protocol_version = ""
-            return _initialize_response(request_id, protocol_version)
+        handler = _METHOD_HANDLERS.get(method)
+        if handler is None:
+            return _error_response(METHOD_NOT_FOUND, "unsupported method", request_id)
+        return handler(request_id, params, tool_lister)
 
-        if method in {"tools.list", "tools/list"}:
-            try:
-                tools = [] if tool_lister is None else tool_lister()
-            except Exception as exc:  # noqa: BLE001
-                return _error_response(EXECUTION_ERROR, str(exc) or "execution error", request_id)
+    except Exception as exc:  # noqa: BLE001
+        return _error_response(INTERNAL_ERROR, str(exc) or "internal error", request_id)
 
-            if not isinstance(tools, list):
-                return _error_response(EXECUTION_ERROR, "tool lister returned non-list", request_id)
 
-            return _list_tools_response(request_id, tools)
+def _call_response(call: _ToolCall, result_data: Any) -> dict:
+    if isinstance(result_data, BaseException):
+        for exception_type, code in _EXCEPTION_CODES:
+            if isinstance(result_data, exception_type):
+                return _error_response(code, str(result_data), call.request_id)
+        return _error_response(EXECUTION_ERROR, str(result_data) or "execution error", call.request_id)
+    if not isinstance(result_data, dict):
+        return _error_response(EXECUTION_ERROR, "tool returned non-object", call.request_id)
+    return _success_response(call.request_id, result_data)
+
+
+def _error_code(response: Any) -> Any:
+    if isinstance(response, dict) and isinstance(response.get("error"), dict):
+        return response["error"].get("code")
+    return None
 
-        if method not in {"tools.call", "tools/call"}:
-            return _error_response(METHOD_NOT_FOUND, "unsupported method", request_id)
 
-        tool_name = params.get("name") if "name" in params else params.get("tool")
-        arguments = params.get("arguments", {})
+def _observe_method(payload: Any, response: Any, started: float) -> None:
+    method = payload.get("method") if isinstance(payload, dict) else None
+    if not isinstance(method, str) or (method not in _METHOD_HANDLERS and method not in _NOTIFICATION_HANDLERS):
+        # Client-chosen method names share one series.
+        method = "other"
+    METRICS.observe("method", method, time.perf_counter() - started, _error_code(response))
 
-        if not isinstance(tool_name, str):
-            return _error_response(INVALID_PARAMS, "params.name must be string", request_id)
-        if not isinstance(arguments, dict):
-            return _error_response(INVALID_PARAMS, "params.arguments must be object", request_id)
 
-        if tool_executor is None:
-            return _error_response(TOOL_NOT_FOUND, "no tool executor available", request_id)
+def _start_span(call: _ToolCall, parse: Optional[tuple]) -> Optional[Span]:
+    """The request's tracing span, covering the transport's parse of it when that was timed."""
+    span = TRACER.start("tools/call", call.meta, tool=call.name, request_id=call.request_id)
+    if span is not None and parse is not None:
+        name, started, ended = parse
+        span.start = started
+        span.record(name, started, ended)
+    return span
 
+
+def _execute_call(call: _ToolCall, tool_executor: ToolExecutor, parse: Optional[tuple] = None) -> dict:
+    if tool_executor is None:
+        return _error_response(TOOL_NOT_FOUND, "no tool executor available", call.request_id)
+
+    started = time.perf_counter()
+    # Executors reach the deadline and cancellation state via current_request().
+    context = IN_FLIGHT.begin(call.request_id, call.timeout, call.meta)
+    span = context.span = _start_span(call, parse) if TRACER.enabled else None
+    token = activate(context)
+    try:
+        context.check()
+        result_data = tool_executor(call.name, call.arguments)
+    except Exception as exc:  # noqa: BLE001
+        result_data = exc
+    finally:
+        deactivate(token)
+        IN_FLIGHT.finish(context)
+    response = _call_response(call, result_data)
+    METRICS.observe("tool", call.name, time.perf_counter() - started, _error_code(response))
+    if span is not None:
+        span.end(error=_error_code(response))
+    return response
+
+
+def _begin_batch(calls: List[_ToolCall]) -> List[RequestContext]:
+    """In-flight contexts (and spans) of the members handed to a batch executor, reachable via current_batch()."""
+    contexts = []
+    for call in calls:
+        context = IN_FLIGHT.begin(call.request_id, call.timeout, call.meta)
+        context.span = _start_span(call, None) if TRACER.enabled else None
+        contexts.append(context)
+    return contexts
+
+
+def _finish_batch(contexts: List[RequestContext]) -> None:
+    for context in contexts:
+        IN_FLIGHT.finish(context)
+
+
+def _batch_responses(
+    calls: List[_ToolCall], contexts: List[RequestContext], results: List[Any], started: float
+) -> List[dict]:
+    """Responses to the members of an executed batch, each recorded in METRICS with the batch's latency."""
+    elapsed = time.perf_counter() - started
+    responses = []
+    for call, context, result in zip(calls, contexts, results):
+        response = _call_response(call, result)
+        METRICS.observe("tool", call.name, elapsed, _error_code(response))
+        if context.span is not None:
+            context.span.end(error=_error_code(response))
+        responses.append(response)
+    return responses
+
+
+def _handle_batch(
+    payload: list,
+    tool_executor: ToolExecutor,
+    tool_lister: ToolLister,
+    batch_executor: BatchExecutor,
+) -> Optional[list]:
+    if not payload:
+        return _error_response(INVALID_REQUEST, "batch must not be empty", None)
+
+    outcomes = [_route(item, tool_lister) for item in payload]
+
+    answered = None
+    calls = [outcome for outcome in outcomes if isinstance(outcome, _ToolCall)]
+    if calls and batch_executor is not None:
+        started = time.perf_counter()
+        contexts = _begin_batch(calls)
+        token = activate_batch(contexts)
         try:
-            result_data = tool_executor(tool_name, arguments)
+            results = list(batch_executor([(call.name, call.arguments) for call in calls]))
+            if len(results) != len(calls):
+                raise RuntimeError("batch executor returned wrong number of results")
         except Exception as exc:  # noqa: BLE001
-            return _error_response(EXECUTION_ERROR, str(exc) or "execution error", request_id)
+            results = [exc] * len(calls)
+        finally:
+            deactivate_batch(token)
+            _finish_batch(contexts)
+        answered = _batch_responses(calls, contexts, results, started)
+    pending = iter(answered or ())
+
+    responses = []
+    for outcome in outcomes:
+        if isinstance(outcome, _ToolCall):
+            outcome = _execute_call(outcome, tool_executor) if answered is None else next(pending)
+        if outcome is not None:
+            responses.append(outcome)
+    return responses or None
 
-        if not isinstance(result_data, dict):
-            return _error_response(EXECUTION_ERROR, "tool returned non-object", request_id)
 
-        return _success_response(request_id, result_data)
+def handle_request(
+    payload: Any,
+    tool_executor: ToolExecutor = None,
+    tool_lister: ToolLister = None,
+    batch_executor: BatchExecutor = None,
+) -> Union[dict, list, None]:
+    """
+    Handle a single MCP request payload or a JSON-RPC 2.0 batch (array).
 
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(INTERNAL_ERROR, str(exc) or "internal error", request_id)
+    All validation and execution errors are converted to MCP error responses.
+    Batches yield a list of responses in request order, or None when every
+    member is a notification. When batch_executor is given, all tools/call
+    members of a batch are executed through one batch_executor call that
+    receives (name, arguments) pairs and returns one result dict or exception
+    per pair; each member's deadline and cancellation state is available to
+    it through current_batch().
+
+    Each request's latency and error code is recorded in METRICS, per
+    method ("method" scope) and per tool ("tool" scope). With tracing on,
+    each tools/call gets a span (mcp_core.tracing) continuing the trace in
+    params._meta.trace.
+    """
+    started = time.perf_counter()
+    parse = TRACER.pop_parsed(payload) if TRACER.enabled else None
+    if isinstance(payload, list):
+        try:
+            response = _handle_batch(payload, tool_executor, tool_lister, batch_executor)
+        except Exception as exc:  # noqa: BLE001
+            response = _error_response(INTERNAL_ERROR, str(exc) or "internal error", None)
+        METRICS.observe("method", "batch", time.perf_counter() - started, _error_code(response))
+        return response
+
+    outcome = _route(payload, tool_lister)
+    if isinstance(outcome, _ToolCall):
+        outcome = _execute_call(outcome, tool_executor, parse)
+    _observe_method(payload, outcome, started)
+    return outcome
@@ -0,0 +1,158 @@
+"""Asyncio variant of the MCP Core handler.
+
+Envelope validation and method routing are shared with server.py; only tool
+execution differs. Async tool executors are awaited on the event loop and
+sync executors run in the loop's default thread pool, so neither blocks
+other in-flight requests.
+"""
+
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from .cancellation import (
+    IN_FLIGHT,
+    RequestCancelled,
+    RequestTimeout,
+    activate,
+    activate_batch,
+    deactivate,
+    deactivate_batch,
+)
+from .metrics import METRICS
+from .tracing import TRACER
+from .server import (
+    INTERNAL_ERROR,
+    INVALID_REQUEST,
+    TOOL_NOT_FOUND,
+    ToolLister,
+    _batch_responses,
+    _begin_batch,
+    _call_response,
+    _error_code,
+    _error_response,
+    _finish_batch,
+    _observe_method,
+    _route,
+    _start_span,
+    _ToolCall,
+)
+
+
+AsyncToolExecutor = Optional[Callable[[str, Dict[str, Any]], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]]
+AsyncBatchExecutor = Optional[Callable[[List[tuple]], Union[List[Any], Awaitable[List[Any]]]]]
+
+
+async def _invoke(fn: Callable[..., Any], *args: Any) -> Any:
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args)
+    result = await asyncio.to_thread(fn, *args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def _execute_call(call: _ToolCall, tool_executor: AsyncToolExecutor, parse: Optional[tuple] = None) -> dict:
+    if tool_executor is None:
+        return _error_response(TOOL_NOT_FOUND, "no tool executor available", call.request_id)
+
+    started = time.perf_counter()
+    context = IN_FLIGHT.begin(call.request_id, call.timeout, call.meta)
+    span = context.span = _start_span(call, parse) if TRACER.enabled else None
+    token = activate(context)
+    try:
+        context.check()
+        # The task copies the current context, so the executor sees current_request().
+        task = asyncio.ensure_future(_invoke(tool_executor, call.name, call.arguments))
+        loop = asyncio.get_running_loop()
+        remove = context.on_cancel(lambda: loop.call_soon_threadsafe(task.cancel))
+        try:
+            result_data = await asyncio.wait_for(task, context.remaining())
+        except asyncio.TimeoutError:
+            result_data = RequestTimeout("request timed out")
+        except asyncio.CancelledError:
+            if not context.cancelled:
+                raise
+            result_data = RequestCancelled("request cancelled")
+        finally:
+            remove()
+    except Exception as exc:  # noqa: BLE001
+        result_data = exc
+    finally:
+        deactivate(token)
+        IN_FLIGHT.finish(context)
+    response = _call_response(call, result_data)
+    METRICS.observe("tool", call.name, time.perf_counter() - started, _error_code(response))
+    if span is not None:
+        span.end(error=_error_code(response))
+    return response
+
+
+async def _handle_batch(
+    payload: list,
+    tool_executor: AsyncToolExecutor,
+    tool_lister: ToolLister,
+    batch_executor: AsyncBatchExecutor,
+) -> Optional[list]:
+    if not payload:
+        return _error_response(INVALID_REQUEST, "batch must not be empty", None)
+
+    outcomes = [_route(item, tool_lister) for item in payload]
+    calls = [outcome for outcome in outcomes if isinstance(outcome, _ToolCall)]
+
+    if calls and batch_executor is not None:
+        started = time.perf_counter()
+        contexts = _begin_batch(calls)
+        token = activate_batch(contexts)
+        try:
+            results = list(await _invoke(batch_executor, [(call.name, call.arguments) for call in calls]))
+            if len(results) != len(calls):
+                raise RuntimeError("batch executor returned wrong number of results")
+        except Exception as exc:  # noqa: BLE001
+            results = [exc] * len(calls)
+        finally:
+            deactivate_batch(token)
+            _finish_batch(contexts)
+        answered = _batch_responses(calls, contexts, results, started)
+    else:
+        # Independent calls of one batch overlap instead of running back to back.
+        answered = await asyncio.gather(*(_execute_call(call, tool_executor) for call in calls))
+
+    pending = iter(answered)
+    responses = []
+    for outcome in outcomes:
+        if isinstance(outcome, _ToolCall):
+            outcome = next(pending)
+        if outcome is not None:
+            responses.append(outcome)
+    return responses or None
+
+
+async def handle_request_async(
+    payload: Any,
+    tool_executor: AsyncToolExecutor = None,
+    tool_lister: ToolLister = None,
+    batch_executor: AsyncBatchExecutor = None,
+) -> Union[dict, list, None]:
+    """
+    Handle a single MCP request payload or batch; see server.handle_request.
+
+    tool_executor and batch_executor may be coroutine functions or plain
+    callables. tool_lister stays synchronous: it only returns metadata.
+    """
+    started = time.perf_counter()
+    parse = TRACER.pop_parsed(payload) if TRACER.enabled else None
+    if isinstance(payload, list):
+        try:
+            response = await _handle_batch(payload, tool_executor, tool_lister, batch_executor)
+        except Exception as exc:  # noqa: BLE001
+            response = _error_response(INTERNAL_ERROR, str(exc) or "internal error", None)
+        METRICS.observe("method", "batch", time.perf_counter() - started, _error_code(response))
+        return response
+
+    outcome = _route(payload, tool_lister)
+    if isinstance(outcome, _ToolCall):
+        outcome = await _execute_call(outcome, tool_executor, parse)
+    _observe_method(payload, outcome, started)
+    return outcome
@@ -0,0 +1,166 @@
+"""Request-correlated tracing: spans written to a JSONL file.
+
+A trace starts where a tools/call enters a process and is carried to the
+next hop in params._meta.trace ({"trace_id", "parent_id", "sampled"}), so
+the daemon's and the provider's spans of one call share a trace_id. Each
+span is one JSON line: trace_id, span_id, parent_id, name, service, pid,
+start (epoch seconds), duration_ms and attributes.
+
+BLENDER_MCP_TRACE_FILE names the sink; without it tracing is off and
+every hook is a single attribute check. BLENDER_MCP_TRACE_SAMPLE (0..1,
+default 1) is the fraction of new traces recorded; a propagated trace
+keeps the sampling decision of its first hop.
+"""
+
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .codec import dumps
+
+
+# Transport parse timings waiting for their request's span, by id(payload).
+_PARSED_LIMIT = 1024
+
+
+def _new_id(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+class Span:
+    """One timed operation; times are time.perf_counter() values."""
+
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent_id", "sampled", "start", "attributes")
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        sampled: bool,
+        start: Optional[float] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.start = time.perf_counter() if start is None else start
+        self.attributes = attributes or {}
+
+    def child(self, name: str, start: Optional[float] = None, **attributes: Any) -> "Span":
+        return Span(self.tracer, name, self.trace_id, self.span_id, self.sampled, start, attributes)
+
+    def end(self, end: Optional[float] = None, **attributes: Any) -> None:
+        if self.sampled:
+            self.attributes.update((key, value) for key, value in attributes.items() if value is not None)
+            self.tracer.write(self, time.perf_counter() if end is None else end)
+
+    def record(self, name: str, start: float, end: float, **attributes: Any) -> None:
+        """Write a finished child span that was timed elsewhere."""
+        if self.sampled:
+            self.child(name, start, **attributes).end(end)
+
+    def propagate(self) -> Dict[str, Any]:
+        """The params._meta.trace value that makes the next hop's spans children of this one."""
+        return {"trace_id": self.trace_id, "parent_id": self.span_id, "sampled": self.sampled}
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        if exc is not None:
+            self.end(error=type(exc).__name__)
+        else:
+            self.end()
+
+
+class Tracer:
+    """Creates spans and appends the sampled ones to a JSONL file."""
+
+    def __init__(self, path: Optional[str] = None, sample_rate: float = 1.0, service: str = "hephaestus") -> None:
+        self.path = path
+        self.enabled = bool(path)
+        self.sample_rate = sample_rate
+        self.service = service
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._file: Any = None
+        self._parsed: Dict[int, Tuple[str, float, float]] = {}
+        # Converts perf_counter readings to epoch seconds.
+        self._epoch_offset = time.time() - time.perf_counter()
+
+    def start(self, name: str, meta: Optional[Dict[str, Any]] = None, **attributes: Any) -> Optional[Span]:
+        """
+        Open a request span, continuing the trace in meta["trace"] if there is one.
+
+        Returns None when tracing is disabled.
+        """
+        if not self.enabled:
+            return None
+        upstream = meta.get("trace") if meta is not None else None
+        if isinstance(upstream, dict) and isinstance(upstream.get("trace_id"), str):
+            parent_id = upstream.get("parent_id")
+            sampled = upstream.get("sampled") is not False
+            parent_id = parent_id if isinstance(parent_id, str) else None
+            return Span(self, name, upstream["trace_id"], parent_id, sampled, attributes=attributes)
+        sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+        return Span(self, name, _new_id(16), None, sampled, attributes=attributes)
+
+    def parsed(self, payload: Any, name: str, started: float) -> None:
+        """Remember how long a transport spent decoding payload, for its request span."""
+        with self._lock:
+            if len(self._parsed) < _PARSED_LIMIT:
+                self._parsed[id(payload)] = (name, started, time.perf_counter())
+
+    def pop_parsed(self, payload: Any) -> Optional[Tuple[str, float, float]]:
+        with self._lock:
+            return self._parsed.pop(id(payload), None)
+
+    def write(self, span: Span, end: float) -> None:
+        record = {
+            "trace_id": span.trace_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "service": self.service,
+            "pid": self.pid,
+            "start": span.start + self._epoch_offset,
+            "duration_ms": (end - span.start) * 1000.0,
+        }
+        if span.attributes:
+            record["attributes"] = span.attributes
+        try:
+            line = dumps(record) + b"\n"
+        except Exception:  # noqa: BLE001
+            return
+        with self._lock:
+            try:
+                if self._file is None:
+                    self._file = open(self.path, "ab")
+                self._file.write(line)
+                self._file.flush()
+            except OSError:
+                # A broken sink must never fail the request being traced.
+                return
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _sample_rate() -> float:
+    try:
+        return min(1.0, max(0.0, float(os.getenv("BLENDER_MCP_TRACE_SAMPLE", "1"))))
+    except ValueError:
+        return 1.0
+
+
+TRACER = Tracer(os.getenv("BLENDER_MCP_TRACE_FILE") or None, _sample_rate())
@@ -1,11 +1,28 @@
 """Minimal HTTP transport for MCP Core."""
 
-import json
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Callable, Dict, Optional
 
+from .codec import dumps, loads
+from .metrics import METRICS
 from .server import handle_request
+from .tracing import TRACER
+from .workers import BoundedWorkerPool
+
+KEEPALIVE_TIMEOUT = 60.0
+
+
+class MCPHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that also owns the optional tool worker pool."""
+
+    worker_pool: Optional[BoundedWorkerPool] = None
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown()
 
 
 def _invalid_json_response() -> Dict[str, Any]:
@@ -29,44 +46,80 @@ def _build_handler(
     tool_lister: Optional[Callable[[], list]] = None,
 ):
     class MCPRequestHandler(BaseHTTPRequestHandler):
+        # HTTP/1.1 keeps client connections open between requests; every
+        # response carries Content-Length so the stream stays framed. Idle
+        # connections are dropped after KEEPALIVE_TIMEOUT seconds. Headers and
+        # body are separate writes, so Nagle must be off to avoid a
+        # delayed-ACK stall on every reused connection.
+        protocol_version = "HTTP/1.1"
+        timeout = KEEPALIVE_TIMEOUT
+        disable_nagle_algorithm = True
+
         def do_POST(self) -> None:  # noqa: N802
             try:
+                raw_body = self._read_body()
                 if self.path != "/mcp":
                     response = _method_not_found_response()
                 else:
-                    length = int(self.headers.get("Content-Length", 0))
-                    raw_body = self.rfile.read(length) if length > 0 else b""
+                    started = time.perf_counter()
                     try:
-                        payload = json.loads(raw_body.decode("utf-8"))
+                        payload = loads(raw_body)
                     except Exception:  # noqa: BLE001
                         response = _invalid_json_response()
                     else:
+                        if TRACER.enabled:
+                            TRACER.parsed(payload, "http.parse", started)
                         response = handle_request(
                             payload,
                             tool_executor=tool_executor,
                             tool_lister=tool_lister,
                         )
+                if response is None:
+                    self._write_empty()
+                    return
                 self._write_json(response)
             except Exception:  # noqa: BLE001
+                # The request stream may be out of sync; do not reuse it.
+                self.close_connection = True
                 self._write_json(_invalid_json_response())
 
         def do_GET(self) -> None:  # noqa: N802
-            self._write_json(_method_not_found_response())
+            if self.path == "/metrics":
+                self._read_body()
+                self._write_json(METRICS.snapshot())
+                return
+            self._reject()
 
         def do_PUT(self) -> None:  # noqa: N802
-            self._write_json(_method_not_found_response())
+            self._reject()
 
         def do_DELETE(self) -> None:  # noqa: N802
-            self._write_json(_method_not_found_response())
+            self._reject()
 
         def log_message(self, format: str, *args: Any) -> None:  # noqa: A003
             return
 
-        def _write_json(self, body: Dict[str, Any]) -> None:
+        def _read_body(self) -> bytes:
+            length = int(self.headers.get("Content-Length", 0))
+            return self.rfile.read(length) if length > 0 else b""
+
+        def _reject(self) -> None:
             try:
-                data = json.dumps(body).encode("utf-8")
+                self._read_body()
             except Exception:  # noqa: BLE001
-                data = json.dumps(_invalid_json_response()).encode("utf-8")
+                self.close_connection = True
+            self._write_json(_method_not_found_response())
+
+        def _write_empty(self) -> None:
+            self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def _write_json(self, body: Any) -> None:
+            try:
+                data = dumps(body)
+            except Exception:  # noqa: BLE001
+                data = dumps(_invalid_json_response())
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
             self.send_header("Content-Length", str(len(data)))
@@ -84,15 +137,35 @@ def run_http(
     port: int = 8765,
     tool_executor: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None,
     tool_lister: Optional[Callable[[], list]] = None,
+    workers: Optional[int] = None,
+    queue_size: int = 0,
 ):
     """
     Start an HTTP server that processes MCP requests on POST /mcp.
 
+    Connections are kept alive (HTTP/1.1) and each one is served on its own
+    thread, so a pooled client holding several connections is never starved.
+
+    When workers is set, tools/call executions run on a pool of that many
+    threads with at most queue_size calls waiting; further calls are answered
+    with SERVER_OVERLOADED. initialize, tools/list and notifications never
+    enter the pool and are answered immediately.
+
+    The body may be a single request or a JSON-RPC batch array; requests that
+    produce no response (notifications only) are answered with 204.
+
+    GET /metrics returns the process's METRICS snapshot.
+
     Returns the server instance so callers can manage its lifecycle.
     """
     try:
+        pool = None
+        if workers is not None and tool_executor is not None:
+            pool = BoundedWorkerPool(workers, queue_size)
+            tool_executor = pool.wrap(tool_executor)
         handler = _build_handler(tool_executor=tool_executor, tool_lister=tool_lister)
-        httpd = HTTPServer((host, port), handler)
+        httpd = MCPHTTPServer((host, port), handler)
+        httpd.worker_pool = pool
         thread = threading.Thread(target=httpd.serve_forever, daemon=True)
         thread.start()
         return httpd
@@ -0,0 +1,131 @@
+"""Asyncio HTTP/1.1 transport for MCP Core.
+
+Serves the same routes as transport_http (POST /mcp, GET /metrics,
+everything else is METHOD_NOT_FOUND) with keep-alive connections multiplexed on one event loop.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .codec import dumps, loads
+from .metrics import METRICS
+from .server import ToolLister
+from .server_async import AsyncBatchExecutor, AsyncToolExecutor, handle_request_async
+from .tracing import TRACER
+from .transport_http import KEEPALIVE_TIMEOUT, _invalid_json_response, _method_not_found_response
+
+
+MAX_HEADER_BYTES = 64 * 1024
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, str, Dict[str, str], bytes]]:
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    lines = head.decode("latin-1").split("\r\n")
+    method, path, version = lines[0].split(" ", 2)
+    headers = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0) or 0)
+    body = await reader.readexactly(length) if length > 0 else b""
+    return method, path, version, headers, body
+
+
+def _encode_response(status: int, reason: str, body: bytes, keep_alive: bool) -> bytes:
+    head = [f"HTTP/1.1 {status} {reason}"]
+    if body or status != 204:
+        head.append("Content-Type: application/json")
+    head.append(f"Content-Length: {len(body)}")
+    if not keep_alive:
+        head.append("Connection: close")
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+
+def _build_connection_handler(
+    tool_executor: AsyncToolExecutor,
+    tool_lister: ToolLister,
+    batch_executor: AsyncBatchExecutor,
+):
+    async def respond(method: str, path: str, body: bytes) -> Any:
+        if method == "GET" and path == "/metrics":
+            return METRICS.snapshot()
+        if method != "POST" or path != "/mcp":
+            return _method_not_found_response()
+        started = time.perf_counter()
+        try:
+            payload = loads(body)
+        except Exception:  # noqa: BLE001
+            return _invalid_json_response()
+        if TRACER.enabled:
+            TRACER.parsed(payload, "http.parse", started)
+        return await handle_request_async(
+            payload,
+            tool_executor=tool_executor,
+            tool_lister=tool_lister,
+            batch_executor=batch_executor,
+        )
+
+    async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), KEEPALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.LimitOverrunError, ValueError, ConnectionError):
+                    return
+                if request is None:
+                    return
+                method, path, version, headers, body = request
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                response = await respond(method, path, body)
+                if response is None:
+                    writer.write(_encode_response(204, "No Content", b"", keep_alive))
+                else:
+                    try:
+                        data = dumps(response)
+                    except Exception:  # noqa: BLE001
+                        data = dumps(_invalid_json_response())
+                    writer.write(_encode_response(200, "OK", data, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except Exception:  # noqa: BLE001
+            return
+        finally:
+            writer.close()
+
+    return handle_connection
+
+
+async def start_http_async(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    tool_executor: AsyncToolExecutor = None,
+    tool_lister: ToolLister = None,
+    batch_executor: AsyncBatchExecutor = None,
+) -> asyncio.AbstractServer:
+    """
+    Start serving MCP requests on POST /mcp from the running event loop.
+
+    Returns the asyncio server; close() and wait_closed() stop it.
+    """
+    handler = _build_connection_handler(tool_executor, tool_lister, batch_executor)
+    return await asyncio.start_server(handler, host, port, limit=MAX_HEADER_BYTES)
+
+
+async def run_http_async(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    tool_executor: AsyncToolExecutor = None,
+    tool_lister: ToolLister = None,
+    batch_executor: AsyncBatchExecutor = None,
+) -> None:
+    """Serve until cancelled."""
+    server = await start_http_async(host, port, tool_executor, tool_lister, batch_executor)
+    async with server:
+        await server.serve_forever()
@@ -1,10 +1,26 @@
 """Minimal stdio transport for MCP Core."""
 
-import json
+import queue
 import sys
-from typing import Any, Callable, Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
+from .codec import dumps, line_dumps, loads
+from .framing import FrameReader, encode_frame
 from .server import handle_request
+from .tracing import TRACER
+
+
+# Wire formats: one JSON document per line, or 4-byte length-prefixed frames.
+NEWLINE = "newline"
+LENGTH_PREFIXED = "length"
+FRAMINGS = (NEWLINE, LENGTH_PREFIXED)
+
+_PARSE_ERROR = object()
+_STOP = object()
+_CALL_METHODS = frozenset({"tools/call", "tools.call"})
 
 
 def _invalid_json_response() -> Dict[str, Any]:
@@ -15,35 +31,231 @@ def _invalid_json_response() -> Dict[str, Any]:
     }
 
 
+def read_lines() -> Iterator[Union[bytes, str]]:
+    """Yield non-empty stripped lines from stdin, as bytes when stdin exposes a binary buffer."""
+    for line in getattr(sys.stdin, "buffer", sys.stdin):
+        line = line.strip()
+        if line:
+            yield line
+
+
+def write_message(message: Any) -> None:
+    """Encode message as one JSON line (stdlib json formatting, see codec) on stdout and flush it."""
+    data = line_dumps(message) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        buffer.write(data)
+        buffer.flush()
+    else:
+        sys.stdout.write(data.decode("utf-8"))
+        sys.stdout.flush()
+
+
+def _stdout_buffer() -> Any:
+    return getattr(sys.stdout, "buffer", sys.stdout)
+
+
+def read_frames() -> FrameReader:
+    """Return a reader of length-prefixed frames from stdin's binary buffer."""
+    return FrameReader(getattr(sys.stdin, "buffer", sys.stdin))
+
+
+def write_frames(messages: List[Any]) -> None:
+    """Encode messages as length-prefixed frames and write them with one write and flush."""
+    buffer = _stdout_buffer()
+    buffer.write(b"".join(encode_frame(dumps(message)) for message in messages))
+    buffer.flush()
+
+
+def _parse(line: Union[bytes, str]) -> Any:
+    started = time.perf_counter()
+    try:
+        payload = loads(line)
+    except Exception:  # noqa: BLE001
+        return _PARSE_ERROR
+    if TRACER.enabled:
+        TRACER.parsed(payload, "stdio.parse", started)
+    return payload
+
+
+def _needs_worker(payload: Any) -> bool:
+    """Only tool calls (and batches, which may hold them) can be slow."""
+    if isinstance(payload, list):
+        return True
+    if not isinstance(payload, dict):
+        return False
+    method = payload.get("method")
+    return isinstance(method, str) and method in _CALL_METHODS
+
+
+def _respond(handler: Callable[[Any], Any], data: Union[bytes, str]) -> Any:
+    payload = _parse(data)
+    if payload is _PARSE_ERROR:
+        return _invalid_json_response()
+    return handler(payload)
+
+
+def _serve_frames_sequentially(handler: Callable[[Any], Any]) -> None:
+    frames = read_frames()
+    ready: List[Any] = []
+    for frame in frames:
+        if not frame:
+            continue
+        response = _respond(handler, frame)
+        if response is not None:
+            ready.append(response)
+        # Flush only when the next request would block, so pipelined
+        # requests are answered with one write.
+        if ready and not frames.pending():
+            try:
+                write_frames(ready)
+            except Exception:  # noqa: BLE001
+                return
+            ready = []
+    if ready:
+        try:
+            write_frames(ready)
+        except Exception:  # noqa: BLE001
+            return
+
+
+def _serve_sequentially(handler: Callable[[Any], Any]) -> None:
+    for line in read_lines():
+        payload = _parse(line)
+        if payload is _PARSE_ERROR:
+            response = _invalid_json_response()
+        else:
+            response = handler(payload)
+            if response is None:
+                continue
+
+        try:
+            write_message(response)
+        except Exception:  # noqa: BLE001
+            # Swallow output errors to honor "no exception" requirement
+            return
+
+
+def _serve_concurrently(handler: Callable[[Any], Any], max_in_flight: int, framing: str = NEWLINE) -> None:
+    responses: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+    closed = threading.Event()
+    slots = threading.BoundedSemaphore(max_in_flight)
+
+    def line_writer() -> None:
+        # Single writer: stdout never sees interleaved partial lines.
+        while True:
+            message = responses.get()
+            if message is _STOP:
+                return
+            try:
+                write_message(message)
+            except Exception:  # noqa: BLE001
+                closed.set()
+                return
+
+    def frame_writer() -> None:
+        # Every response that is ready goes out in one write and flush.
+        while True:
+            ready = [responses.get()]
+            while True:
+                try:
+                    ready.append(responses.get_nowait())
+                except queue.Empty:
+                    break
+            stop = ready[-1] is _STOP
+            if stop:
+                ready.pop()
+            try:
+                if ready:
+                    write_frames(ready)
+            except Exception:  # noqa: BLE001
+                closed.set()
+                return
+            if stop:
+                return
+
+    def work(payload: Any) -> None:
+        try:
+            response = handler(payload)
+        finally:
+            slots.release()
+        if response is not None:
+            responses.put(response)
+
+    requests: Iterable[Union[bytes, str]] = read_lines() if framing == NEWLINE else read_frames()
+    writer = line_writer if framing == NEWLINE else frame_writer
+    writer_thread = threading.Thread(target=writer, name="mcp-stdio-writer", daemon=True)
+    writer_thread.start()
+    pool = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="mcp-stdio")
+    try:
+        for line in requests:
+            if closed.is_set():
+                return
+            if not line:
+                continue
+            payload = _parse(line)
+            if payload is _PARSE_ERROR:
+                responses.put(_invalid_json_response())
+                continue
+            if not _needs_worker(payload):
+                # initialize, tools/list and notifications never wait behind tool calls.
+                response = handler(payload)
+                if response is not None:
+                    responses.put(response)
+                continue
+            slots.acquire()
+            pool.submit(work, payload)
+    finally:
+        pool.shutdown(wait=True)
+        responses.put(_STOP)
+        writer_thread.join()
+
+
+def serve_stdio(handler: Callable[[Any], Any], max_in_flight: int = 1, framing: str = NEWLINE) -> None:
+    """
+    Feed each request read from stdin to handler and write its response to stdout.
+
+    With max_in_flight == 1 requests are handled strictly in order. With a
+    larger value, stdin is read continuously: tool calls run on that many
+    worker threads, everything else is answered immediately, and responses
+    are written by a single writer as they complete (clients correlate them
+    by id).
+
+    framing selects the wire format: NEWLINE (one JSON document per line)
+    or LENGTH_PREFIXED (mcp_core.framing frames on the binary streams,
+    read in large chunks, with ready responses coalesced into one write).
+    """
+    if framing not in FRAMINGS:
+        raise ValueError(f"unknown stdio framing: {framing}")
+    if max_in_flight > 1:
+        _serve_concurrently(handler, max_in_flight, framing)
+    elif framing == LENGTH_PREFIXED:
+        _serve_frames_sequentially(handler)
+    else:
+        _serve_sequentially(handler)
+
+
 def run_stdio(
     tool_executor: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None,
     tool_lister: Optional[Callable[[], list]] = None,
+    max_in_flight: int = 1,
+    framing: str = NEWLINE,
 ) -> None:
     """
     Process newline-delimited JSON requests from stdin and write responses to stdout.
 
+    Each line holds a single request or a JSON-RPC batch array; a batch is
+    answered with one line holding the array of responses. See serve_stdio
+    for max_in_flight and the opt-in LENGTH_PREFIXED framing.
+
     No exceptions are propagated; invalid JSON yields an INVALID_REQUEST error response.
     """
     try:
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except Exception:  # noqa: BLE001
-                response = _invalid_json_response()
-            else:
-                response = handle_request(payload, tool_executor=tool_executor, tool_lister=tool_lister)
-                if response is None:
-                    continue
-
-            try:
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
-            except Exception:  # noqa: BLE001
-                # Swallow output errors to honor "no exception" requirement
-                return
+        serve_stdio(
+            lambda payload: handle_request(payload, tool_executor=tool_executor, tool_lister=tool_lister),
+            max_in_flight=max_in_flight,
+            framing=framing,
+        )
     except Exception:  # noqa: BLE001
         # Do not propagate exceptions outside run_stdio
         return
@@ -0,0 +1,86 @@
+"""Asyncio stdio transport for MCP Core."""
+
+import asyncio
+import sys
+from typing import Any, Optional
+
+from .server import ToolLister
+from .server_async import AsyncBatchExecutor, AsyncToolExecutor, handle_request_async
+from .transport_stdio import _PARSE_ERROR, _invalid_json_response, _needs_worker, _parse, write_message
+
+
+DEFAULT_MAX_IN_FLIGHT = 64
+
+
+async def _stdin_reader() -> asyncio.StreamReader:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=2**26)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    return reader
+
+
+async def run_stdio_async(
+    tool_executor: AsyncToolExecutor = None,
+    tool_lister: ToolLister = None,
+    batch_executor: AsyncBatchExecutor = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    reader: Optional[asyncio.StreamReader] = None,
+) -> None:
+    """
+    Serve newline-delimited JSON requests from stdin on the running event loop.
+
+    Up to max_in_flight tool calls are in flight at once, each as a task
+    rather than a thread; other requests are answered as soon as they are
+    read. Responses are written in completion order. reader defaults to a
+    StreamReader attached to sys.stdin.
+
+    No exceptions are propagated.
+    """
+    slots = asyncio.Semaphore(max(1, max_in_flight))
+    tasks = set()
+
+    def write(response: Any) -> None:
+        if response is not None:
+            try:
+                write_message(response)
+            except Exception:  # noqa: BLE001
+                return
+
+    async def work(payload: Any) -> None:
+        try:
+            write(
+                await handle_request_async(
+                    payload,
+                    tool_executor=tool_executor,
+                    tool_lister=tool_lister,
+                    batch_executor=batch_executor,
+                )
+            )
+        finally:
+            slots.release()
+
+    try:
+        if reader is None:
+            reader = await _stdin_reader()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            payload = _parse(line)
+            if payload is _PARSE_ERROR:
+                write(_invalid_json_response())
+                continue
+            if not _needs_worker(payload):
+                write(await handle_request_async(payload, tool_lister=tool_lister))
+                continue
+            await slots.acquire()
+            task = asyncio.create_task(work(payload))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    except Exception:  # noqa: BLE001
+        return
@@ -0,0 +1,130 @@
+"""Unix domain socket transport for MCP Core.
+
+Each connection carries a sequence of length-prefixed frames (see framing.py):
+one request frame, then exactly one response frame. A request that produces
+no response (notifications only) is answered with an empty frame, so the
+request/response pairing never drifts.
+"""
+
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .codec import dumps, loads
+from .framing import FrameError, recv_frame, send_frame
+from .server import handle_request
+from .tracing import TRACER
+from .transport_http import KEEPALIVE_TIMEOUT, _invalid_json_response
+from .workers import BoundedWorkerPool
+
+
+class MCPUnixServer(socketserver.ThreadingUnixStreamServer):
+    """Threaded Unix socket server that owns its socket file and worker pool."""
+
+    daemon_threads = True
+    worker_pool: Optional[BoundedWorkerPool] = None
+
+    def server_bind(self) -> None:
+        _remove_stale_socket(self.server_address)
+        super().server_bind()
+        os.chmod(self.server_address, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.server_address)
+        except OSError:
+            pass
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown()
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Unlink a socket file left behind by a provider that did not shut down cleanly."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        raise OSError(f"{path} is in use by another provider")
+    finally:
+        probe.close()
+
+
+def _build_handler(
+    tool_executor: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None,
+    tool_lister: Optional[Callable[[], list]] = None,
+):
+    class MCPFrameHandler(socketserver.BaseRequestHandler):
+        def handle(self) -> None:
+            sock = self.request
+            sock.settimeout(KEEPALIVE_TIMEOUT)
+            while True:
+                try:
+                    frame = recv_frame(sock)
+                except (OSError, FrameError):
+                    return
+                if frame is None:
+                    return
+                try:
+                    send_frame(sock, self._respond(frame))
+                except OSError:
+                    return
+
+        def _respond(self, frame: bytes) -> bytes:
+            started = time.perf_counter()
+            try:
+                payload = loads(frame)
+            except Exception:  # noqa: BLE001
+                return dumps(_invalid_json_response())
+            if TRACER.enabled:
+                TRACER.parsed(payload, "uds.parse", started)
+            try:
+                response = handle_request(payload, tool_executor=tool_executor, tool_lister=tool_lister)
+                return b"" if response is None else dumps(response)
+            except Exception:  # noqa: BLE001
+                return dumps(_invalid_json_response())
+
+    return MCPFrameHandler
+
+
+def run_uds(
+    path: str,
+    tool_executor: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None,
+    tool_lister: Optional[Callable[[], list]] = None,
+    workers: Optional[int] = None,
+    queue_size: int = 0,
+):
+    """
+    Start a Unix socket server that processes framed MCP requests at path.
+
+    workers and queue_size bound tools/call execution as in run_http. The
+    socket file is created owner-only and removed by server_close(); a stale
+    file from a dead provider is replaced, a live one is left alone.
+
+    Returns the server instance, or None when it could not be started.
+    """
+    try:
+        pool = None
+        if workers is not None and tool_executor is not None:
+            pool = BoundedWorkerPool(workers, queue_size)
+            tool_executor = pool.wrap(tool_executor)
+        handler = _build_handler(tool_executor=tool_executor, tool_lister=tool_lister)
+        server = MCPUnixServer(path, handler)
+        server.worker_pool = pool
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server
+    except Exception:  # noqa: BLE001
+        return None
@@ -0,0 +1,67 @@
+"""Bounded worker pool with admission control for tool execution."""
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from .cancellation import current_request
+from .server import ServerOverloaded
+
+
+class BoundedWorkerPool:
+    """
+    Run tool calls on a fixed number of worker threads.
+
+    At most workers calls run at once and at most queue_size more wait for a
+    free worker; anything beyond that is rejected with ServerOverloaded
+    instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, queue_size: int = 0) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.queue_size = max(0, queue_size)
+        self._slots = threading.BoundedSemaphore(workers + self.queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-worker")
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise ServerOverloaded("server overloaded")
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def wrap(
+        self, tool_executor: Callable[[str, Dict[str, Any]], Dict[str, Any]]
+    ) -> Callable[[str, Dict[str, Any]], Dict[str, Any]]:
+        """
+        Return a tool executor that runs tool_executor on this pool and waits for it.
+
+        The caller's current_request() is visible to tool_executor. A queued
+        call whose request is cancelled or times out is dropped before it
+        starts; a running one is abandoned and its result discarded.
+        """
+
+        def pooled_executor(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+            context = current_request()
+            future = self.submit(contextvars.copy_context().run, tool_executor, tool_name, arguments)
+            if context is None:
+                return future.result()
+            finished = threading.Event()
+            future.add_done_callback(lambda _: finished.set())
+            context.wait(finished)
+            if not future.done():
+                future.cancel()
+                raise context.interruption()
+            return future.result()
+
+        return pooled_executor
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,173 @@
+"""Circuit breaker and health probing in front of a provider connection pool."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from mcp_core.cancellation import RequestContext
+from mcp_core.codec import dumps
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_COOL_DOWN = 5.0
+DEFAULT_PROBE_INTERVAL = 1.0
+DEFAULT_PROBE_TIMEOUT = 2.0
+
+PROBE_BODY = dumps(
+    {"jsonrpc": "2.0", "id": "probe", "method": "tools/call", "params": {"name": "blender.ping", "arguments": {}}}
+)
+
+
+class CircuitOpen(ConnectionRefusedError):
+    """The provider is known to be down; the request was not sent."""
+
+
+class CircuitBreaker:
+    """
+    Closed, open and half-open states over consecutive transport failures.
+
+    failure_threshold consecutive failures open the circuit. While open,
+    allow() refuses every call until cool_down seconds have passed; then it
+    admits a single trial call (half-open) whose outcome closes the circuit
+    or opens it for another cool_down.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cool_down: float = DEFAULT_COOL_DOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cool_down = cool_down
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state(self.clock())
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._state(self.clock())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def failure(self) -> bool:
+        """Record a failed call; return True when the circuit is (now) open."""
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = self.clock()
+                self._trial = False
+                return True
+            return False
+
+    def abandon(self) -> None:
+        """Forget a call that ended without an outcome (the caller gave up)."""
+        with self._lock:
+            self._trial = False
+
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        return HALF_OPEN if now - self._opened_at >= self.cool_down else OPEN
+
+
+class GuardedPool:
+    """
+    A provider pool behind a CircuitBreaker, with background health probes.
+
+    While the circuit is open, post() raises CircuitOpen at once instead of
+    paying for a connect attempt, and a probe thread sends blender.ping every
+    probe_interval seconds; the first answered probe closes the circuit, so
+    traffic resumes as soon as the provider is back. post() has the shape of
+    ConnectionPool.post.
+    """
+
+    def __init__(
+        self,
+        pool: Any,
+        breaker: CircuitBreaker,
+        probe_interval: float = DEFAULT_PROBE_INTERVAL,
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+    ) -> None:
+        self.pool = pool
+        self.breaker = breaker
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self._probing = threading.Lock()
+
+    def post(
+        self,
+        body: bytes,
+        content_type: str = "application/json",
+        context: Optional[RequestContext] = None,
+    ) -> bytes:
+        if not self.breaker.allow():
+            raise CircuitOpen(f"provider {getattr(self.pool, 'url', '')} unavailable (circuit open)")
+        try:
+            data = self.pool.post(body, content_type, context)
+        except Exception:
+            if context is not None and (context.cancelled or context.expired):
+                self.breaker.abandon()
+            elif self.breaker.failure():
+                self._start_probing()
+            raise
+        self.breaker.success()
+        return data
+
+    def probe(self) -> bool:
+        """Send one blender.ping and record the outcome; return True when the provider answered."""
+        try:
+            self.pool.post(PROBE_BODY, context=RequestContext(None, self.probe_timeout))
+        except Exception:  # noqa: BLE001
+            if self.breaker.failure():
+                self._start_probing()
+            return False
+        self.breaker.success()
+        return True
+
+    def prewarm(self) -> None:
+        """Probe in the background so the first real call finds an open connection."""
+        threading.Thread(target=self.probe, name="provider-prewarm", daemon=True).start()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.breaker.state, "probing": self._probing.locked()}
+
+    def _start_probing(self) -> None:
+        if self._probing.acquire(blocking=False):
+            threading.Thread(target=self._probe_until_closed, name="provider-probe", daemon=True).start()
+
+    def _probe_until_closed(self) -> None:
+        try:
+            while self.breaker.state != CLOSED:
+                time.sleep(self.probe_interval)
+                try:
+                    self.pool.post(PROBE_BODY, context=RequestContext(None, self.probe_timeout))
+                except Exception:  # noqa: BLE001
+                    continue
+                self.breaker.success()
+        finally:
+            self._probing.release()
+        # A failure that landed while this thread was exiting found the lock taken.
+        if self.breaker.state != CLOSED:
+            self._start_probing()
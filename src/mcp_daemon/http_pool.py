@@ -0,0 +1,174 @@
+"""Keep-alive HTTP/1.1 connection pool used by the daemon to reach the provider."""
+
+import socket
+import threading
+import time
+from http.client import HTTPConnection, HTTPException, RemoteDisconnected
+from typing import Any, List, Optional, Tuple
+from urllib.parse import SplitResult, urlsplit
+
+from mcp_core.cancellation import RequestContext
+
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 15.0
+
+# Errors that mean a reused keep-alive connection was closed by the peer
+# before our request reached it; the request is safe to replay once.
+_STALE_ERRORS = (RemoteDisconnected, BrokenPipeError, ConnectionResetError, ConnectionAbortedError)
+
+
+class HTTPStatusError(HTTPException):
+    """The provider answered with an HTTP error status; the request did reach it."""
+
+
+class ConnectionPool:
+    """
+    Pool of persistent HTTP/1.1 connections to a single provider URL.
+
+    At most max_size idle connections are kept; connections idle for longer
+    than idle_timeout seconds are closed instead of reused. A request that
+    fails on a reused connection because the peer dropped it is replayed once
+    on a fresh connection.
+
+    post() accepts a RequestContext: the socket timeout is capped at the
+    request's remaining time and cancelling the request aborts the exchange.
+    A connection that saw any error is closed rather than returned to the pool.
+
+    Subclasses for other transports override _bind, _connect, _socket and
+    _send; pooling, replay and deadlines are shared.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.url = url
+        self._bind(urlsplit(url))
+        self.max_size = max(0, max_size)
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: List[Tuple[Any, float]] = []
+        self._lock = threading.Lock()
+
+    def post(
+        self,
+        body: bytes,
+        content_type: str = "application/json",
+        context: Optional[RequestContext] = None,
+    ) -> bytes:
+        """POST body to the pool URL and return the response body."""
+        conn, reused = self._acquire()
+        try:
+            return self._exchange(conn, body, content_type, context)
+        except _STALE_ERRORS:
+            conn.close()
+            if not reused or (context is not None and context.cancelled):
+                raise
+        except BaseException:
+            conn.close()
+            raise
+        conn = self._connect()
+        try:
+            return self._exchange(conn, body, content_type, context)
+        except BaseException:
+            conn.close()
+            raise
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def _bind(self, parts: SplitResult) -> None:
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError(f"unsupported provider url: {self.url}")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    def _connect(self) -> HTTPConnection:
+        return HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self) -> Tuple[HTTPConnection, bool]:
+        now = time.monotonic()
+        expired = []
+        conn = None
+        with self._lock:
+            while self._idle:
+                candidate, released_at = self._idle.pop()
+                if now - released_at > self.idle_timeout:
+                    expired.append(candidate)
+                    # Older entries sit below this one and are stale too.
+                    expired.extend(item for item, _ in self._idle)
+                    self._idle.clear()
+                    break
+                conn = candidate
+                break
+        for stale in expired:
+            stale.close()
+        if conn is not None:
+            return conn, True
+        return self._connect(), False
+
+    def _socket(self, conn: HTTPConnection, timeout: Optional[float]) -> socket.socket:
+        """Return conn's connected socket with timeout applied."""
+        conn.timeout = timeout
+        if conn.sock is None:
+            conn.connect()
+        else:
+            conn.sock.settimeout(timeout)
+        return conn.sock
+
+    def _release(self, conn: Any) -> None:
+        # A per-request deadline must not leak into the next request.
+        self._socket(conn, self.timeout)
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def _exchange(self, conn: Any, body: bytes, content_type: str, context: Optional[RequestContext]) -> bytes:
+        if context is None:
+            return self._send(conn, body, content_type)
+        context.check()
+        timeout = context.remaining()
+        if self.timeout is not None and (timeout is None or self.timeout < timeout):
+            timeout = self.timeout
+        sock = self._socket(conn, timeout)
+        # Shutting the socket down wakes a thread blocked reading the response.
+        remove = context.on_cancel(lambda: _abort(sock))
+        try:
+            return self._send(conn, body, content_type)
+        finally:
+            remove()
+
+    def _send(self, conn: HTTPConnection, body: bytes, content_type: str) -> bytes:
+        conn.request("POST", self.path, body=body, headers={"Content-Type": content_type})
+        resp = conn.getresponse()
+        data = resp.read()
+        if resp.status >= 400:
+            # post() closes the connection; it must not be in the idle list by then.
+            raise HTTPStatusError(f"HTTP {resp.status}: {resp.reason}")
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return data
+
+
+def _abort(sock: socket.socket) -> None:
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
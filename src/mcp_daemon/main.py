@@ -1,96 +1,340 @@
-"""MCP daemon bridging stdio transport to Blender HTTP provider."""
+"""MCP daemon bridging stdio transport to Blender HTTP provider (or local Blender workers)."""
 
-import json
+import itertools
 import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
-from urllib import request
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 SRC_DIR = Path(__file__).resolve().parents[1]
 if SRC_DIR and str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
+from mcp_core.cancellation import (  # noqa: E402
+    RequestCancelled,
+    RequestContext,
+    RequestTimeout,
+    current_batch,
+    current_request,
+)
+from mcp_core.codec import dumps, loads  # noqa: E402
+from mcp_core.metrics import METRICS, with_metrics_batch, with_metrics_tool  # noqa: E402
+from mcp_core.server import REQUEST_CANCELLED, REQUEST_TIMEOUT  # noqa: E402
+from mcp_core.tracing import TRACER  # noqa: E402
+from mcp_core.transport_stdio import NEWLINE, serve_stdio  # noqa: E402
+from mcp_daemon.circuit import (  # noqa: E402
+    DEFAULT_COOL_DOWN,
+    DEFAULT_FAILURE_THRESHOLD as DEFAULT_BREAKER_FAILURES,
+    DEFAULT_PROBE_INTERVAL,
+    CircuitBreaker,
+    GuardedPool,
+)
+from mcp_daemon.http_pool import DEFAULT_IDLE_TIMEOUT, DEFAULT_POOL_SIZE, ConnectionPool  # noqa: E402
+from mcp_daemon.routing import (  # noqa: E402
+    DEFAULT_EJECTION_TIME,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_LISTING_TTL,
+    LEAST_OUTSTANDING,
+    ProviderRouter,
+)
+from mcp_daemon.uds_pool import UnixConnectionPool  # noqa: E402
+from mcp_daemon.worker_pool import BlenderWorkerPool  # noqa: E402
+
 DEFAULT_URL = "http://127.0.0.1:8765/mcp"
+DEFAULT_TIMEOUT = 120.0
 ToolExecutor = Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]]
-
-
-def _invalid_json_response() -> Dict[str, Any]:
-    return {
-        "jsonrpc": "2.0",
-        "id": None,
-        "error": {"code": -32700, "message": "parse error"},
-    }
-
-
-def _write_response(response: Dict[str, Any]) -> None:
-    try:
-        sys.stdout.write(json.dumps(response) + "\n")
-        sys.stdout.flush()
-    except Exception:  # noqa: BLE001
-        return
+BatchExecutor = Optional[Callable[[List[Tuple[str, Dict[str, Any]]]], List[Any]]]
 
 
 def handle_stdio_payload(
     payload: Any,
     tool_executor: ToolExecutor = None,
     tool_lister: Optional[Callable[[], list]] = None,
-) -> Dict[str, Any]:
+    batch_executor: BatchExecutor = None,
+) -> Any:
     from mcp_core.server import handle_request
 
-    return handle_request(payload, tool_executor=tool_executor, tool_lister=tool_lister)
+    return handle_request(
+        payload,
+        tool_executor=tool_executor,
+        tool_lister=tool_lister,
+        batch_executor=batch_executor,
+    )
 
 
 def run_stdio_with_initialize(
-    tool_executor: ToolExecutor = None, tool_lister: Optional[Callable[[], list]] = None
+    tool_executor: ToolExecutor = None,
+    tool_lister: Optional[Callable[[], list]] = None,
+    batch_executor: BatchExecutor = None,
+    max_in_flight: int = 1,
+    framing: str = NEWLINE,
 ) -> None:
     try:
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except Exception:  # noqa: BLE001
-                response = _invalid_json_response()
-            else:
-                response = handle_stdio_payload(
-                    payload,
-                    tool_executor=tool_executor,
-                    tool_lister=tool_lister,
-                )
-
-            if response is None:
-                continue
-            _write_response(response)
+        serve_stdio(
+            lambda payload: handle_stdio_payload(
+                payload,
+                tool_executor=tool_executor,
+                tool_lister=tool_lister,
+                batch_executor=batch_executor,
+            ),
+            max_in_flight=max_in_flight,
+            framing=framing,
+        )
     except Exception:  # noqa: BLE001
         return
 
 
-def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-    """Proxy tools/call to Blender HTTP provider."""
-    url = os.getenv("BLENDER_MCP_HTTP_URL", DEFAULT_URL)
-    payload = {
-        "jsonrpc": "2.0",
-        "id": "1",
-        "method": "tools/call",
-        "params": {"tool": tool_name, "arguments": arguments or {}},
-    }
+_POOLS: Dict[str, ConnectionPool] = {}
+_GUARDED: Dict[str, GuardedPool] = {}
+_POOLS_LOCK = threading.Lock()
+_WORKERS: Optional[BlenderWorkerPool] = None
+_ROUTER: Optional[ProviderRouter] = None
+_PROXY_IDS = itertools.count(1)
+# Merged provider tools/list: (tools, expiry); the same list is served until it expires.
+_LISTING: Tuple[Optional[list], float] = (None, 0.0)
+
 
-    data = json.dumps(payload).encode("utf-8")
-    req = request.Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
+def _env_number(name: str, default: Any, cast: Callable[[str], Any]) -> Any:
     try:
-        with request.urlopen(req) as resp:
-            body = resp.read().decode("utf-8")
+        return cast(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def _pool_for(url: str) -> ConnectionPool:
+    pool = _POOLS.get(url)
+    if pool is not None:
+        return pool
+    with _POOLS_LOCK:
+        pool = _POOLS.get(url)
+        if pool is None:
+            # unix:///path/to.sock selects the framed Unix socket transport.
+            pool_class = UnixConnectionPool if url.startswith("unix:") else ConnectionPool
+            pool = pool_class(
+                url,
+                max_size=_env_number("BLENDER_MCP_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE, int),
+                idle_timeout=_env_number("BLENDER_MCP_HTTP_POOL_IDLE", DEFAULT_IDLE_TIMEOUT, float),
+            )
+            _POOLS[url] = pool
+        return pool
+
+
+def _guarded_pool_for(url: str) -> GuardedPool:
+    """
+    The pool for url behind a circuit breaker.
+
+    BLENDER_MCP_BREAKER_FAILURES consecutive failures open the circuit for
+    BLENDER_MCP_BREAKER_COOLDOWN seconds, during which calls fail fast and
+    blender.ping probes run every BLENDER_MCP_PROBE_INTERVAL seconds.
+    """
+    guarded = _GUARDED.get(url)
+    if guarded is not None:
+        return guarded
+    pool = _pool_for(url)
+    with _POOLS_LOCK:
+        guarded = _GUARDED.get(url)
+        if guarded is None:
+            breaker = CircuitBreaker(
+                failure_threshold=_env_number("BLENDER_MCP_BREAKER_FAILURES", DEFAULT_BREAKER_FAILURES, int),
+                cool_down=_env_number("BLENDER_MCP_BREAKER_COOLDOWN", DEFAULT_COOL_DOWN, float),
+            )
+            guarded = GuardedPool(
+                pool, breaker, probe_interval=_env_number("BLENDER_MCP_PROBE_INTERVAL", DEFAULT_PROBE_INTERVAL, float)
+            )
+            _GUARDED[url] = guarded
+        return guarded
+
+
+def _worker_pool() -> Optional[BlenderWorkerPool]:
+    """
+    Local Blender workers when BLENDER_MCP_WORKERS > 0, started on first use.
+
+    BLENDER_MCP_WORKER_AFFINITY=session pins every call to one worker so a
+    client edits a single scene; the default spreads calls by load.
+    """
+    size = _env_number("BLENDER_MCP_WORKERS", 0, int)
+    if size <= 0:
+        return None
+    global _WORKERS
+    if _WORKERS is not None:
+        return _WORKERS
+    with _POOLS_LOCK:
+        if _WORKERS is None:
+            pin_all = os.getenv("BLENDER_MCP_WORKER_AFFINITY", "none") == "session"
+            _WORKERS = BlenderWorkerPool(size, pin_all=pin_all)
+        return _WORKERS
+
+
+def _router() -> Optional[ProviderRouter]:
+    """
+    Router over BLENDER_MCP_PROVIDERS ("url,url,..."), created on first use.
+
+    BLENDER_MCP_ROUTING picks round_robin, least_outstanding (default) or
+    consistent_hash; BLENDER_MCP_EJECT_AFTER failures eject a backend for
+    BLENDER_MCP_EJECT_SECONDS. BLENDER_MCP_SESSION is the hash key of calls
+    that carry no params._meta.session.
+    """
+    global _ROUTER
+    if _ROUTER is not None:
+        return _ROUTER
+    urls = [url.strip() for url in os.getenv("BLENDER_MCP_PROVIDERS", "").split(",") if url.strip()]
+    if not urls:
+        return None
+    with _POOLS_LOCK:
+        if _ROUTER is None:
+            _ROUTER = ProviderRouter(
+                urls,
+                _guarded_pool_for,
+                policy=os.getenv("BLENDER_MCP_ROUTING", LEAST_OUTSTANDING),
+                failure_threshold=_env_number("BLENDER_MCP_EJECT_AFTER", DEFAULT_FAILURE_THRESHOLD, int),
+                ejection_time=_env_number("BLENDER_MCP_EJECT_SECONDS", DEFAULT_EJECTION_TIME, float),
+                default_key=os.getenv("BLENDER_MCP_SESSION", ""),
+            )
+        return _ROUTER
+
+
+def _provider_pool() -> Any:
+    workers = _worker_pool()
+    if workers is not None:
+        return workers
+    router = _router()
+    if router is not None:
+        return router
+    return _guarded_pool_for(os.getenv("BLENDER_MCP_HTTP_URL", DEFAULT_URL))
+
+
+def _prewarm() -> None:
+    """Connect to the providers in the background so the first call does not pay for it."""
+    if _worker_pool() is not None:
+        # Workers are spawned by _worker_pool() itself.
+        return
+    router = _router()
+    if router is not None:
+        for backend in router.backends:
+            backend.pool.prewarm()
+    else:
+        _provider_pool().prewarm()
+
+
+def list_tools() -> list:
+    """
+    Tools offered to the client: the local blender_tools listing, or with
+    several providers the union of their tools/list, cached for
+    BLENDER_MCP_LISTING_TTL seconds.
+    """
+    from blender_tools import list_tools as local_tools
+
+    global _LISTING
+    router = _router()
+    if router is None:
+        return local_tools()
+    tools, expires = _LISTING
+    now = time.monotonic()
+    if tools is None or now >= expires:
+        tools = router.list_tools() or local_tools()
+        _LISTING = (tools, now + _env_number("BLENDER_MCP_LISTING_TTL", DEFAULT_LISTING_TTL, float))
+    return tools
+
+
+def _tool_timeout(tool_name: str) -> Optional[float]:
+    """
+    Per-tool deadline from BLENDER_MCP_TOOL_TIMEOUTS ("name=seconds,..."),
+    else BLENDER_MCP_TIMEOUT, else DEFAULT_TIMEOUT. Zero or less means no
+    deadline.
+    """
+    timeout = _env_number("BLENDER_MCP_TIMEOUT", DEFAULT_TIMEOUT, float)
+    for entry in os.getenv("BLENDER_MCP_TOOL_TIMEOUTS", "").split(","):
+        name, _, seconds = entry.partition("=")
+        if name.strip() == tool_name:
+            try:
+                timeout = float(seconds)
+            except ValueError:
+                pass
+            break
+    return timeout if timeout > 0 else None
+
+
+def _proxy_context(tool_name: str, parent: Optional[RequestContext] = None) -> Optional[RequestContext]:
+    """
+    Context bounding one proxied call by the client's deadline and the tool's
+    own timeout. parent defaults to the current request.
+    """
+    if parent is None:
+        parent = current_request()
+    timeout = _tool_timeout(tool_name)
+    if parent is None:
+        return None if timeout is None else RequestContext(None, timeout)
+    remaining = parent.remaining()
+    if remaining is not None and (timeout is None or remaining < timeout):
+        timeout = remaining
+    context = RequestContext(parent.request_id, timeout, parent.meta)
+    parent.on_cancel(context.cancel)
+    return context
+
+
+def _post_json(payload: Any, context: Optional[RequestContext] = None) -> Any:
+    try:
+        body = _provider_pool().post(dumps(payload), context=context)
     except Exception as exc:  # noqa: BLE001
-        raise RuntimeError(f"http error: {exc}") from exc
+        if context is not None and (context.cancelled or context.expired or isinstance(exc, TimeoutError)):
+            raise context.interruption() from exc
+        raise RuntimeError(f"transport error: {exc}") from exc
 
     try:
-        response = json.loads(body)
+        return loads(body)
     except Exception as exc:  # noqa: BLE001
         raise RuntimeError("invalid json response") from exc
 
+
+def _notify(payload: Any) -> None:
+    if _worker_pool() is not None:
+        # A stdio worker answers nothing to a notification and reads none while
+        # busy; abandoning the call already drops it if it is still queued.
+        return
+    router = _router()
+    if router is not None:
+        router.broadcast(dumps(payload))
+        return
+    url = os.getenv("BLENDER_MCP_HTTP_URL", DEFAULT_URL)
+    try:
+        _pool_for(url).post(dumps(payload))
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _forward_cancel(request_id: Any) -> None:
+    """Tell the provider to stop working on request_id without blocking the caller."""
+    payload = {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": request_id}}
+    threading.Thread(target=_notify, args=(payload,), daemon=True).start()
+
+
+def _call_payload(
+    request_id: Any,
+    tool_name: str,
+    arguments: Dict[str, Any],
+    timeout: Optional[float] = None,
+    trace: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"tool": tool_name, "arguments": arguments or {}}
+    meta: Dict[str, Any] = {}
+    if timeout is not None:
+        meta["timeout"] = timeout
+    if trace is not None:
+        meta["trace"] = trace
+    if meta:
+        params["_meta"] = meta
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": params,
+    }
+
+
+def _unwrap_response(response: Any) -> Dict[str, Any]:
     if isinstance(response, dict) and "result" in response:
         result = response.get("result")
         if isinstance(result, dict):
@@ -101,16 +345,224 @@ def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         error = response.get("error") or {}
         code = error.get("code")
         message = error.get("message")
+        # Keep the provider's timeout/cancellation codes instead of a generic execution error.
+        if code == REQUEST_TIMEOUT:
+            raise RequestTimeout(message or "request timed out")
+        if code == REQUEST_CANCELLED:
+            raise RequestCancelled(message or "request cancelled")
         raise RuntimeError(f"{code}: {message}")
 
     raise RuntimeError("invalid response")
 
 
-def main() -> None:
+def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Proxy tools/call to Blender HTTP provider.
+
+    The call is bounded by the client's deadline and the tool's configured
+    timeout, which is also sent to the provider in params._meta.timeout.
+    Cancelling the client request aborts the HTTP exchange and forwards
+    notifications/cancelled to the provider.
+
+    The round trip is recorded in METRICS under the "proxy" scope, with
+    errors counted by exception type.
+    """
+    started = time.perf_counter()
+    error = None
     try:
-        from blender_tools import list_tools
+        return _proxy_call(tool_name, arguments)
+    except Exception as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        METRICS.observe("proxy", tool_name, time.perf_counter() - started, error)
+
+
+def _proxy_call(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    request = current_request()
+    if request is None or request.span is None:
+        return _send_call(tool_name, arguments)
+    # The provider's spans for this call become children of the hop.
+    with request.span.child("proxy.hop", tool=tool_name) as span:
+        return _send_call(tool_name, arguments, span.propagate())
+
+
+def _send_call(tool_name: str, arguments: Dict[str, Any], trace: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    context = _proxy_context(tool_name)
+    if context is None:
+        return _unwrap_response(_post_json(_call_payload(_proxy_id(), tool_name, arguments, trace=trace)))
+
+    # Reuse the client's id so provider logs and cancellations correlate with it.
+    request_id = _proxy_id() if context.request_id is None else context.request_id
+    remove = context.on_cancel(lambda: _forward_cancel(request_id))
+    try:
+        payload = _call_payload(request_id, tool_name, arguments, context.remaining(), trace)
+        return _unwrap_response(_post_json(payload, context))
+    finally:
+        remove()
+
+
+def _proxy_id() -> str:
+    """An id for a proxied call that has no client request id to reuse."""
+    return f"daemon-{next(_PROXY_IDS)}"
+
+
+def _batch_ids(contexts: List[Optional[RequestContext]]) -> List[Any]:
+    """Each member's client request id, or a fresh id where it is missing or repeated within the batch."""
+    ids: List[Any] = []
+    seen = set()
+    for context in contexts:
+        request_id = context.request_id if context is not None else None
+        if not isinstance(request_id, (str, int)) or request_id in seen:
+            request_id = _proxy_id()
+        seen.add(request_id)
+        ids.append(request_id)
+    return ids
+
 
-        run_stdio_with_initialize(tool_executor=execute_tool, tool_lister=list_tools)
+def _batch_payload(
+    calls: List[Tuple[str, Dict[str, Any]]],
+    ids: List[Any],
+    timeouts: Optional[List[Optional[float]]] = None,
+    traces: Optional[List[Optional[Dict[str, Any]]]] = None,
+) -> List[Dict[str, Any]]:
+    timeouts = timeouts or [None] * len(calls)
+    traces = traces or [None] * len(calls)
+    return [
+        _call_payload(request_id, name, arguments, timeout, trace)
+        for (name, arguments), request_id, timeout, trace in zip(calls, ids, timeouts, traces)
+    ]
+
+
+def _unwrap_batch(responses: Any, ids: List[Any]) -> List[Any]:
+    if not isinstance(responses, list):
+        # A provider rejects a whole batch with a single error object.
+        try:
+            _unwrap_response(responses)
+        except RuntimeError as exc:
+            return [exc] * len(ids)
+        raise RuntimeError("invalid batch response")
+
+    by_id = {item.get("id"): item for item in responses if isinstance(item, dict)}
+    results: List[Any] = []
+    for request_id in ids:
+        try:
+            results.append(_unwrap_response(by_id.get(request_id)))
+        except RuntimeError as exc:
+            results.append(exc)
+    return results
+
+
+def _batch_context(contexts: List[Optional[RequestContext]]) -> Optional[RequestContext]:
+    """
+    One context for the whole batch POST: it expires with the latest member
+    deadline and is cancelled once every member is. None when a member is
+    unbounded, so the POST is not cut short under it.
+    """
+    if not contexts or any(context is None for context in contexts):
+        return None
+    remaining = [context.remaining() for context in contexts]
+    timeout = None if any(value is None for value in remaining) else max(remaining)
+    # The first member's _meta (e.g. its session) routes the batch.
+    batch = RequestContext(None, timeout, contexts[0].meta)
+    pending = [len(contexts)]
+    lock = threading.Lock()
+
+    def member_cancelled() -> None:
+        with lock:
+            pending[0] -= 1
+            cancelled = pending[0] == 0
+        if cancelled:
+            batch.cancel()
+
+    for context in contexts:
+        context.on_cancel(member_cancelled)
+    return batch
+
+
+def execute_tool_batch(calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+    """
+    Proxy several tools/call requests to the Blender HTTP provider in one POST.
+
+    Like execute_tool, each member keeps its client request id, gets its own
+    deadline (from current_batch() and the tool's timeout) in
+    params._meta.timeout, forwards notifications/cancelled when it is
+    cancelled, and is traced under its own "proxy.hop" span carried in
+    params._meta.trace. The POST itself gives up at the latest member
+    deadline.
+
+    Each member's round trip is recorded in METRICS under the "proxy" scope,
+    with the batch's latency.
+
+    Returns one result dict or RuntimeError per call, in call order.
+    """
+    started = time.perf_counter()
+    try:
+        results = _proxy_batch(calls)
+    except Exception as exc:
+        _observe_batch(calls, [exc] * len(calls), started)
+        raise
+    _observe_batch(calls, results, started)
+    return results
+
+
+def _observe_batch(calls: List[Tuple[str, Dict[str, Any]]], results: List[Any], started: float) -> None:
+    elapsed = time.perf_counter() - started
+    for (name, _), result in zip(calls, results):
+        METRICS.observe("proxy", name, elapsed, type(result).__name__ if isinstance(result, Exception) else None)
+
+
+def _proxy_batch(calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+    members = current_batch()
+    if members is None or len(members) != len(calls):
+        members = [None] * len(calls)
+    contexts = [_proxy_context(name, member) for (name, _), member in zip(calls, members)]
+    ids = _batch_ids(contexts)
+    timeouts = [context.remaining() if context is not None else None for context in contexts]
+    # Each member's provider spans become children of its own hop.
+    hops = [
+        member.span.child("proxy.hop", tool=name) if member is not None and member.span is not None else None
+        for (name, _), member in zip(calls, members)
+    ]
+    traces = [hop.propagate() if hop is not None else None for hop in hops]
+    removers = [
+        context.on_cancel(lambda request_id=request_id: _forward_cancel(request_id))
+        for context, request_id in zip(contexts, ids)
+        if context is not None
+    ]
+    try:
+        payload = _batch_payload(calls, ids, timeouts, traces)
+        results = _unwrap_batch(_post_json(payload, _batch_context(contexts)), ids)
+    except Exception as exc:
+        _end_hops(hops, [exc] * len(calls))
+        raise
+    finally:
+        for remove in removers:
+            remove()
+    _end_hops(hops, results)
+    return results
+
+
+def _end_hops(hops: List[Any], results: List[Any]) -> None:
+    for hop, result in zip(hops, results):
+        if hop is not None:
+            hop.end(error=type(result).__name__ if isinstance(result, Exception) else None)
+
+
+def main() -> None:
+    try:
+        if _env_number("BLENDER_MCP_PREWARM", 1, int):
+            _prewarm()
+        TRACER.service = "daemon"
+        # hephaestus.metrics answers from this process, without a provider round trip.
+        tool_executor, tool_lister = with_metrics_tool(execute_tool, list_tools)
+        run_stdio_with_initialize(
+            tool_executor=tool_executor,
+            tool_lister=tool_lister,
+            batch_executor=with_metrics_batch(execute_tool_batch),
+            max_in_flight=_env_number("BLENDER_MCP_MAX_IN_FLIGHT", 1, int),
+            framing=os.getenv("BLENDER_MCP_STDIO_FRAMING", NEWLINE),
+        )
     except KeyboardInterrupt:
         return
     except Exception as exc:  # noqa: BLE001
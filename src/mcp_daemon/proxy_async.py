@@ -0,0 +1,313 @@
+"""Asyncio daemon: stdio front end proxying tool calls to the Blender HTTP provider.
+
+One event loop multiplexes every in-flight call over a small pool of
+keep-alive connections instead of holding a thread per request.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import SplitResult, unquote, urlsplit
+
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+if SRC_DIR and str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from mcp_core.cancellation import RequestContext, RequestTimeout, current_batch, current_request  # noqa: E402
+from mcp_core.codec import dumps, loads  # noqa: E402
+from mcp_core.framing import HEADER, MAX_FRAME_SIZE, FrameError, encode_frame  # noqa: E402
+from mcp_core.metrics import METRICS  # noqa: E402
+from mcp_daemon.http_pool import DEFAULT_POOL_SIZE, HTTPStatusError  # noqa: E402
+from mcp_daemon.main import (  # noqa: E402
+    DEFAULT_URL,
+    _batch_ids,
+    _batch_payload,
+    _call_payload,
+    _env_number,
+    _proxy_id,
+    _tool_timeout,
+    _unwrap_batch,
+    _unwrap_response,
+)
+
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class AsyncConnectionPool:
+    """
+    Keep-alive HTTP/1.1 client for one provider URL on the running loop.
+
+    At most max_size idle connections are kept. A request that fails on a
+    reused connection because the peer closed it is replayed once.
+    """
+
+    def __init__(self, url: str, max_size: int = DEFAULT_POOL_SIZE) -> None:
+        self.url = url
+        self._bind(urlsplit(url))
+        self.max_size = max(0, max_size)
+        self._idle: List[Connection] = []
+
+    async def post(self, body: bytes) -> bytes:
+        reused = bool(self._idle)
+        connection = self._idle.pop() if reused else await self._connect()
+        try:
+            return await self._send(connection, body)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            connection[1].close()
+            if not reused:
+                raise
+        except BaseException:
+            connection[1].close()
+            raise
+        connection = await self._connect()
+        try:
+            return await self._send(connection, body)
+        except BaseException:
+            connection[1].close()
+            raise
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+
+    def _bind(self, parts: SplitResult) -> None:
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError(f"unsupported provider url: {self.url}")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    async def _connect(self) -> Connection:
+        return await asyncio.open_connection(self.host, self.port)
+
+    def _keep(self, connection: Connection) -> None:
+        if len(self._idle) >= self.max_size:
+            connection[1].close()
+        else:
+            self._idle.append(connection)
+
+    async def _send(self, connection: Connection, body: bytes) -> bytes:
+        reader, writer = connection
+        head = (
+            f"POST {self.path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readuntil(b"\r\n")
+        status = int(status_line.split(b" ", 2)[1])
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0) or 0)
+        data = await reader.readexactly(length) if length > 0 else b""
+
+        if status >= 400:
+            # Not a ConnectionError: the provider got the request, so it must not be replayed.
+            raise HTTPStatusError(f"HTTP {status}")
+        if headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self._keep(connection)
+        return data
+
+
+class AsyncUnixConnectionPool(AsyncConnectionPool):
+    """Framed Unix socket client for unix:///path/to.sock; see mcp_core.transport_uds."""
+
+    def _bind(self, parts: SplitResult) -> None:
+        if parts.scheme != "unix" or not parts.path:
+            raise ValueError(f"unsupported provider url: {self.url}")
+        self.path = unquote(parts.path)
+
+    async def _connect(self) -> Connection:
+        return await asyncio.open_unix_connection(self.path)
+
+    async def _send(self, connection: Connection, body: bytes) -> bytes:
+        reader, writer = connection
+        writer.write(encode_frame(body))
+        await writer.drain()
+        (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+        if length > MAX_FRAME_SIZE:
+            raise FrameError(f"frame of {length} bytes exceeds {MAX_FRAME_SIZE}")
+        data = await reader.readexactly(length) if length else b""
+        self._keep(connection)
+        return data
+
+
+# Streams belong to the loop that opened them, so pools are kept per loop.
+_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncConnectionPool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pool_for(url: str) -> AsyncConnectionPool:
+    pools = _POOLS.setdefault(asyncio.get_running_loop(), {})
+    pool = pools.get(url)
+    if pool is None:
+        pool_class = AsyncUnixConnectionPool if url.startswith("unix:") else AsyncConnectionPool
+        pool = pools[url] = pool_class(
+            url, max_size=_env_number("BLENDER_MCP_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE, int)
+        )
+    return pool
+
+
+async def _post_json(payload: Any) -> Any:
+    url = os.getenv("BLENDER_MCP_HTTP_URL", DEFAULT_URL)
+    try:
+        body = await _pool_for(url).post(dumps(payload))
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError(f"transport error: {exc}") from exc
+
+    try:
+        return loads(body)
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError("invalid json response") from exc
+
+
+async def _notify(payload: Any) -> None:
+    url = os.getenv("BLENDER_MCP_HTTP_URL", DEFAULT_URL)
+    try:
+        await _pool_for(url).post(dumps(payload))
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _call_timeout(tool_name: str, context: Optional[RequestContext]) -> Optional[float]:
+    """The tool's timeout, shortened to the client's remaining deadline."""
+    timeout = _tool_timeout(tool_name)
+    if context is not None:
+        remaining = context.remaining()
+        if remaining is not None and (timeout is None or remaining < timeout):
+            timeout = remaining
+    return timeout
+
+
+def _cancel_notice(request_id: Any) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": request_id}}
+
+
+async def execute_tool_async(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Proxy tools/call to Blender HTTP provider without blocking the loop.
+
+    Deadlines, cancellation, ids, tracing and metrics follow
+    main.execute_tool: the effective timeout is sent in params._meta.timeout,
+    a cancelled call forwards notifications/cancelled to the provider, the
+    hop is a "proxy.hop" span carried in params._meta.trace and the round
+    trip is recorded under the "proxy" scope.
+    """
+    started = time.perf_counter()
+    error = None
+    try:
+        return await _proxy_call(tool_name, arguments)
+    except (Exception, asyncio.CancelledError) as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        METRICS.observe("proxy", tool_name, time.perf_counter() - started, error)
+
+
+async def _proxy_call(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    request = current_request()
+    if request is None or request.span is None:
+        return await _send_call(tool_name, arguments)
+    # The provider's spans for this call become children of the hop.
+    with request.span.child("proxy.hop", tool=tool_name) as span:
+        return await _send_call(tool_name, arguments, span.propagate())
+
+
+async def _send_call(
+    tool_name: str, arguments: Dict[str, Any], trace: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    context = current_request()
+    timeout = _call_timeout(tool_name, context)
+    # Reuse the client's id so provider logs and cancellations correlate with it.
+    request_id = context.request_id if context is not None and context.request_id is not None else _proxy_id()
+    payload = _call_payload(request_id, tool_name, arguments, timeout, trace)
+    try:
+        response = await asyncio.wait_for(_post_json(payload), timeout)
+    except asyncio.TimeoutError:
+        raise RequestTimeout("request timed out") from None
+    except asyncio.CancelledError:
+        if context is not None and context.cancelled:
+            asyncio.ensure_future(_notify(_cancel_notice(request_id)))
+        raise
+    return _unwrap_response(response)
+
+
+async def execute_tool_batch_async(calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+    """
+    Proxy several tools/call requests in one POST; see main.execute_tool_batch.
+
+    Each member carries its own deadline in params._meta.timeout and a
+    cancelled member forwards notifications/cancelled; the POST gives up at
+    the latest member deadline.
+    """
+    members = current_batch()
+    if members is None or len(members) != len(calls):
+        members = [None] * len(calls)
+    timeouts = [_call_timeout(name, member) for (name, _), member in zip(calls, members)]
+    ids = _batch_ids(members)
+    loop = asyncio.get_running_loop()
+
+    def forward(request_id: Any) -> None:
+        loop.call_soon_threadsafe(lambda: asyncio.ensure_future(_notify(_cancel_notice(request_id))))
+
+    removers = [
+        member.on_cancel(lambda request_id=request_id: forward(request_id))
+        for member, request_id in zip(members, ids)
+        if member is not None
+    ]
+    bound = None if any(timeout is None for timeout in timeouts) else max(timeouts)
+    try:
+        response = await asyncio.wait_for(_post_json(_batch_payload(calls, ids, timeouts)), bound)
+    except asyncio.TimeoutError:
+        raise RequestTimeout("request timed out") from None
+    finally:
+        for remove in removers:
+            remove()
+    return _unwrap_batch(response, ids)
+
+
+async def run_daemon_async(reader: Optional[asyncio.StreamReader] = None) -> None:
+    from blender_tools import list_tools
+    from mcp_core.transport_stdio_async import DEFAULT_MAX_IN_FLIGHT, run_stdio_async
+
+    await run_stdio_async(
+        tool_executor=execute_tool_async,
+        tool_lister=list_tools,
+        batch_executor=execute_tool_batch_async,
+        max_in_flight=_env_number("BLENDER_MCP_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT, int),
+        reader=reader,
+    )
+
+
+def main() -> None:
+    try:
+        asyncio.run(run_daemon_async())
+    except KeyboardInterrupt:
+        return
+    except Exception as exc:  # noqa: BLE001
+        try:
+            sys.stderr.write(f"daemon error: {exc}\n")
+        except Exception:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Route proxied requests across several provider endpoints."""
+
+import hashlib
+import itertools
+import threading
+import time
+from bisect import bisect_right
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from mcp_core.cancellation import RequestContext
+from mcp_core.codec import dumps, loads
+
+
+ROUND_ROBIN = "round_robin"
+LEAST_OUTSTANDING = "least_outstanding"
+CONSISTENT_HASH = "consistent_hash"
+POLICIES = (ROUND_ROBIN, LEAST_OUTSTANDING, CONSISTENT_HASH)
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_EJECTION_TIME = 30.0
+DEFAULT_LISTING_TTL = 30.0
+DEFAULT_LISTING_TIMEOUT = 2.0
+# Points per backend on the hash ring; more points even out the key spread.
+RING_REPLICAS = 64
+
+# The request never reached the backend, so it is safe to send elsewhere.
+_UNREACHABLE_ERRORS = (ConnectionRefusedError, FileNotFoundError)
+
+
+class Backend:
+    """One provider endpoint, its connection pool and its health."""
+
+    def __init__(self, url: str, pool: Any) -> None:
+        self.url = url
+        self.pool = pool
+        self.outstanding = 0
+        self.failures = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.errors = 0
+
+    def available(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": self.available(now),
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "errors": self.errors,
+        }
+
+
+def _ring_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class ProviderRouter:
+    """
+    Spread proxied requests over provider endpoints by policy.
+
+    round_robin cycles through the healthy backends; least_outstanding picks
+    the one with the fewest requests in flight; consistent_hash maps a key
+    (params._meta.session of the client's request, else default_key) onto a
+    hash ring so a session keeps reaching the same Blender scene, and only
+    the keys of a backend that leaves move elsewhere.
+
+    A backend is ejected for ejection_time seconds after failure_threshold
+    consecutive transport failures; once the time is up it gets traffic
+    again, and a single further failure ejects it anew. When every backend
+    is ejected, all are tried rather than failing outright. A request that
+    could not connect at all is retried on the next backend.
+
+    post() has the shape of ConnectionPool.post, so the daemon can use either.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        pool_for: Callable[[str], Any],
+        policy: str = LEAST_OUTSTANDING,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        ejection_time: float = DEFAULT_EJECTION_TIME,
+        default_key: str = "",
+    ) -> None:
+        if not urls:
+            raise ValueError("at least one provider url is required")
+        if policy not in POLICIES:
+            raise ValueError(f"unknown routing policy: {policy}")
+        self.policy = policy
+        self.failure_threshold = max(1, failure_threshold)
+        self.ejection_time = ejection_time
+        self.default_key = default_key
+        self.backends = [Backend(url, pool_for(url)) for url in dict.fromkeys(urls)]
+        self._lock = threading.Lock()
+        self._turn = itertools.count()
+        self._ring: List[Tuple[int, int]] = sorted(
+            (_ring_hash(f"{backend.url}#{replica}"), index)
+            for index, backend in enumerate(self.backends)
+            for replica in range(RING_REPLICAS)
+        )
+        self._ring_points = [point for point, _ in self._ring]
+
+    def post(
+        self,
+        body: bytes,
+        content_type: str = "application/json",
+        context: Optional[RequestContext] = None,
+    ) -> bytes:
+        """Send body to a backend chosen by policy and return the response body."""
+        key = self._key(context)
+        tried: List[Backend] = []
+        while True:
+            backend = self._choose(key, tried)
+            tried.append(backend)
+            with self._lock:
+                backend.outstanding += 1
+                backend.requests += 1
+            try:
+                data = backend.pool.post(body, content_type, context)
+            except Exception as exc:  # noqa: BLE001
+                interrupted = context is not None and (context.cancelled or context.expired)
+                if not interrupted:
+                    self._failed(backend)
+                if interrupted or not isinstance(exc, _UNREACHABLE_ERRORS) or len(tried) == len(self.backends):
+                    raise
+            else:
+                self._succeeded(backend)
+                return data
+            finally:
+                with self._lock:
+                    backend.outstanding -= 1
+
+    def broadcast(self, body: bytes) -> None:
+        """Send a notification to every healthy backend, ignoring failures."""
+        now = time.monotonic()
+        for backend in self.backends:
+            if backend.available(now):
+                try:
+                    backend.pool.post(body)
+                except Exception:  # noqa: BLE001
+                    pass
+
+    def list_tools(self, timeout: float = DEFAULT_LISTING_TIMEOUT) -> Optional[list]:
+        """
+        Return the union of the healthy backends' tools/list by tool name.
+
+        The first backend to list a name wins. Returns None when no backend
+        answered, so callers can fall back to a local listing.
+        """
+        body = dumps({"jsonrpc": "2.0", "id": "tools", "method": "tools/list", "params": {}})
+        merged: Dict[str, Any] = {}
+        answered = False
+        now = time.monotonic()
+        for backend in self.backends:
+            if not backend.available(now):
+                continue
+            try:
+                response = loads(backend.pool.post(body, context=RequestContext(None, timeout)))
+                tools = response["result"]["tools"]
+            except Exception:  # noqa: BLE001
+                continue
+            answered = True
+            for tool in tools:
+                if isinstance(tool, dict) and isinstance(tool.get("name"), str):
+                    merged.setdefault(tool["name"], tool)
+        return list(merged.values()) if answered else None
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {"policy": self.policy, "backends": [backend.snapshot(now) for backend in self.backends]}
+
+    def _key(self, context: Optional[RequestContext]) -> str:
+        session = context.meta.get("session") if context is not None else None
+        return session if isinstance(session, str) else self.default_key
+
+    def _choose(self, key: str, tried: List[Backend]) -> Backend:
+        now = time.monotonic()
+        candidates = [backend for backend in self.backends if backend not in tried and backend.available(now)]
+        if not candidates:
+            # Every backend is ejected (or was tried): try one anyway instead of failing outright.
+            candidates = [backend for backend in self.backends if backend not in tried]
+        if self.policy == ROUND_ROBIN:
+            return candidates[next(self._turn) % len(candidates)]
+        if self.policy == LEAST_OUTSTANDING:
+            with self._lock:
+                return min(candidates, key=lambda backend: backend.outstanding)
+        start = bisect_right(self._ring_points, _ring_hash(key))
+        for offset in range(len(self._ring)):
+            backend = self.backends[self._ring[(start + offset) % len(self._ring)][1]]
+            if backend in candidates:
+                return backend
+        return candidates[0]
+
+    def _failed(self, backend: Backend) -> None:
+        with self._lock:
+            backend.errors += 1
+            backend.failures += 1
+            if backend.failures >= self.failure_threshold:
+                backend.ejected_until = time.monotonic() + self.ejection_time
+                # Back in rotation after the ejection, one more failure ejects it again.
+                backend.failures = self.failure_threshold - 1
+
+    def _succeeded(self, backend: Backend) -> None:
+        with self._lock:
+            backend.failures = 0
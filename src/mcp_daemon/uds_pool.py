@@ -0,0 +1,44 @@
+"""Connection pool for the provider's Unix domain socket transport."""
+
+import socket
+from typing import Optional
+from urllib.parse import SplitResult, unquote
+
+from mcp_core.framing import recv_frame, send_frame
+from mcp_daemon.http_pool import ConnectionPool
+
+
+class UnixConnectionPool(ConnectionPool):
+    """
+    Pool of persistent framed connections to a provider at unix:///path/to.sock.
+
+    Idle handling, stale-connection replay and per-request deadlines are
+    those of ConnectionPool; only the wire format differs.
+    """
+
+    def _bind(self, parts: SplitResult) -> None:
+        if parts.scheme != "unix" or not parts.path:
+            raise ValueError(f"unsupported provider url: {self.url}")
+        self.path = unquote(parts.path)
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.path)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _socket(self, conn: socket.socket, timeout: Optional[float]) -> socket.socket:
+        conn.settimeout(timeout)
+        return conn
+
+    def _send(self, conn: socket.socket, body: bytes, content_type: str) -> bytes:
+        send_frame(conn, body)
+        data = recv_frame(conn)
+        if data is None:
+            raise ConnectionResetError("provider closed the connection")
+        self._release(conn)
+        return data
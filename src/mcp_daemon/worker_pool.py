@@ -0,0 +1,318 @@
+"""Pool of headless Blender worker processes driven over stdio."""
+
+import os
+import queue
+import selectors
+import subprocess
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from mcp_core.cancellation import RequestContext
+
+
+PROVIDER_SCRIPT = Path(__file__).resolve().parents[1] / "blender_bridge" / "provider.py"
+
+MIN_RESTART_DELAY = 0.5
+MAX_RESTART_DELAY = 30.0
+# A worker that stayed up this long is considered healthy again.
+STABLE_UPTIME = 60.0
+# How often an idle worker checks that its process is still running.
+WATCH_INTERVAL = 1.0
+# How long past a call's deadline a worker may take to answer (the provider
+# reports its own timeout) before it is considered stuck and restarted.
+DEADLINE_GRACE = 2.0
+
+
+def default_command() -> List[str]:
+    """blender --background running the stdio provider; BLENDER_MCP_BLENDER names the binary."""
+    return [
+        os.getenv("BLENDER_MCP_BLENDER", "blender"),
+        "--background",
+        "--factory-startup",
+        "--python",
+        os.fspath(PROVIDER_SCRIPT),
+    ]
+
+
+class WorkerRestarted(RuntimeError):
+    """The worker a session was pinned to restarted, losing its scene state."""
+
+
+class _Call:
+    __slots__ = ("body", "context", "done", "finished", "abandoned", "response", "error")
+
+    def __init__(self, body: bytes, context: Optional[RequestContext]) -> None:
+        self.body = body
+        self.context = context
+        self.done = threading.Event()
+        self.finished = False
+        self.abandoned = False
+        self.response = b""
+        self.error: Optional[BaseException] = None
+
+    def interrupted(self) -> bool:
+        context = self.context
+        return self.abandoned or (context is not None and (context.cancelled or context.expired))
+
+    def finish(self, response: bytes = b"", error: Optional[BaseException] = None) -> None:
+        self.response = response
+        self.error = error
+        self.finished = True
+        self.done.set()
+
+
+class BlenderWorker:
+    """
+    One supervised worker process and the thread that feeds it.
+
+    The provider answers requests one at a time, so calls wait in this
+    worker's queue and are written only once the previous response is read.
+    Lines on stdout that are not JSON (Blender's banner and log output) are
+    skipped. A process that exits, idle or mid-call, or that has not answered
+    DEADLINE_GRACE after its call's deadline, is restarted; the call it was
+    running fails, queued calls run on the new process. Restarts of a
+    process that did not stay up for STABLE_UPTIME back off exponentially.
+    generation counts restarts.
+    """
+
+    def __init__(self, index: int, command: Sequence[str]) -> None:
+        self.index = index
+        self.command = list(command)
+        self.generation = 0
+        self.restarts = 0
+        self.process: Optional[subprocess.Popen] = None
+        self.spawn_error: Optional[OSError] = None
+        self.started = 0.0
+        self._buffer = b""
+        self._delay = MIN_RESTART_DELAY
+        self._queue: "queue.SimpleQueue[Optional[_Call]]" = queue.SimpleQueue()
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._serve, name=f"blender-worker-{index}", daemon=True)
+
+    @property
+    def load(self) -> int:
+        """Calls waiting for or running on this worker."""
+        return self._queue.qsize() + self._busy
+
+    @property
+    def alive(self) -> bool:
+        process = self.process
+        return process is not None and process.poll() is None
+
+    def start(self) -> None:
+        self._spawn()
+        self._thread.start()
+
+    def submit(self, call: _Call) -> None:
+        self._queue.put(call)
+
+    def close(self) -> None:
+        self._closed = True
+        self._queue.put(None)
+        process = self.process
+        if process is not None:
+            _stop(process)
+
+    def _spawn(self) -> None:
+        self.started = time.monotonic()
+        self._buffer = b""
+        try:
+            self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0)
+            self.spawn_error = None
+        except OSError as exc:
+            # Retried like a crash; calls fail with this error meanwhile.
+            self.process = None
+            self.spawn_error = exc
+
+    def _serve(self) -> None:
+        while not self._closed:
+            try:
+                call = self._queue.get(timeout=WATCH_INTERVAL)
+            except queue.Empty:
+                if not self.alive:
+                    self._restart()
+                continue
+            if call is None:
+                break
+            if call.interrupted():
+                call.finish(error=call.context.interruption() if call.context is not None else None)
+                continue
+            self._busy = True
+            try:
+                if not self.alive:
+                    self._restart()
+                call.finish(self._exchange(call))
+            except (OSError, ValueError) as exc:
+                call.finish(error=RuntimeError(f"worker {self.index} failed: {exc}"))
+            finally:
+                self._busy = False
+        while True:
+            try:
+                call = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if call is not None:
+                call.finish(error=RuntimeError("worker pool closed"))
+
+    def _exchange(self, call: _Call) -> bytes:
+        process = self.process
+        if process is None:
+            raise ConnectionResetError(f"worker not running: {self.spawn_error}")
+        process.stdin.write(call.body.rstrip(b"\n") + b"\n")
+        process.stdin.flush()
+        deadline = None
+        remaining = call.context.remaining() if call.context is not None else None
+        if remaining is not None:
+            deadline = time.monotonic() + remaining + DEADLINE_GRACE
+        while True:
+            line = self._read_line(process, deadline)
+            if line is None:
+                # Queued calls would wait behind it forever.
+                self._restart()
+                raise TimeoutError(f"worker {self.index} did not answer by the deadline and was restarted")
+            if not line:
+                raise ConnectionResetError(f"worker process exited with {process.wait()}")
+            line = line.strip()
+            if line[:1] in (b"{", b"["):
+                return line
+
+    def _read_line(self, process: subprocess.Popen, deadline: Optional[float]) -> Optional[bytes]:
+        """The next line from the worker, b"" at end of output, or None once deadline passes."""
+        with selectors.DefaultSelector() as selector:
+            selector.register(process.stdout, selectors.EVENT_READ)
+            while True:
+                newline = self._buffer.find(b"\n")
+                if newline >= 0:
+                    line, self._buffer = self._buffer[: newline + 1], self._buffer[newline + 1 :]
+                    return line
+                timeout = None if deadline is None else deadline - time.monotonic()
+                if timeout is not None and (timeout <= 0 or not selector.select(timeout)):
+                    return None
+                chunk = os.read(process.stdout.fileno(), 65536)
+                if not chunk:
+                    return b""
+                self._buffer += chunk
+
+    def _restart(self) -> None:
+        if self.process is not None:
+            _stop(self.process)
+        if time.monotonic() - self.started >= STABLE_UPTIME:
+            self._delay = MIN_RESTART_DELAY
+        time.sleep(self._delay)
+        self._delay = min(self._delay * 2, MAX_RESTART_DELAY)
+        if self._closed:
+            return
+        self.restarts += 1
+        self.generation += 1
+        self._spawn()
+
+
+def _stop(process: subprocess.Popen) -> None:
+    for stream in (process.stdin, process.stdout):
+        try:
+            stream.close()
+        except OSError:
+            pass
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(5.0)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+class BlenderWorkerPool:
+    """
+    Spawn size Blender workers up front and route JSON-RPC bodies to them.
+
+    post() has the shape of ConnectionPool.post, so the daemon can use either.
+    A call without a session goes to the least-loaded worker. A call with a
+    session key (the session argument, else params._meta.session) goes to
+    the worker that key was first routed to, so stateful scene edits keep
+    landing on the same scene; if that worker has since restarted, the call
+    raises WorkerRestarted once and the session is then pinned afresh.
+    pin_all routes every call through one default session, for clients that
+    edit a single scene.
+
+    Workers serve one request at a time; a cancelled or expired call that is
+    still queued is dropped, a running one is abandoned and its response
+    discarded when it arrives.
+    """
+
+    DEFAULT_SESSION = "default"
+
+    def __init__(self, size: int, command: Optional[Sequence[str]] = None, pin_all: bool = False) -> None:
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.pin_all = pin_all
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, tuple] = {}
+        self.workers = [BlenderWorker(index, command or default_command()) for index in range(size)]
+        for worker in self.workers:
+            worker.start()
+
+    def post(
+        self,
+        body: bytes,
+        content_type: str = "application/json",
+        context: Optional[RequestContext] = None,
+        session: Optional[str] = None,
+    ) -> bytes:
+        """Send one JSON-RPC body to a worker and return its response line."""
+        if context is not None:
+            context.check()
+        if session is None and context is not None and isinstance(context.meta.get("session"), str):
+            session = context.meta["session"]
+        if session is None and self.pin_all:
+            session = self.DEFAULT_SESSION
+        worker = self._choose(session)
+        call = _Call(body, context)
+        worker.submit(call)
+        if context is None:
+            call.done.wait()
+        else:
+            context.wait(call.done)
+            if not call.finished:
+                call.abandoned = True
+                raise context.interruption()
+        if call.error is not None:
+            raise call.error
+        return call.response
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": [
+                {"index": worker.index, "alive": worker.alive, "load": worker.load, "restarts": worker.restarts}
+                for worker in self.workers
+            ],
+            "sessions": len(self._sessions),
+        }
+
+    def close(self) -> None:
+        for worker in self.workers:
+            worker.close()
+
+    def _choose(self, session: Optional[str]) -> BlenderWorker:
+        if session is None:
+            return self._least_loaded()
+        with self._lock:
+            pinned = self._sessions.get(session)
+            if pinned is not None:
+                worker, generation = pinned
+                if worker.generation == generation:
+                    return worker
+                del self._sessions[session]
+                raise WorkerRestarted(f"worker {worker.index} restarted; session {session} lost its scene state")
+            # Spread sessions first, so idle sessions do not all share one scene.
+            pinned = Counter(worker.index for worker, _ in self._sessions.values())
+            worker = min(self.workers, key=lambda worker: (not worker.alive, pinned[worker.index], worker.load))
+            self._sessions[session] = (worker, worker.generation)
+            return worker
+
+    def _least_loaded(self) -> BlenderWorker:
+        return min(self.workers, key=lambda worker: (not worker.alive, worker.load))
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import os
+import sys
+import time
+from io import StringIO
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core.server_async import handle_request_async
+from mcp_core.transport_http_async import start_http_async
+from mcp_core.transport_stdio_async import run_stdio_async
+from mcp_daemon import proxy_async
+
+
+def call(request_id, tool, arguments=None):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": tool, "arguments": arguments or {}},
+    }
+
+
+def test_async_and_sync_executors_are_both_supported():
+    async def async_executor(tool_name, arguments):
+        await asyncio.sleep(0)
+        return {"mode": "async"}
+
+    def sync_executor(tool_name, arguments):
+        return {"mode": "sync"}
+
+    async def scenario():
+        first = await handle_request_async(call(1, "t"), tool_executor=async_executor)
+        second = await handle_request_async(call(2, "t"), tool_executor=sync_executor)
+        missing = await handle_request_async(call(3, "t"))
+        return first, second, missing
+
+    first, second, missing = asyncio.run(scenario())
+
+    assert first["result"]["data"] == {"mode": "async"}
+    assert second["result"]["data"] == {"mode": "sync"}
+    assert missing["error"]["code"] == -32004
+
+
+def test_batch_calls_overlap():
+    async def executor(tool_name, arguments):
+        await asyncio.sleep(0.1)
+        return {"tool": tool_name}
+
+    start = time.perf_counter()
+    responses = asyncio.run(handle_request_async([call(i, f"t{i}") for i in range(10)], tool_executor=executor))
+
+    assert [item["result"]["data"]["tool"] for item in responses] == [f"t{i}" for i in range(10)]
+    assert time.perf_counter() - start < 0.5
+
+
+def test_stdio_async_writes_responses_in_completion_order(monkeypatch):
+    async def executor(tool_name, arguments):
+        await asyncio.sleep(arguments["delay"])
+        return {"tool": tool_name}
+
+    lines = [
+        json.dumps(call(1, "slow", {"delay": 0.2})),
+        json.dumps(call(2, "fast", {"delay": 0.0})),
+        json.dumps({"jsonrpc": "2.0", "id": 3, "method": "tools/list", "params": {}}),
+        "not-json",
+    ]
+    stdout = StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    async def scenario():
+        reader = asyncio.StreamReader()
+        reader.feed_data(("\n".join(lines) + "\n").encode("utf-8"))
+        reader.feed_eof()
+        await run_stdio_async(tool_executor=executor, tool_lister=lambda: [], reader=reader)
+
+    asyncio.run(scenario())
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    assert [item["id"] for item in responses] == [3, None, 2, 1]
+
+
+def test_async_daemon_proxies_through_async_http_provider(monkeypatch):
+    async def provider_executor(tool_name, arguments):
+        await asyncio.sleep(0.05)
+        return {"tool": tool_name}
+
+    async def scenario():
+        server = await start_http_async(port=0, tool_executor=provider_executor)
+        host, port = server.sockets[0].getsockname()[:2]
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", f"http://{host}:{port}/mcp")
+        try:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(proxy_async.execute_tool_async(f"t{i}", {}) for i in range(20)))
+            elapsed = time.perf_counter() - start
+            batch = await proxy_async.execute_tool_batch_async([("a", {}), ("b", {})])
+            return results, elapsed, batch
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    results, elapsed, batch = asyncio.run(scenario())
+
+    assert [item["data"]["tool"] for item in results] == [f"t{i}" for i in range(20)]
+    assert elapsed < 0.5
+    assert [item["data"]["tool"] for item in batch] == ["a", "b"]
+
+
+def test_async_http_rejects_unknown_routes_and_keeps_alive():
+    async def scenario():
+        server = await start_http_async(port=0)
+        host, port = server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            answers = []
+            for path in ("/other", "/mcp"):
+                body = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}}).encode("utf-8")
+                writer.write(
+                    f"POST {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+                )
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+                answers.append(json.loads(await reader.readexactly(length)))
+            return answers
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+    not_found, listing = asyncio.run(scenario())
+
+    assert not_found["error"]["code"] == -32601
+    assert listing["result"]["tools"] == []
+
+
+def test_async_pool_does_not_replay_on_http_error_status():
+    from mcp_daemon.http_pool import HTTPStatusError
+
+    received = []
+
+    async def handle(reader, writer):
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                break
+            length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+            received.append(await reader.readexactly(length))
+            status = "200 OK" if len(received) == 1 else "500 Internal Server Error"
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Length: 2\r\n\r\n{{}}".encode())
+            await writer.drain()
+        writer.close()
+
+    async def scenario():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+        pool = proxy_async.AsyncConnectionPool(f"http://{host}:{port}/mcp")
+        try:
+            await pool.post(b"first")
+            try:
+                await pool.post(b"second")
+            except HTTPStatusError:
+                pass
+            else:
+                raise AssertionError("expected HTTPStatusError")
+            return len(pool._idle)
+        finally:
+            await pool.close()
+            server.close()
+            await server.wait_closed()
+
+    idle = asyncio.run(scenario())
+
+    assert received == [b"first", b"second"]
+    assert idle == 0
@@ -0,0 +1,206 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core.cancellation import IN_FLIGHT, RequestTimeout, current_request
+from mcp_core.server import handle_request
+from mcp_core.server_async import handle_request_async
+from mcp_core.workers import BoundedWorkerPool
+from mcp_daemon import main as daemon
+
+
+def call(request_id, tool="slow", timeout=None):
+    params = {"tool": tool, "arguments": {}}
+    if timeout is not None:
+        params["_meta"] = {"timeout": timeout}
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": params}
+
+
+def cancel(request_id):
+    return {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": request_id}}
+
+
+def cooperative(tool_name, arguments):
+    context = current_request()
+    while True:
+        context.check()
+        time.sleep(0.005)
+
+
+def test_deadline_from_meta_returns_request_timeout_with_original_id():
+    response = handle_request(call("t-1", timeout=0.05), tool_executor=cooperative)
+
+    assert response["id"] == "t-1"
+    assert response["error"]["code"] == -32006
+    assert len(IN_FLIGHT) == 0
+
+
+def test_cancel_notification_interrupts_running_call():
+    responses = {}
+    worker = threading.Thread(
+        target=lambda: responses.update(r=handle_request(call("c-1"), tool_executor=cooperative)), daemon=True
+    )
+    worker.start()
+    for _ in range(200):
+        if len(IN_FLIGHT):
+            break
+        time.sleep(0.005)
+
+    assert handle_request(cancel("c-1")) is None
+    worker.join(2)
+
+    assert responses["r"]["id"] == "c-1"
+    assert responses["r"]["error"]["code"] == -32007
+
+
+def test_worker_pool_drops_queued_call_after_cancellation():
+    pool = BoundedWorkerPool(workers=1, queue_size=4)
+    release = threading.Event()
+    ran = []
+
+    def executor(tool_name, arguments):
+        ran.append(tool_name)
+        release.wait(2)
+        return {}
+
+    pooled = pool.wrap(executor)
+    try:
+        blocker = threading.Thread(target=pooled, args=("first", {}), daemon=True)
+        blocker.start()
+        response = handle_request(call("q-1", tool="second", timeout=0.05), tool_executor=pooled)
+        release.set()
+        blocker.join(2)
+        time.sleep(0.05)
+    finally:
+        pool.shutdown()
+
+    assert response["error"]["code"] == -32006
+    assert ran == ["first"]
+
+
+def test_async_deadline_cancels_the_task():
+    async def slow(tool_name, arguments):
+        await asyncio.sleep(5)
+
+    started = time.perf_counter()
+    response = asyncio.run(handle_request_async(call("a-1", timeout=0.05), tool_executor=slow))
+
+    assert time.perf_counter() - started < 1.0
+    assert response["id"] == "a-1"
+    assert response["error"]["code"] == -32006
+
+
+def start_slow_provider(delay):
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):  # noqa: N802
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            seen.append(body)
+            if b"notifications/cancelled" not in body:
+                time.sleep(delay)
+            data = b'{"jsonrpc": "2.0", "id": "1", "result": {}}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):  # noqa: A003
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, seen
+
+
+def test_daemon_applies_per_tool_timeout_and_forwards_deadline(monkeypatch):
+    server, seen = start_slow_provider(delay=0.5)
+    try:
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", f"http://127.0.0.1:{server.server_address[1]}/mcp")
+        monkeypatch.setenv("BLENDER_MCP_TOOL_TIMEOUTS", "blender.render=60,blender.ping=0.1")
+
+        started = time.perf_counter()
+        response = handle_request(call("d-1", tool="blender.ping"), tool_executor=daemon.execute_tool)
+
+        assert time.perf_counter() - started < 0.4
+        assert response["id"] == "d-1"
+        assert response["error"]["code"] == -32006
+        assert b'"_meta"' in seen[0] and b'"d-1"' in seen[0]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_daemon_bounds_calls_by_default_without_configuration(monkeypatch):
+    monkeypatch.delenv("BLENDER_MCP_TIMEOUT", raising=False)
+    monkeypatch.delenv("BLENDER_MCP_TOOL_TIMEOUTS", raising=False)
+    assert daemon._tool_timeout("blender.ping") == daemon.DEFAULT_TIMEOUT
+
+    server, seen = start_slow_provider(delay=0.5)
+    try:
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", f"http://127.0.0.1:{server.server_address[1]}/mcp")
+        monkeypatch.setattr(daemon, "DEFAULT_TIMEOUT", 0.1)
+
+        started = time.perf_counter()
+        response = handle_request(call("u-1", tool="blender.ping"), tool_executor=daemon.execute_tool)
+
+        assert time.perf_counter() - started < 0.4
+        assert response["error"]["code"] == -32006
+        assert json.loads(seen[0])["params"]["_meta"]["timeout"] <= 0.1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_daemon_timeout_overrides_and_zero_disables_the_default(monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_TIMEOUT", "30")
+    monkeypatch.setenv("BLENDER_MCP_TOOL_TIMEOUTS", "blender.render=0,blender.ping=2")
+
+    assert daemon._tool_timeout("blender.ping") == 2.0
+    assert daemon._tool_timeout("blender.render") is None
+    assert daemon._tool_timeout("blender.other") == 30.0
+
+
+def test_daemon_maps_provider_timeout_error(monkeypatch):
+    monkeypatch.setattr(
+        daemon, "_post_json", lambda payload, context=None: {"id": "1", "error": {"code": -32006, "message": "late"}}
+    )
+
+    with pytest.raises(RequestTimeout):
+        daemon.execute_tool("blender.ping", {})
+
+
+def test_daemon_batch_members_carry_their_deadlines_and_ids(monkeypatch):
+    server, seen = start_slow_provider(delay=0.5)
+    try:
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", f"http://127.0.0.1:{server.server_address[1]}/mcp")
+        batch = [call("b-1", tool="blender.ping", timeout=0.1), call("b-2", tool="blender.ping", timeout=0.05)]
+
+        started = time.perf_counter()
+        response = handle_request(batch, tool_executor=daemon.execute_tool, batch_executor=daemon.execute_tool_batch)
+
+        assert time.perf_counter() - started < 0.4
+        assert [item["id"] for item in response] == ["b-1", "b-2"]
+        assert {item["error"]["code"] for item in response} == {-32006}
+        posted = json.loads(seen[0])
+        assert [item["id"] for item in posted] == ["b-1", "b-2"]
+        assert all(0 < item["params"]["_meta"]["timeout"] <= 0.1 for item in posted)
+        assert len(IN_FLIGHT) == 0
+    finally:
+        server.shutdown()
+        server.server_close()
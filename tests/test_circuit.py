@@ -0,0 +1,128 @@
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core.cancellation import RequestContext
+from mcp_daemon import main
+from mcp_daemon.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpen, GuardedPool
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FlakyPool:
+    url = "http://provider"
+
+    def __init__(self):
+        self.down = True
+        self.posts = 0
+
+    def post(self, body, content_type="application/json", context=None):
+        self.posts += 1
+        if self.down:
+            raise ConnectionRefusedError("refused")
+        return b"{}"
+
+
+def wait_for(predicate):
+    for _ in range(400):
+        if predicate():
+            return
+        time.sleep(0.005)
+    raise AssertionError("condition not reached")
+
+
+def test_breaker_opens_half_opens_and_closes():
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=2, cool_down=5.0, clock=clock)
+
+    assert breaker.failure() is False and breaker.state == CLOSED
+    assert breaker.failure() is True and breaker.state == OPEN
+    assert breaker.allow() is False
+
+    clock.now = 5.0
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() is True and breaker.allow() is False
+    breaker.failure()
+    assert breaker.state == OPEN
+
+    clock.now = 10.0
+    assert breaker.allow() is True
+    breaker.success()
+    assert breaker.state == CLOSED and breaker.allow() is True
+
+
+def test_open_circuit_fails_fast_until_a_probe_answers():
+    pool = FlakyPool()
+    guarded = GuardedPool(pool, CircuitBreaker(failure_threshold=2, cool_down=60.0), probe_interval=0.01)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionRefusedError):
+            guarded.post(b"{}")
+    posts = pool.posts
+    with pytest.raises(CircuitOpen):
+        guarded.post(b"{}")
+    wait_for(lambda: pool.posts > posts)
+
+    pool.down = False
+    wait_for(lambda: guarded.breaker.state == CLOSED)
+    assert guarded.post(b"{}") == b"{}"
+    wait_for(lambda: not guarded.stats()["probing"])
+
+
+def test_cancelled_call_does_not_count_as_failure():
+    pool = FlakyPool()
+    guarded = GuardedPool(pool, CircuitBreaker(failure_threshold=1))
+    context = RequestContext(None)
+    context.cancel()
+
+    with pytest.raises(ConnectionRefusedError):
+        guarded.post(b"{}", context=context)
+    assert guarded.breaker.state == CLOSED
+
+
+def test_daemon_fails_fast_against_a_dead_provider(monkeypatch):
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    url = f"http://127.0.0.1:{probe.getsockname()[1]}/mcp"
+    probe.close()
+    monkeypatch.setenv("BLENDER_MCP_HTTP_URL", url)
+    monkeypatch.setenv("BLENDER_MCP_BREAKER_FAILURES", "2")
+    monkeypatch.setenv("BLENDER_MCP_PROBE_INTERVAL", "60")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="transport error"):
+            main.execute_tool("blender.ping", {})
+    with pytest.raises(RuntimeError, match="circuit open"):
+        main.execute_tool("blender.ping", {})
+    assert main._GUARDED[url].breaker.state == OPEN
+
+
+def test_prewarm_leaves_a_connection_open(monkeypatch):
+    from mcp_core.transport_http import run_http
+
+    server = run_http(port=0, tool_executor=lambda name, arguments: {"message": "pong"})
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/mcp"
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", url)
+        main._prewarm()
+
+        wait_for(lambda: main._POOLS[url].idle_count() == 1)
+        assert main._GUARDED[url].breaker.state == CLOSED
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,77 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, os.fspath(ROOT))
+
+from src.mcp_core import codec
+
+
+CODECS = codec.available_codecs()
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_roundtrip_from_bytes_and_memoryview(name):
+    selected = CODECS[name]
+    message = {"jsonrpc": "2.0", "id": 1, "result": {"ok": True, "data": {"name": "Cube é", "v": [1.5, None]}}}
+
+    data = selected.dumps(message)
+
+    assert isinstance(data, bytes)
+    assert selected.loads(data) == message
+    assert selected.loads(memoryview(data)) == message
+    assert selected.loads(data.decode("utf-8")) == message
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_invalid_json_raises_value_error(name):
+    with pytest.raises(ValueError):
+        CODECS[name].loads(b"not-json")
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_non_string_keys_still_encode(name):
+    assert json.loads(CODECS[name].dumps({1: "a"})) == {"1": "a"}
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_non_finite_numbers_are_read_like_the_stdlib(name):
+    decoded = CODECS[name].loads(b'{"a": NaN, "b": Infinity, "c": -Infinity}')
+
+    assert decoded["a"] != decoded["a"]
+    assert decoded["b"] == float("inf") and decoded["c"] == float("-inf")
+
+
+@pytest.mark.skipif("orjson" not in CODECS, reason="orjson not installed")
+def test_orjson_output_format():
+    message = {"name": "Cube é", "v": [1.5, float("nan")]}
+
+    data = CODECS["orjson"].dumps(message)
+
+    assert data == '{"name":"Cube é","v":[1.5,null]}'.encode("utf-8")
+    assert json.loads(data) == {"name": "Cube é", "v": [1.5, None]}
+
+
+def test_stdlib_backend_matches_json_dumps():
+    message = {"jsonrpc": "2.0", "id": "x", "result": {"tools": []}}
+
+    assert codec.get_codec("json").dumps(message) == json.dumps(message).encode("utf-8")
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        codec.get_codec("yaml")
+
+
+def test_newline_codec_is_stdlib_unless_a_backend_is_requested():
+    import subprocess
+
+    script = "from src.mcp_core import codec; print(codec.LINE_CODEC.name)"
+    env = {key: value for key, value in os.environ.items() if key != "BLENDER_MCP_JSON"}
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, check=True)
+    assert output.stdout.strip() == b"json"
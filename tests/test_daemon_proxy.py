@@ -12,7 +12,7 @@ ROOT = Path(__file__).resolve().parent.parent
 SRC = ROOT / "src"
 sys.path.insert(0, os.fspath(SRC))
 
-from mcp_daemon.main import execute_tool, handle_stdio_payload
+from mcp_daemon.main import execute_tool, execute_tool_batch, handle_stdio_payload
 
 
 def start_mock_server(response_payload):
@@ -78,3 +78,74 @@ def test_initialize_handshake():
 
     assert response["result"]["protocolVersion"] == "1.2.3"
     assert response["result"]["serverInfo"]["name"] == "hephaestus"
+
+
+def start_echo_server(posts):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):  # noqa: N802
+            length = int(self.headers.get("Content-Length", 0))
+            batch = json.loads(self.rfile.read(length).decode("utf-8"))
+            posts.append(batch)
+            responses = []
+            for item in batch:
+                name = item["params"]["tool"]
+                if name == "blender.fail":
+                    responses.append({"jsonrpc": "2.0", "id": item["id"], "error": {"code": -32003, "message": "fail"}})
+                else:
+                    responses.append({"jsonrpc": "2.0", "id": item["id"], "result": {"tool": name}})
+            data = json.dumps(list(reversed(responses))).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):  # noqa: A003
+            return
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def test_execute_tool_batch_uses_single_post(monkeypatch):
+    posts = []
+    server = start_echo_server(posts)
+    try:
+        url = f"http://{server.server_address[0]}:{server.server_address[1]}/mcp"
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", url)
+        results = execute_tool_batch([("blender.ping", {}), ("blender.fail", {}), ("blender.add_cube", {})])
+        assert len(posts) == 1
+        assert results[0] == {"tool": "blender.ping"}
+        assert isinstance(results[1], RuntimeError) and "fail" in str(results[1])
+        assert results[2] == {"tool": "blender.add_cube"}
+    finally:
+        stop_mock_server(server)
+
+
+def test_stdio_batch_is_forwarded_in_one_post(monkeypatch):
+    posts = []
+    server = start_echo_server(posts)
+    try:
+        url = f"http://{server.server_address[0]}:{server.server_address[1]}/mcp"
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", url)
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"name": "blender.ping", "arguments": {}}}
+            for i in range(5)
+        ]
+        batch.insert(2, {"jsonrpc": "2.0", "id": "list", "method": "tools/list", "params": {}})
+
+        response = handle_stdio_payload(
+            batch,
+            tool_executor=execute_tool,
+            tool_lister=lambda: [],
+            batch_executor=execute_tool_batch,
+        )
+
+        assert len(posts) == 1 and len(posts[0]) == 5
+        assert [item["id"] for item in response] == [0, 1, "list", 2, 3, 4]
+        assert response[2]["result"]["tools"] == []
+        assert response[0]["result"]["data"] == {"tool": "blender.ping"}
+    finally:
+        stop_mock_server(server)
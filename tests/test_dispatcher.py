@@ -0,0 +1,153 @@
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from blender_bridge.dispatcher import MainThreadDispatcher
+from mcp_core.cancellation import RequestCancelled, RequestContext, RequestTimeout, activate, deactivate
+
+
+def submit_in_threads(dispatcher, calls):
+    results = {}
+
+    def worker(index, name, arguments):
+        try:
+            results[index] = dispatcher.submit(name, arguments)
+        except Exception as exc:  # noqa: BLE001
+            results[index] = exc
+
+    threads = [
+        threading.Thread(target=worker, args=(i, name, args), daemon=True) for i, (name, args) in enumerate(calls)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def wait_for_depth(dispatcher, depth):
+    for _ in range(200):
+        if dispatcher.stats()["queue_depth"] >= depth:
+            return
+        time.sleep(0.005)
+    raise AssertionError("work was not queued")
+
+
+def test_calls_run_on_the_ticking_thread():
+    ran_on = []
+
+    def executor(tool_name, arguments):
+        ran_on.append(threading.get_ident())
+        return {"tool": tool_name}
+
+    dispatcher = MainThreadDispatcher(executor)
+    threads, results = submit_in_threads(dispatcher, [("a", {}), ("b", {})])
+    wait_for_depth(dispatcher, 2)
+
+    dispatcher.tick()
+    for thread in threads:
+        thread.join(2)
+
+    assert sorted(result["tool"] for result in results.values()) == ["a", "b"]
+    assert set(ran_on) == {threading.get_ident()}
+
+
+def test_tick_respects_batch_size_and_asks_to_come_back():
+    dispatcher = MainThreadDispatcher(lambda name, arguments: {}, batch_size=2, interval=0.5)
+    threads, _ = submit_in_threads(dispatcher, [("t", {})] * 3)
+    wait_for_depth(dispatcher, 3)
+
+    assert dispatcher.tick() == 0.0
+    assert dispatcher.stats()["calls"] == 2
+    assert dispatcher.tick() == 0.5
+    for thread in threads:
+        thread.join(2)
+    assert dispatcher.stats()["calls"] == 3
+
+
+def test_tick_stops_when_time_budget_is_spent():
+    def slow(name, arguments):
+        time.sleep(0.02)
+        return {}
+
+    dispatcher = MainThreadDispatcher(slow, batch_size=10, time_budget=0.01)
+    threads, _ = submit_in_threads(dispatcher, [("t", {})] * 3)
+    wait_for_depth(dispatcher, 3)
+
+    dispatcher.tick()
+    assert dispatcher.stats()["calls"] == 1
+    while dispatcher.stats()["calls"] < 3:
+        dispatcher.tick()
+    for thread in threads:
+        thread.join(2)
+
+
+def test_errors_propagate_and_timings_are_split():
+    def executor(name, arguments):
+        if name == "fail":
+            raise KeyError(name)
+        time.sleep(0.01)
+        return {}
+
+    observed = []
+    dispatcher = MainThreadDispatcher(executor, observer=lambda *timing: observed.append(timing))
+    threads, results = submit_in_threads(dispatcher, [("ok", {}), ("fail", {})])
+    wait_for_depth(dispatcher, 2)
+    time.sleep(0.02)
+    while dispatcher.stats()["calls"] < 2:
+        dispatcher.tick()
+    for thread in threads:
+        thread.join(2)
+
+    assert any(isinstance(result, KeyError) for result in results.values())
+    stats = dispatcher.stats()
+    assert stats["calls"] == 2 and stats["errors"] == 1
+    assert stats["queue_wait"]["max_ms"] >= 20.0
+    assert stats["execution"]["max_ms"] >= 10.0
+    assert len(observed) == 2
+
+
+def test_cancelled_call_is_dropped_before_it_runs():
+    ran = []
+    dispatcher = MainThreadDispatcher(lambda name, arguments: ran.append(name) or {})
+    context = RequestContext("r-1")
+    outcome = {}
+
+    def worker():
+        token = activate(context)
+        try:
+            dispatcher.submit("t", {})
+        except Exception as exc:  # noqa: BLE001
+            outcome["error"] = exc
+        finally:
+            deactivate(token)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    wait_for_depth(dispatcher, 1)
+    context.cancel()
+    thread.join(2)
+    dispatcher.tick()
+
+    assert isinstance(outcome["error"], RequestCancelled)
+    assert ran == []
+    assert dispatcher.stats()["dropped"] == 1
+
+
+def test_expired_call_raises_request_timeout():
+    dispatcher = MainThreadDispatcher(lambda name, arguments: {})
+    token = activate(RequestContext("r-2", timeout=0.02))
+    try:
+        with pytest.raises(RequestTimeout):
+            dispatcher.submit("t", {})
+    finally:
+        deactivate(token)
+    dispatcher.tick()
+    assert dispatcher.stats()["dropped"] == 1
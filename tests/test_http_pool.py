@@ -0,0 +1,121 @@
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_daemon.http_pool import ConnectionPool, HTTPStatusError
+
+
+def start_server(connections, close_after=None, fail_after=None, requests=None):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+            self.served = 0
+
+        def do_POST(self):  # noqa: N802
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length)
+            self.served += 1
+            if requests is not None:
+                requests.append(body)
+            data = json.dumps({"echo": body.decode("utf-8")}).encode("utf-8")
+            self.send_response(500 if fail_after is not None and self.served > fail_after else 200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            if close_after is not None and self.served >= close_after:
+                # Close without telling the client, like an idle-timeout reap.
+                self.close_connection = True
+
+        def log_message(self, format, *args):  # noqa: A003
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def stop_server(server):
+    server.shutdown()
+    server.server_close()
+
+
+def url_for(server):
+    return f"http://{server.server_address[0]}:{server.server_address[1]}/mcp"
+
+
+def test_pool_reuses_one_connection():
+    connections = []
+    server = start_server(connections)
+    pool = ConnectionPool(url_for(server), max_size=2)
+    try:
+        for index in range(5):
+            body = pool.post(str(index).encode("utf-8"))
+            assert json.loads(body) == {"echo": str(index)}
+        assert len(connections) == 1
+        assert pool.idle_count() == 1
+    finally:
+        pool.close()
+        stop_server(server)
+
+
+def test_pool_reconnects_when_peer_closed_connection():
+    connections = []
+    server = start_server(connections, close_after=1)
+    pool = ConnectionPool(url_for(server), max_size=2)
+    try:
+        for index in range(3):
+            assert json.loads(pool.post(b"x")) == {"echo": "x"}
+            time.sleep(0.05)
+        assert len(connections) == 3
+    finally:
+        pool.close()
+        stop_server(server)
+
+
+def test_pool_evicts_idle_connections():
+    connections = []
+    server = start_server(connections)
+    pool = ConnectionPool(url_for(server), max_size=2, idle_timeout=0.05)
+    try:
+        pool.post(b"a")
+        time.sleep(0.1)
+        pool.post(b"b")
+        assert len(connections) == 2
+        assert pool.idle_count() == 1
+    finally:
+        pool.close()
+        stop_server(server)
+
+
+def test_http_error_status_is_not_replayed_and_drops_the_connection():
+    connections = []
+    requests = []
+    server = start_server(connections, fail_after=1, requests=requests)
+    pool = ConnectionPool(url_for(server), max_size=2)
+    try:
+        pool.post(b"first")
+        try:
+            pool.post(b"second")
+        except HTTPStatusError:
+            pass
+        else:
+            raise AssertionError("expected HTTPStatusError")
+        assert requests == [b"first", b"second"]
+        assert pool.idle_count() == 0
+    finally:
+        pool.close()
+        stop_server(server)
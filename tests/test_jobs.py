@@ -0,0 +1,127 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from blender_bridge.dispatcher import MainThreadDispatcher, _WorkItem
+from blender_bridge.jobs import JOB_TOOLS, JobManager
+from mcp_core.server import ServerOverloaded
+
+
+def stepwise(steps):
+    for step in range(steps):
+        yield {"progress": (step + 1) / steps, "message": f"step {step + 1}"}
+    return {"steps": steps}
+
+
+def make_starter(log):
+    def start(tool_name, arguments):
+        log.append(tool_name)
+        if tool_name == "fail":
+            raise RuntimeError("boom")
+        if "steps" in arguments:
+            return stepwise(arguments["steps"])
+        return {"tool": tool_name}
+
+    return start
+
+
+def run_all(manager):
+    while manager.run(time.perf_counter() + 1.0):
+        pass
+
+
+def test_jobs_run_by_priority_then_fifo():
+    log = []
+    manager = JobManager(make_starter(log))
+    ids = [manager.submit(name, {}, priority)["job_id"] for name, priority in (("a", 0), ("b", 5), ("c", 0), ("d", 5))]
+
+    assert manager.status(ids[0])["state"] == "queued"
+    run_all(manager)
+
+    assert log == ["b", "d", "a", "c"]
+    result = manager.result(ids[1])
+    assert result["state"] == "succeeded" and result["result"] == {"tool": "b"} and result["progress"] == 1.0
+
+
+def test_stepwise_job_reports_progress_and_can_be_cancelled_between_steps():
+    manager = JobManager(make_starter([]))
+    job_id = manager.submit("render", {"steps": 4})["job_id"]
+
+    assert manager.run(0.0) is True
+    status = manager.status(job_id)
+    assert status["state"] == "running" and status["progress"] == 0.25 and status["message"] == "step 1"
+    assert "result" not in manager.result(job_id)
+
+    manager.cancel(job_id)
+    assert manager.run(0.0) is False
+    assert manager.status(job_id)["state"] == "cancelled"
+    assert manager.status(job_id)["progress"] == 0.25
+
+
+def test_stepwise_job_result_and_failures():
+    manager = JobManager(make_starter([]))
+    done = manager.submit("render", {"steps": 2})["job_id"]
+    failed = manager.submit("fail", {})["job_id"]
+    queued = manager.submit("late", {})["job_id"]
+    manager.cancel(queued)
+    run_all(manager)
+
+    assert manager.result(done)["result"] == {"steps": 2}
+    assert manager.status(failed)["state"] == "failed" and manager.status(failed)["error"] == "boom"
+    assert manager.status(queued)["state"] == "cancelled" and manager.status(queued)["started"] is None
+    with pytest.raises(ValueError):
+        manager.status("missing")
+
+
+def test_queue_is_bounded_and_finished_jobs_expire():
+    manager = JobManager(make_starter([]), max_queued=2, max_finished=1)
+    first = manager.submit("a", {})["job_id"]
+    manager.submit("b", {})
+    with pytest.raises(ServerOverloaded):
+        manager.submit("c", {})
+
+    run_all(manager)
+    listing = manager.status()
+    assert [job["tool"] for job in listing["jobs"]] == ["b"] and listing["queued"] == 0
+    with pytest.raises(ValueError):
+        manager.result(first)
+
+
+def test_submit_checks_tool_and_arguments_against_the_lister():
+    tools = [{"name": "render", "input_schema": {"type": "object", "properties": {"steps": {"type": "integer"}}}}]
+    manager = JobManager(make_starter([]), tool_lister=lambda: tools)
+
+    with pytest.raises(ValueError, match="unknown tool"):
+        manager.submit("nope", {})
+    with pytest.raises(ValueError):
+        manager.submit("render", {"steps": "many"})
+    assert manager.submit("render", {"steps": 1})["state"] == "queued"
+
+
+def test_dispatcher_runs_jobs_only_after_interactive_calls():
+    order = []
+    manager = JobManager(make_starter(order))
+    dispatcher = MainThreadDispatcher(
+        lambda name, arguments: order.append(name) or {}, time_budget=0.0, background=manager.run
+    )
+    job_id = manager.submit("render", {"steps": 3})["job_id"]
+
+    dispatcher._queue.put(_WorkItem("ping", {}, None))
+    assert dispatcher.tick() == 0.0
+    assert order == ["ping", "render"]
+    assert manager.status(job_id)["progress"] == pytest.approx(1 / 3)
+
+    ticks = 1
+    while dispatcher.tick() == 0.0:
+        ticks += 1
+    assert ticks == 3
+    assert manager.status(job_id)["state"] == "succeeded"
+    assert {tool["name"] for tool in JOB_TOOLS} == set(manager.handlers())
@@ -205,3 +205,60 @@ def test_invalid_id_array_returns_invalid_request():
     assert response["jsonrpc"] == "2.0"
     assert response["id"] is None
     assert response["error"]["code"] == -32600
+
+
+def test_batch_returns_responses_in_order():
+    def executor(tool_name, arguments):
+        if tool_name == "fail":
+            raise RuntimeError("boom")
+        return {"echo": arguments.get("value")}
+
+    batch = [
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"tool": "echo", "arguments": {"value": "a"}}},
+        {"jsonrpc": "2.0", "method": "notifications/initialized", "params": {}},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"tool": "fail", "arguments": {}}},
+        {"jsonrpc": "2.0", "id": 3, "method": "tools/list", "params": {}},
+        "not-an-object",
+    ]
+
+    response = handle_request(batch, tool_executor=executor)
+
+    assert [item["id"] for item in response] == [1, 2, 3, None]
+    assert response[0]["result"]["data"] == {"echo": "a"}
+    assert response[1]["error"]["code"] == -32003
+    assert response[2]["result"]["tools"] == []
+    assert response[3]["error"]["code"] == -32600
+
+
+def test_empty_batch_returns_invalid_request():
+    response = handle_request([])
+
+    assert response["error"]["code"] == -32600
+    assert response["id"] is None
+
+
+def test_batch_of_notifications_returns_none():
+    batch = [{"jsonrpc": "2.0", "method": "notifications/initialized", "params": {}}]
+
+    assert handle_request(batch) is None
+
+
+def test_batch_executor_receives_all_calls_at_once():
+    seen = []
+
+    def batch_executor(calls):
+        seen.append(calls)
+        return [{"n": arguments["n"]} if name == "echo" else KeyError(name) for name, arguments in calls]
+
+    batch = [
+        {"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"tool": "echo", "arguments": {"n": i}}}
+        for i in range(3)
+    ]
+    batch.append({"jsonrpc": "2.0", "id": "x", "method": "tools/call", "params": {"tool": "nope", "arguments": {}}})
+
+    response = handle_request(batch, batch_executor=batch_executor)
+
+    assert len(seen) == 1 and len(seen[0]) == 4
+    assert [item["result"]["data"]["n"] for item in response[:3]] == [0, 1, 2]
+    assert response[3]["error"]["code"] == -32003
+    assert response[3]["id"] == "x"
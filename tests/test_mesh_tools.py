@@ -0,0 +1,468 @@
+import base64
+import os
+import sys
+from array import array
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, os.fspath(ROOT))
+# blender.batch validates its steps with mcp_core.schema.
+sys.path.insert(0, os.fspath(ROOT / "src"))
+
+from src.blender_tools import REGISTRY, tools
+from src.blender_tools.packing import new_buffer, pack_array, unpack_array
+
+
+class FakeCollection:
+    """Stand-in for a bpy_prop_collection: flat per-property storage with foreach_get/foreach_set."""
+
+    def __init__(self, widths, **columns):
+        self.widths = widths
+        self.columns = {prop: list(values) for prop, values in columns.items()}
+        self.length = len(next(iter(self.columns.values()))) // widths[next(iter(self.columns))] if columns else 0
+
+    def __len__(self):
+        return self.length
+
+    def add(self, count):
+        self.length += count
+        for prop, width in self.widths.items():
+            self.columns.setdefault(prop, []).extend([0] * (count * width))
+
+    def foreach_get(self, prop, buffer):
+        values = self.columns[prop]
+        assert len(buffer) == len(values)
+        buffer[:] = array(buffer.typecode, values)
+
+    def foreach_set(self, prop, buffer):
+        if prop == "loop_total":
+            raise AttributeError("read-only")
+        assert len(buffer) == self.length * self.widths[prop]
+        self.columns[prop] = list(buffer)
+
+
+def vertices_from(positions):
+    return FakeCollection({"co": 3}, co=[value for row in positions for value in row])
+
+
+class FakeUVLayers(dict):
+    active = None
+
+    def new(self, name):
+        layer = self[name] = SimpleNamespace(name=name, data=FakeCollection({"uv": 2}))
+        layer.data.add(self.loop_count())
+        self.active = self.active or layer
+        return layer
+
+
+class FakeMesh:
+    def __init__(self, name):
+        self.name = name
+        self.updates = []
+        self.clear_geometry()
+
+    def clear_geometry(self):
+        self.vertices = FakeCollection({"co": 3})
+        self.edges = FakeCollection({"vertices": 2})
+        self.loops = FakeCollection({"vertex_index": 1})
+        self.polygons = FakeCollection({"loop_start": 1, "loop_total": 1})
+        self.loop_triangles = FakeCollection({"vertices": 3})
+        self.uv_layers = FakeUVLayers()
+        self.uv_layers.loop_count = lambda: len(self.loops)
+
+    def update(self, calc_edges=False):
+        self.updates.append(calc_edges)
+
+    def validate(self, clean_customdata=True):
+        return False
+
+    def from_pydata(self, vertices, edges, faces):
+        self.vertices = vertices_from(vertices)
+        self.faces = faces
+
+    def copy(self):
+        duplicate = FakeMesh(self.name + ".001")
+        duplicate.vertices = self.vertices
+        return duplicate
+
+
+class FakeMeshes(dict):
+    def new(self, name):
+        mesh = self[name] = FakeMesh(name)
+        return mesh
+
+
+def fake_mesh():
+    # Two triangles sharing an edge: a unit quad split along its diagonal.
+    mesh = FakeMesh("QuadMesh")
+    mesh.vertices = vertices_from([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)])
+    mesh.edges = FakeCollection({"vertices": 2}, vertices=[0, 1, 1, 2, 2, 0, 2, 3, 3, 0])
+    mesh.loops = FakeCollection({"vertex_index": 1}, vertex_index=[0, 1, 2, 0, 2, 3])
+    mesh.polygons = FakeCollection({"loop_start": 1, "loop_total": 1}, loop_start=[0, 3], loop_total=[3, 3])
+    mesh.loop_triangles = FakeCollection({"vertices": 3}, vertices=[0, 1, 2, 0, 2, 3])
+    layer = mesh.uv_layers.new("UVMap")
+    layer.data.columns["uv"] = [value for i in range(6) for value in (float(i), 0.5)]
+    return mesh
+
+
+class FakeObjects(dict):
+    """bpy.data.objects: keyed by name, iterating over the objects themselves."""
+
+    def __iter__(self):
+        return iter(list(self.values()))
+
+    def new(self, name, data):
+        unique = name
+        while unique in self:
+            unique += ".001"
+        obj = self[unique] = SimpleNamespace(name=unique, type="MESH" if data is not None else "EMPTY", data=data)
+        return obj
+
+
+def fake_collection():
+    collection = SimpleNamespace(objects=SimpleNamespace(linked=[]))
+    collection.objects.link = collection.objects.linked.append
+    return collection
+
+
+@pytest.fixture
+def bpy(monkeypatch):
+    objects = FakeObjects(
+        Quad=SimpleNamespace(name="Quad", type="MESH", data=fake_mesh()),
+        Lamp=SimpleNamespace(name="Lamp", type="LIGHT", data=None),
+    )
+    view_layer = SimpleNamespace(updates=0)
+    view_layer.update = lambda: setattr(view_layer, "updates", view_layer.updates + 1)
+    module = SimpleNamespace(
+        data=SimpleNamespace(objects=objects, meshes=FakeMeshes(), collections={"Props": fake_collection()}),
+        context=SimpleNamespace(scene=SimpleNamespace(collection=fake_collection()), view_layer=view_layer),
+        ops=SimpleNamespace(ed=SimpleNamespace(undo_pushes=[])),
+        app=SimpleNamespace(
+            handlers=SimpleNamespace(persistent=lambda fn: fn, depsgraph_update_post=[], load_post=[])
+        ),
+    )
+    module.ops.ed.undo_push = lambda message: module.ops.ed.undo_pushes.append(message)
+    monkeypatch.setitem(sys.modules, "bpy", module)
+    # Objects of an earlier fake scene are not invalidated the way Blender's are.
+    monkeypatch.setattr(tools, "OBJECT_LOOKUP", tools.ObjectLookup())
+    yield module
+    tools.MESH_READS.uninstall()
+
+
+def test_pack_round_trip_is_little_endian():
+    buffer = array("f", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    packed = pack_array(buffer, [2, 3])
+
+    assert packed["dtype"] == "float32" and packed["shape"] == [2, 3]
+    assert base64.b64decode(packed["data"])[:4] == b"\x00\x00\x80\x3f"
+    decoded, shape = unpack_array(packed, dtype="float32", width=3)
+    assert shape == [2, 3] and decoded.tolist() == buffer.tolist()
+
+
+@pytest.mark.parametrize(
+    "packed",
+    [
+        {"dtype": "complex64", "shape": [1], "data": ""},
+        {"dtype": "int32", "shape": [2], "data": base64.b64encode(b"\x00" * 4).decode()},
+        {"dtype": "int32", "shape": [-1], "data": ""},
+        {"dtype": "int32", "shape": [1], "data": "***"},
+    ],
+)
+def test_unpack_rejects_malformed_arrays(packed):
+    with pytest.raises(ValueError):
+        unpack_array(packed)
+
+
+def test_new_buffer_is_zero_filled():
+    assert new_buffer("int32", 3).tolist() == [0, 0, 0]
+
+
+def test_get_mesh_data_reads_selected_attributes(bpy):
+    result = REGISTRY.execute("blender.get_mesh_data", {"object": "Quad", "attributes": ["positions", "triangles"]})
+
+    positions, _ = unpack_array(result["attributes"]["positions"], dtype="float32", width=3)
+    triangles, shape = unpack_array(result["attributes"]["triangles"], dtype="int32", width=3)
+    assert positions.tolist()[3:6] == [1.0, 0.0, 0.0]
+    assert shape == [2, 3] and triangles.tolist() == [0, 1, 2, 0, 2, 3]
+
+
+def test_get_mesh_data_pages_by_row_range(bpy):
+    result = REGISTRY.execute(
+        "blender.get_mesh_data", {"object": "Quad", "attributes": ["positions", "uvs"], "start": 1, "count": 2}
+    )
+
+    positions = result["attributes"]["positions"]
+    assert positions["start"] == 1 and positions["total"] == 4 and positions["shape"] == [2, 3]
+    assert unpack_array(positions)[0].tolist() == [1.0, 0.0, 0.0, 1.0, 1.0, 0.0]
+    assert unpack_array(result["attributes"]["uvs"])[0].tolist() == [1.0, 0.5, 2.0, 0.5]
+
+
+def test_get_mesh_data_pages_share_one_domain_read_until_the_mesh_changes(bpy, monkeypatch):
+    vertices = bpy.data.objects["Quad"].data.vertices
+    reads = []
+    original = vertices.foreach_get
+    monkeypatch.setattr(vertices, "foreach_get", lambda prop, buffer: (reads.append(prop), original(prop, buffer)))
+
+    def page(start):
+        arguments = {"object": "Quad", "attributes": ["positions"], "start": start, "count": 2}
+        return unpack_array(REGISTRY.execute("blender.get_mesh_data", arguments)["attributes"]["positions"])[0]
+
+    assert page(0).tolist() == [0.0, 0.0, 0.0, 1.0, 0.0, 0.0]
+    assert page(2).tolist() == [1.0, 1.0, 0.0, 0.0, 1.0, 0.0]
+    assert reads == ["co"]
+
+    for handler in bpy.app.handlers.depsgraph_update_post:
+        handler(None, None)
+    page(2)
+    assert reads == ["co", "co"]
+
+    moved = packed("float32", [(5.0, 5.0, 5.0)] * 4, 3)
+    REGISTRY.execute("blender.set_mesh_data", {"object": "Quad", "positions": moved})
+    assert page(2).tolist() == [5.0] * 6
+
+
+def test_get_mesh_data_rejects_non_mesh_objects(bpy):
+    with pytest.raises(ValueError):
+        REGISTRY.execute("blender.get_mesh_data", {"object": "Lamp"})
+    with pytest.raises(ValueError):
+        REGISTRY.execute("blender.get_mesh_data", {"object": "Missing"})
+
+
+def packed(dtype, rows, width=1):
+    flat = [value for row in rows for value in (row if isinstance(row, tuple) else (row,))]
+    shape = [len(rows), width] if width > 1 else [len(rows)]
+    return pack_array(array({"float32": "f", "int32": "i"}[dtype], flat), shape)
+
+
+def test_set_mesh_data_builds_new_object_from_polygons(bpy):
+    corners = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0), (0.5, 0.5, 1.0)]
+    arguments = {
+        "object": "Prism",
+        "positions": packed("float32", corners, 3),
+        "polygon_sizes": packed("int32", [4, 3]),
+        "loop_vertices": packed("int32", [0, 1, 2, 3, 0, 1, 4]),
+        "uvs": packed("float32", [(0.0, 0.0)] * 7, 2),
+    }
+
+    result = REGISTRY.execute("blender.set_mesh_data", arguments)
+
+    mesh = bpy.data.objects["Prism"].data
+    assert result["created"] and result["counts"]["polygons"] == 2 and result["counts"]["loops"] == 7
+    assert mesh.polygons.columns["loop_start"] == [0, 4]
+    assert mesh.vertices.columns["co"][12:] == [0.5, 0.5, 1.0]
+    assert mesh.uv_layers["UVMap"].data.columns["uv"] == [0.0] * 14
+    assert bpy.context.scene.collection.objects.linked == [bpy.data.objects["Prism"]]
+    assert mesh.updates == [True]
+
+
+def test_set_mesh_data_updates_positions_in_place(bpy):
+    mesh = bpy.data.objects["Quad"].data
+    moved = [(0.0, 0.0, 2.0), (1.0, 0.0, 2.0), (1.0, 1.0, 2.0), (0.0, 1.0, 2.0)]
+
+    result = REGISTRY.execute("blender.set_mesh_data", {"object": "Quad", "positions": packed("float32", moved, 3)})
+
+    assert not result["created"] and not result["rebuilt"]
+    assert mesh.vertices.columns["co"][2::3] == [2.0] * 4
+    assert mesh.loops.columns["vertex_index"] == [0, 1, 2, 0, 2, 3]
+    assert mesh.updates == [False]
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"positions": packed("float32", [(0.0, 0.0, 0.0)], 3)},
+        {"triangles": packed("int32", [(0, 1, 9)], 3)},
+        {"polygon_sizes": packed("int32", [4]), "loop_vertices": packed("int32", [0, 1, 2])},
+        {"uvs": packed("float32", [(0.0, 0.0)], 2)},
+    ],
+)
+def test_set_mesh_data_rejects_inconsistent_buffers(bpy, arguments):
+    with pytest.raises(ValueError):
+        REGISTRY.execute("blender.set_mesh_data", dict(arguments, object="Quad"))
+
+
+ORIGIN = (0.0, 0.0, 0.0)
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"object": "Quad", "positions": packed("float32", [ORIGIN] * 3, 3), "edges": packed("int32", [(0, 7)], 2)},
+        {"object": "Quad", "edges": packed("int32", [(0, 1)], 2)},
+        {"object": "Fresh", "triangles": packed("int32", [(0, 1, 2)], 3)},
+        {"object": "Fresh", "positions": packed("float32", [ORIGIN] * 3, 3), "uvs": packed("float32", [(0.0, 0.0)], 2)},
+        {"object": "Fresh", "positions": packed("float32", [ORIGIN], 3), "collection": "Nope"},
+    ],
+)
+def test_set_mesh_data_changes_nothing_when_input_is_invalid(bpy, arguments):
+    quad = bpy.data.objects["Quad"].data
+    before = (quad.vertices.columns["co"], quad.edges.columns["vertices"], quad.loops.columns["vertex_index"])
+
+    with pytest.raises(ValueError):
+        REGISTRY.execute("blender.set_mesh_data", arguments)
+
+    assert "Fresh" not in bpy.data.objects and not bpy.context.scene.collection.objects.linked
+    assert (quad.vertices.columns["co"], quad.edges.columns["vertices"], quad.loops.columns["vertex_index"]) == before
+
+
+def test_create_objects_shares_primitive_data_and_updates_once(bpy):
+    entries = [{"name": "Box", "location": [float(i), 0.0, 0.0]} for i in range(3)]
+    entries += [
+        {"primitive": "empty", "name": "Pivot", "collection": "Props"},
+        {"mesh": "Cube", "scale": [2.0, 2.0, 2.0]},
+    ]
+
+    result = REGISTRY.execute("blender.create_objects", {"objects": entries})
+
+    objects = bpy.data.objects
+    assert result["objects"] == ["Box", "Box.001", "Box.001.001", "Pivot", "Cube"]
+    assert objects["Box.001"].location == [1.0, 0.0, 0.0]
+    assert objects["Box"].data is objects["Box.001.001"].data is objects["Cube"].data
+    assert len(objects["Box"].data.faces) == 6
+    assert objects["Pivot"].data is None
+    assert bpy.data.collections["Props"].objects.linked == [objects["Pivot"]]
+    assert len(bpy.context.scene.collection.objects.linked) == 4
+    assert bpy.context.view_layer.updates == 1
+
+
+def test_create_objects_copies_data_when_not_shared(bpy):
+    REGISTRY.execute("blender.create_objects", {"objects": [{"primitive": "plane"}] * 2, "share_data": False})
+
+    assert bpy.data.objects["Plane"].data is not bpy.data.objects["Plane.001"].data
+
+
+def test_create_objects_rejects_unknown_collection_before_creating_anything(bpy):
+    with pytest.raises(ValueError):
+        REGISTRY.execute("blender.create_objects", {"objects": [{"name": "A"}, {"name": "B", "collection": "Nope"}]})
+    assert "A" not in bpy.data.objects
+
+
+def test_set_transforms_applies_packed_rows_and_updates_once(bpy, monkeypatch):
+    monkeypatch.setitem(sys.modules, "mathutils", SimpleNamespace(Matrix=lambda rows: ("Matrix", rows)))
+    REGISTRY.execute("blender.create_objects", {"objects": [{"name": "A"}, {"name": "B"}]})
+    updates = bpy.context.view_layer.updates
+    identity = (1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+
+    REGISTRY.execute(
+        "blender.set_transforms",
+        {
+            "objects": ["B", "A"],
+            "locations": packed("float32", [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)], 3),
+            "scales": packed("float32", [(2.0, 2.0, 2.0), (1.0, 1.0, 1.0)], 3),
+            "matrices": pack_array(array("f", identity * 2), [2, 4, 4]),
+            "space": "basis",
+        },
+    )
+
+    objects = bpy.data.objects
+    assert objects["B"].location == (1.0, 2.0, 3.0) and objects["A"].location == (4.0, 5.0, 6.0)
+    assert objects["B"].scale == (2.0, 2.0, 2.0)
+    assert objects["A"].matrix_basis[1][0] == identity[0:4]
+    assert bpy.context.view_layer.updates == updates + 1
+
+
+def test_set_transforms_resolves_renamed_objects(bpy):
+    objects = bpy.data.objects
+    REGISTRY.execute("blender.set_transforms", {"objects": ["Quad"]})
+    objects["Renamed"] = objects.pop("Quad")
+    objects["Renamed"].name = "Renamed"
+
+    with pytest.raises(ValueError):
+        REGISTRY.execute("blender.set_transforms", {"objects": ["Quad"]})
+    origin = packed("float32", [(0.0, 0.0, 0.0)], 3)
+    REGISTRY.execute("blender.set_transforms", {"objects": ["Renamed"], "locations": origin})
+    assert objects["Renamed"].location == (0.0, 0.0, 0.0)
+
+
+def test_set_transforms_switches_rotation_mode(bpy):
+    REGISTRY.execute("blender.create_objects", {"objects": [{"name": "A"}, {"name": "B"}]})
+    objects = bpy.data.objects
+
+    quaternions = packed("float32", [(1.0, 0.0, 0.0, 0.0)] * 2, 4)
+    REGISTRY.execute("blender.set_transforms", {"objects": ["A", "B"], "quaternions": quaternions})
+    assert objects["A"].rotation_mode == objects["B"].rotation_mode == "QUATERNION"
+    assert objects["A"].rotation_quaternion == (1.0, 0.0, 0.0, 0.0)
+
+    rotations = packed("float32", [(0.5, 0.0, 0.0)], 3)
+    REGISTRY.execute("blender.set_transforms", {"objects": ["B"], "rotations": rotations})
+    assert objects["B"].rotation_mode == "XYZ"
+    assert objects["B"].rotation_euler == (0.5, 0.0, 0.0)
+
+
+def test_set_transforms_rejects_rotations_with_quaternions(bpy):
+    arguments = {
+        "objects": ["Quad"],
+        "rotations": packed("float32", [(0.5, 0.0, 0.0)], 3),
+        "quaternions": packed("float32", [(1.0, 0.0, 0.0, 0.0)], 4),
+    }
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        REGISTRY.execute("blender.set_transforms", arguments)
+    assert not hasattr(bpy.data.objects["Quad"], "rotation_mode")
+
+
+def test_set_transforms_rejects_mismatched_rows_before_applying(bpy):
+    with pytest.raises(ValueError):
+        REGISTRY.execute(
+            "blender.set_transforms",
+            {"objects": ["Quad"], "locations": packed("float32", [(1.0, 1.0, 1.0)] * 2, 3)},
+        )
+    assert not hasattr(bpy.data.objects["Quad"], "location")
+
+
+def test_batch_runs_steps_with_one_update_and_undo_step(bpy):
+    origin = packed("float32", [(0.0, 0.0, 0.0)], 3)
+    steps = [{"tool": "blender.create_objects", "arguments": {"objects": [{"name": f"Box{i}"}]}} for i in range(3)]
+    steps += [
+        {"tool": "blender.set_transforms", "arguments": {"objects": ["Missing"], "locations": origin}},
+        {"tool": "blender.nope"},
+        {"tool": "blender.set_transforms", "arguments": {"objects": ["Box0"], "locations": origin}},
+    ]
+
+    result = REGISTRY.execute("blender.batch", {"steps": steps, "on_error": "continue", "undo_message": "Boxes"})
+
+    assert [step["ok"] for step in result["results"]] == [True, True, True, False, False, True]
+    assert result["results"][3]["error"] == "object not found: Missing"
+    assert result["results"][4]["error"] == "unknown tool: blender.nope"
+    assert (result["succeeded"], result["failed"], result["skipped"]) == (4, 2, 0)
+    assert bpy.context.view_layer.updates == 1
+    assert bpy.ops.ed.undo_pushes == ["Boxes"]
+
+
+def test_batch_stops_at_first_failure_by_default(bpy):
+    steps = [
+        {"tool": "blender.ping"},
+        {"tool": "blender.get_mesh_info", "arguments": {"object": "Lamp"}},
+        {"tool": "blender.create_objects", "arguments": {"objects": [{"name": "Late"}]}},
+    ]
+
+    result = REGISTRY.execute("blender.batch", {"steps": steps})
+
+    assert (result["succeeded"], result["failed"], result["skipped"]) == (1, 1, 1)
+    assert "Late" not in bpy.data.objects
+    assert bpy.context.view_layer.updates == 0
+    assert bpy.ops.ed.undo_pushes == ["MCP batch"]
+
+    with pytest.raises(ValueError):
+        REGISTRY.execute("blender.batch", {"steps": [{"tool": "blender.batch", "arguments": {"steps": []}}]})
+
+
+def test_batch_validates_every_step_before_running_any(bpy):
+    steps = [
+        {"tool": "blender.create_objects", "arguments": {"objects": [{"name": "Early"}]}},
+        {"tool": "blender.set_transforms", "arguments": {}},
+        {"tool": "blender.create_objects", "arguments": {"objects": "Box"}},
+    ]
+
+    with pytest.raises(ValueError, match="step 1: .*objects.*; step 2: .*objects"):
+        REGISTRY.execute("blender.batch", {"steps": steps})
+    assert "Early" not in bpy.data.objects
+    assert bpy.ops.ed.undo_pushes == []
+
+    result = REGISTRY.execute("blender.batch", {"steps": steps, "on_error": "continue"})
+    assert [step["ok"] for step in result["results"]] == [True, False, False]
+    assert "objects" in result["results"][1]["error"]
+    assert "Early" in bpy.data.objects
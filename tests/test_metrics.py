@@ -0,0 +1,194 @@
+import json
+import os
+import sys
+from http.client import HTTPConnection
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core import metrics
+from mcp_core.metrics import METRICS, METRICS_TOOL, Histogram, Metrics, with_metrics_batch, with_metrics_tool
+from mcp_core.server import EXECUTION_ERROR, handle_request
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    METRICS.reset()
+    yield
+    METRICS.reset()
+
+
+def test_histogram_percentiles_are_within_bucket_error():
+    histogram = Histogram()
+    for micros in range(1, 100001):
+        histogram.record(micros / 1_000_000)
+
+    assert histogram.count == 100000
+    for percent in (50.0, 90.0, 99.0, 99.9):
+        expected = percent / 100.0 * 0.1
+        assert histogram.percentile(percent) == pytest.approx(expected, rel=1 / 16)
+    assert histogram.percentile(100.0) == pytest.approx(0.1)
+    assert histogram.snapshot()["min_ms"] == pytest.approx(0.001)
+
+
+def test_new_names_fold_into_other_past_max_series(monkeypatch):
+    monkeypatch.setattr(metrics, "MAX_SERIES", 2)
+    registry = Metrics()
+    for name in ("a", "b", "c", "d"):
+        registry.observe("tool", name, 0.001, error=-32003 if name == "d" else None)
+
+    tools = registry.snapshot()["tool"]
+    assert sorted(tools) == ["a", "b", "other"]
+    assert tools["other"]["count"] == 2
+    assert tools["other"]["errors_by_code"] == {"-32003": 1}
+
+
+def test_disabled_metrics_record_nothing():
+    registry = Metrics(enabled=False)
+    registry.observe("tool", "blender.ping", 0.001)
+
+    assert set(registry.snapshot()) == {"uptime_s"}
+
+
+def test_handle_request_records_methods_tools_and_error_codes():
+    def executor(name, arguments):
+        if name == "boom":
+            raise RuntimeError("boom")
+        return {"ok": True}
+
+    def call(name, request_id):
+        return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": {"name": name, "arguments": {}}}
+
+    handle_request(call("blender.ping", 1), tool_executor=executor)
+    handle_request(call("boom", 2), tool_executor=executor)
+    handle_request({"jsonrpc": "2.0", "id": 3, "method": "no/such/method"})
+    handle_request([call("blender.ping", 4)], tool_executor=executor)
+
+    snapshot = METRICS.snapshot()
+    assert snapshot["method"]["tools/call"]["count"] == 2
+    assert snapshot["method"]["tools/call"]["errors_by_code"] == {str(EXECUTION_ERROR): 1}
+    assert snapshot["method"]["other"]["errors"] == 1
+    assert snapshot["method"]["batch"]["count"] == 1
+    assert snapshot["tool"]["blender.ping"]["count"] == 2
+    assert snapshot["tool"]["boom"]["errors"] == 1
+    assert snapshot["tool"]["blender.ping"]["p99_ms"] >= snapshot["tool"]["blender.ping"]["p50_ms"]
+
+
+def test_http_transport_serves_metrics():
+    from mcp_core.transport_http import run_http
+
+    server = run_http(port=0, tool_executor=lambda name, arguments: {"message": "pong"})
+    try:
+        host, port = server.server_address
+        conn = HTTPConnection(host, port, timeout=2)
+        body = json.dumps(
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "blender.ping", "arguments": {}}}
+        )
+        conn.request("POST", "/mcp", body=body, headers={"Content-Type": "application/json"})
+        conn.getresponse().read()
+        conn.request("GET", "/metrics")
+        snapshot = json.loads(conn.getresponse().read())
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert snapshot["tool"]["blender.ping"]["count"] == 1
+    assert "p50_ms" in snapshot["method"]["tools/call"]
+
+
+def test_metrics_tool_is_served_locally_with_a_stable_listing():
+    tools = [{"name": "blender.ping", "input_schema": {"type": "object"}}]
+    calls = []
+
+    def executor(name, arguments):
+        calls.append(name)
+        return {"message": "pong"}
+
+    wrapped_executor, wrapped_lister = with_metrics_tool(executor, lambda: tools)
+    listing = wrapped_lister()
+
+    assert [tool["name"] for tool in listing] == ["blender.ping", METRICS_TOOL["name"]]
+    assert wrapped_lister() is listing
+    assert "uptime_s" in wrapped_executor(METRICS_TOOL["name"], {})
+    assert wrapped_executor("blender.ping", {}) == {"message": "pong"}
+    assert calls == ["blender.ping"]
+
+
+def test_daemon_records_proxy_latency_separately(monkeypatch):
+    from mcp_core.transport_http import run_http
+    from mcp_daemon.main import execute_tool
+
+    def provider(name, arguments):
+        if name == "boom":
+            raise RuntimeError("boom")
+        return {"message": "pong"}
+
+    server = run_http(port=0, tool_executor=provider)
+    try:
+        host, port = server.server_address
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", f"http://{host}:{port}/mcp")
+        execute_tool("blender.ping", {})
+        with pytest.raises(RuntimeError):
+            execute_tool("boom", {})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    snapshot = METRICS.snapshot()
+    # The provider shares this process, so both sides of the hop land in one registry.
+    assert snapshot["proxy"]["blender.ping"]["count"] == 1
+    assert snapshot["proxy"]["boom"]["errors_by_code"] == {"RuntimeError": 1}
+    assert snapshot["tool"]["boom"]["errors_by_code"] == {str(EXECUTION_ERROR): 1}
+    assert snapshot["proxy"]["blender.ping"]["max_ms"] >= snapshot["tool"]["blender.ping"]["max_ms"]
+
+
+def test_batch_members_are_recorded_per_tool_and_metrics_is_served_locally():
+    from mcp_core.cancellation import current_batch
+
+    forwarded = []
+
+    def batch_executor(calls):
+        forwarded.append(([name for name, _ in calls], [context.request_id for context in current_batch()]))
+        return [{"message": "pong"} if name == "blender.ping" else RuntimeError("boom") for name, _ in calls]
+
+    def call(name, request_id):
+        return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": {"name": name, "arguments": {}}}
+
+    batch = [call("blender.ping", 1), call(METRICS_TOOL["name"], 2), call("boom", 3)]
+    response = handle_request(batch, batch_executor=with_metrics_batch(batch_executor))
+
+    assert forwarded == [(["blender.ping", "boom"], [1, 3])]
+    assert "uptime_s" in response[1]["result"]["data"]
+    snapshot = METRICS.snapshot()
+    assert snapshot["tool"]["blender.ping"]["count"] == 1
+    assert snapshot["tool"]["boom"]["errors_by_code"] == {str(EXECUTION_ERROR): 1}
+    assert snapshot["tool"][METRICS_TOOL["name"]]["count"] == 1
+
+
+def test_daemon_records_proxy_latency_of_batch_members(monkeypatch):
+    from mcp_core.transport_http import run_http
+    from mcp_daemon.main import execute_tool_batch
+
+    def provider(name, arguments):
+        if name == "boom":
+            raise RuntimeError("boom")
+        return {"message": "pong"}
+
+    server = run_http(port=0, tool_executor=provider)
+    try:
+        host, port = server.server_address
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", f"http://{host}:{port}/mcp")
+        execute_tool_batch([("blender.ping", {}), ("boom", {})])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    snapshot = METRICS.snapshot()
+    assert snapshot["proxy"]["blender.ping"]["count"] == 1
+    assert snapshot["proxy"]["boom"]["errors_by_code"] == {"RuntimeError": 1}
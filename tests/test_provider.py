@@ -0,0 +1,103 @@
+import json
+import os
+import sys
+import threading
+import time
+from http.client import HTTPConnection
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from blender_bridge import provider_http
+from blender_tools import scene_index
+from mcp_core.server import REQUEST_TIMEOUT, SERVER_OVERLOADED
+
+
+@pytest.fixture
+def bpy(monkeypatch):
+    timers = set()
+    module = SimpleNamespace(
+        app=SimpleNamespace(
+            timers=SimpleNamespace(
+                is_registered=lambda fn: fn in timers,
+                register=lambda fn, first_interval=0.0, persistent=False: timers.add(fn),
+                unregister=timers.discard,
+            ),
+            handlers=SimpleNamespace(persistent=lambda fn: fn, depsgraph_update_post=[], load_post=[]),
+        ),
+        data=SimpleNamespace(objects=[]),
+    )
+    monkeypatch.setitem(sys.modules, "bpy", module)
+    yield module
+    scene_index.uninstall()
+
+
+def post(server, payload):
+    host, port = server.server_address
+    conn = HTTPConnection(host, port, timeout=5)
+    try:
+        conn.request("POST", "/mcp", body=json.dumps(payload), headers={"Content-Type": "application/json"})
+        return json.loads(conn.getresponse().read())
+    finally:
+        conn.close()
+
+
+def ping(request_id, timeout):
+    params = {"name": "blender.ping", "arguments": {}, "_meta": {"timeout": timeout}}
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": params}
+
+
+def test_provider_rejects_calls_beyond_its_worker_pool(bpy, monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_PROVIDER_WORKERS", "1")
+    monkeypatch.setenv("BLENDER_MCP_PROVIDER_QUEUE", "0")
+    # The fake timers never tick, so the first call holds the only worker until it times out.
+    server = provider_http.serve(port=0)
+    try:
+        held = {}
+        first = threading.Thread(target=lambda: held.update(post(server, ping(1, 1.0))))
+        first.start()
+        time.sleep(0.3)
+        rejected = post(server, ping(2, 1.0))
+        listing = post(server, {"jsonrpc": "2.0", "id": 3, "method": "tools/list", "params": {}})
+        first.join()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert rejected["error"]["code"] == SERVER_OVERLOADED
+    assert any(tool["name"] == "blender.ping" for tool in listing["result"]["tools"])
+    assert held["error"]["code"] == REQUEST_TIMEOUT
+
+
+def test_provider_listing_keeps_compiled_validators(bpy, monkeypatch):
+    from mcp_core import schema
+    from mcp_core.server import handle_request
+
+    compiled = []
+
+    def counting_compile(tool_schema, *args):
+        if not args:
+            # Nested schemas are compiled with a path; count whole tools only.
+            compiled.append(tool_schema)
+        return original(tool_schema, *args)
+
+    original = schema.compile_schema
+    monkeypatch.setattr(schema, "compile_schema", counting_compile)
+    executor, lister = provider_http._build_provider()
+
+    assert lister() is lister()
+    for request_id in range(5):
+        call = {"name": "blender.job_status", "arguments": {}}
+        response = handle_request(
+            {"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": call},
+            tool_executor=executor,
+            tool_lister=lister,
+        )
+        assert "error" not in response
+    assert len(compiled) == 1
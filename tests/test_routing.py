@@ -0,0 +1,147 @@
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core.cancellation import RequestContext
+from mcp_core.server import handle_request
+from mcp_daemon import main
+from mcp_daemon.routing import CONSISTENT_HASH, LEAST_OUTSTANDING, ROUND_ROBIN, ProviderRouter
+
+
+class FakePool:
+    def __init__(self, url):
+        self.url = url
+        self.bodies = []
+        self.error = None
+        self.gate = None
+
+    def post(self, body, content_type="application/json", context=None):
+        if self.gate is not None:
+            self.gate.wait(2)
+        if self.error is not None:
+            raise self.error
+        self.bodies.append(body)
+        payload = json.loads(body)
+        return json.dumps({"jsonrpc": "2.0", "id": payload.get("id"), "result": {"url": self.url}}).encode()
+
+
+def make_router(policy, count=3, **kwargs):
+    pools = {}
+
+    def pool_for(url):
+        pools[url] = FakePool(url)
+        return pools[url]
+
+    router = ProviderRouter([f"p{index}" for index in range(count)], pool_for, policy=policy, **kwargs)
+    return router, pools
+
+
+def route(router, session=None):
+    context = RequestContext(None, None, {} if session is None else {"session": session})
+    body = router.post(b'{"jsonrpc": "2.0", "id": 1, "method": "tools/call"}', context=context)
+    return json.loads(body)["result"]["url"]
+
+
+def test_round_robin_cycles_backends():
+    router, _ = make_router(ROUND_ROBIN)
+    assert [route(router) for _ in range(6)] == ["p0", "p1", "p2", "p0", "p1", "p2"]
+
+
+def test_least_outstanding_avoids_busy_backend():
+    router, pools = make_router(LEAST_OUTSTANDING, count=2)
+    pools["p0"].gate = threading.Event()
+    busy = threading.Thread(target=route, args=(router,), daemon=True)
+    busy.start()
+    for _ in range(200):
+        if router.backends[0].outstanding:
+            break
+        threading.Event().wait(0.005)
+
+    assert [route(router) for _ in range(3)] == ["p1", "p1", "p1"]
+    pools["p0"].gate.set()
+    busy.join(2)
+
+
+def test_consistent_hash_keeps_sessions_and_moves_only_ejected_keys():
+    router, pools = make_router(CONSISTENT_HASH, failure_threshold=1)
+    sessions = [f"scene-{index}" for index in range(40)]
+    placement = {session: route(router, session) for session in sessions}
+
+    assert len(set(placement.values())) == 3
+    assert all(route(router, session) == url for session, url in placement.items())
+
+    pools["p1"].error = ConnectionRefusedError("down")
+    moved = {session: route(router, session) for session in sessions}
+    assert all(moved[session] == url for session, url in placement.items() if url != "p1")
+    assert "p1" not in moved.values()
+
+
+def test_unhealthy_backend_is_ejected_then_retried():
+    router, pools = make_router(ROUND_ROBIN, count=2, failure_threshold=2, ejection_time=60.0)
+    pools["p0"].error = ConnectionRefusedError("down")
+
+    # Refused connections fail over to the other backend.
+    assert [route(router) for _ in range(4)] == ["p1"] * 4
+    assert [backend["healthy"] for backend in router.stats()["backends"]] == [False, True]
+
+    router.backends[0].ejected_until = 0.0
+    pools["p0"].error = None
+    assert "p0" in {route(router) for _ in range(2)}
+
+
+def test_other_errors_are_not_retried():
+    router, pools = make_router(ROUND_ROBIN, count=2)
+    pools["p0"].error = TimeoutError("slow")
+    with pytest.raises(TimeoutError):
+        route(router)
+    assert pools["p1"].bodies == []
+
+
+def start_provider(name):
+    from mcp_core.transport_http import run_http
+
+    tools = [
+        {"name": "blender.ping", "input_schema": {"type": "object"}},
+        {"name": f"only.{name}", "input_schema": {"type": "object"}},
+    ]
+    return run_http(port=0, tool_executor=lambda tool, arguments: {"provider": name}, tool_lister=lambda: tools)
+
+
+def test_daemon_merges_tools_list_and_routes_by_meta_session(monkeypatch):
+    servers = [start_provider("p0"), start_provider("p1")]
+    try:
+        urls = [f"http://{host}:{port}/mcp" for host, port in (server.server_address for server in servers)]
+        router = ProviderRouter(urls, main._pool_for, policy=CONSISTENT_HASH)
+        monkeypatch.setattr(main, "_ROUTER", router)
+        monkeypatch.setattr(main, "_LISTING", (None, 0.0))
+
+        tools = main.list_tools()
+        assert [tool["name"] for tool in tools] == ["blender.ping", "only.p0", "only.p1"]
+        assert main.list_tools() is tools
+
+        request = {
+            "jsonrpc": "2.0",
+            "id": 5,
+            "method": "tools/call",
+            "params": {"name": "blender.ping", "arguments": {}, "_meta": {"session": "scene-7"}},
+        }
+        responses = [
+            handle_request(request, tool_executor=main.execute_tool, tool_lister=main.list_tools) for _ in range(3)
+        ]
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+    # The daemon passes the provider's {"ok", "data"} result through as its own data.
+    providers = {response["result"]["data"]["data"]["provider"] for response in responses}
+    assert len(providers) == 1
@@ -0,0 +1,221 @@
+import itertools
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, os.fspath(ROOT))
+
+from src.blender_tools import REGISTRY, handlers, scene_index
+
+
+_UIDS = itertools.count(1)
+
+
+class FakeCollection:
+    def __init__(self, name):
+        self.name = name
+        self.objects = []
+
+
+class FakeObject:
+    def __init__(self, name, type="MESH", collections=(), tags=None):
+        self.name = name
+        self.type = type
+        self.session_uid = next(_UIDS)
+        self.users_collection = list(collections)
+        self.properties = {} if tags is None else {"tags": tags}
+        self.parent = None
+        self.location = (0.0, 0.0, 0.0)
+        self.rotation_euler = (0.0, 0.0, 0.0)
+        self.scale = (1.0, 1.0, 1.0)
+
+    def get(self, key):
+        return self.properties.get(key)
+
+
+class FakeObjects(dict):
+    def __iter__(self):
+        return iter(list(self.values()))
+
+    def add(self, obj):
+        self[obj.name] = obj
+        for collection in obj.users_collection:
+            collection.objects.append(obj)
+        return obj
+
+
+@pytest.fixture
+def bpy(monkeypatch):
+    props = FakeCollection("Props")
+    objects = FakeObjects()
+    for i in range(25):
+        objects.add(FakeObject(f"Crate.{i:03d}", collections=[props], tags="wood,prop" if i % 5 == 0 else None))
+    objects.add(FakeObject("Sun", type="LIGHT"))
+    objects.add(FakeObject("Camera", type="CAMERA", tags=["hero"]))
+
+    app_handlers = SimpleNamespace(depsgraph_update_post=[], load_post=[], persistent=lambda fn: fn)
+    module = SimpleNamespace(
+        data=SimpleNamespace(objects=objects),
+        app=SimpleNamespace(handlers=app_handlers),
+        types=SimpleNamespace(Object=FakeObject, Collection=FakeCollection),
+        props=props,
+    )
+    monkeypatch.setitem(sys.modules, "bpy", module)
+    monkeypatch.setattr(scene_index, "SCENE_INDEX", scene_index.SceneIndex())
+    yield module
+    scene_index.uninstall()
+
+
+def depsgraph_update(bpy, *datablocks):
+    update = SimpleNamespace(updates=[SimpleNamespace(id=datablock) for datablock in datablocks])
+    for handler in bpy.app.handlers.depsgraph_update_post:
+        handler(None, update)
+
+
+def test_list_objects_pages_with_cursor(bpy):
+    seen = []
+    cursor = None
+    while True:
+        arguments = {"limit": 10} if cursor is None else {"limit": 10, "cursor": cursor}
+        page = REGISTRY.execute("blender.list_objects", arguments)
+        seen += [item["name"] for item in page["objects"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert page["total"] == 27
+    assert seen == sorted(bpy.data.objects.keys())
+    assert len(bpy.app.handlers.depsgraph_update_post) == 1
+
+
+def test_find_objects_intersects_filters(bpy):
+    result = REGISTRY.execute("blender.find_objects", {"type": "MESH", "tag": "wood", "collection": "Props"})
+    assert [item["name"] for item in result["objects"]] == [f"Crate.{i:03d}" for i in range(0, 25, 5)]
+    assert result["objects"][0]["tags"] == ["prop", "wood"]
+    assert result["objects"][0]["location"] == [0.0, 0.0, 0.0]
+
+    page = REGISTRY.execute("blender.find_objects", {"name_prefix": "Crate.01", "limit": 4})
+    assert [item["name"] for item in page["objects"]] == ["Crate.010", "Crate.011", "Crate.012", "Crate.013"]
+    assert page["next_cursor"] == "Crate.013"
+
+    assert REGISTRY.execute("blender.find_objects", {"tag": "hero", "type": "MESH"})["objects"] == []
+
+
+def test_filtered_pages_follow_name_order_after_updates(bpy):
+    REGISTRY.execute("blender.list_objects", {})
+    early = bpy.data.objects.add(FakeObject("Barrel", collections=[bpy.props], tags="wood"))
+    late = bpy.data.objects.add(FakeObject("Crate.999", collections=[bpy.props], tags="wood"))
+    depsgraph_update(bpy, late, early)
+
+    seen = []
+    cursor = None
+    while True:
+        arguments = {"collection": "Props", "tag": "wood", "limit": 2}
+        if cursor is not None:
+            arguments["cursor"] = cursor
+        page = REGISTRY.execute("blender.find_objects", arguments)
+        seen += [item["name"] for item in page["objects"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ["Barrel"] + [f"Crate.{i:03d}" for i in range(0, 25, 5)] + ["Crate.999"]
+
+
+def test_depsgraph_updates_keep_index_current(bpy):
+    REGISTRY.execute("blender.list_objects", {})
+    index = scene_index.SCENE_INDEX
+
+    camera = bpy.data.objects.pop("Camera")
+    camera.name = "HeroCam"
+    bpy.data.objects["HeroCam"] = camera
+    lamp = bpy.data.objects.add(FakeObject("Lamp", type="LIGHT", tags="key"))
+    depsgraph_update(bpy, camera, lamp)
+    del bpy.data.objects["Sun"]
+    depsgraph_update(bpy)
+
+    assert index.get("Camera") is None and index.get("Sun") is None
+    assert index.get("HeroCam").tags == ("hero",)
+    lights = REGISTRY.execute("blender.find_objects", {"type": "LIGHT"})["objects"]
+    assert [item["name"] for item in lights] == ["Lamp"]
+
+    crate = bpy.data.objects["Crate.001"]
+    crate.users_collection = []
+    bpy.props.objects.remove(crate)
+    depsgraph_update(bpy, bpy.props)
+    props = REGISTRY.execute("blender.find_objects", {"collection": "Props", "limit": 1000})["objects"]
+    assert "Crate.001" not in [item["name"] for item in props]
+
+
+def test_scene_diff_reports_changes_since_token(bpy):
+    first = REGISTRY.execute("blender.scene_diff", {})
+    assert first["full"] is True
+    assert len(first["objects"]) == 27
+
+    unchanged = REGISTRY.execute("blender.scene_diff", {"since": first["version"]})
+    assert unchanged == {"version": first["version"], "full": False, "added": [], "changed": [], "removed": []}
+
+    crate = bpy.data.objects["Crate.003"]
+    crate.location = (1.0, 2.0, 3.0)
+    sun = bpy.data.objects.pop("Sun")
+    sun.name = "Key"
+    bpy.data.objects["Key"] = sun
+    temp = bpy.data.objects.add(FakeObject("Temp"))
+    lamp = bpy.data.objects.add(FakeObject("Lamp", type="LIGHT"))
+    depsgraph_update(bpy, crate, sun, temp, lamp)
+    del bpy.data.objects["Temp"]
+    del bpy.data.objects["Camera"]
+    depsgraph_update(bpy)
+
+    delta = REGISTRY.execute("blender.scene_diff", {"since": first["version"]})
+    assert delta["full"] is False
+    assert [item["name"] for item in delta["added"]] == ["Key", "Lamp"]
+    assert [item["name"] for item in delta["changed"]] == ["Crate.003"]
+    assert delta["changed"][0]["location"] == [1.0, 2.0, 3.0]
+    assert delta["removed"] == ["Camera", "Sun"]
+
+    assert REGISTRY.execute("blender.scene_diff", {"since": delta["version"]})["added"] == []
+
+
+def test_scene_diff_falls_back_to_snapshot(bpy, monkeypatch):
+    monkeypatch.setattr(scene_index, "SCENE_INDEX", scene_index.SceneIndex(max_changes=2))
+    token = REGISTRY.execute("blender.scene_diff", {})["version"]
+    for name in ("A", "B", "C"):
+        depsgraph_update(bpy, bpy.data.objects.add(FakeObject(name)))
+
+    assert REGISTRY.execute("blender.scene_diff", {"since": token})["full"] is True
+    assert REGISTRY.execute("blender.scene_diff", {"since": "other:1"})["full"] is True
+    recent = scene_index.SCENE_INDEX.token
+    depsgraph_update(bpy, bpy.data.objects.add(FakeObject("D")))
+    assert [item["name"] for item in REGISTRY.execute("blender.scene_diff", {"since": recent})["added"]] == ["D"]
+
+
+def test_load_post_rebuilds(bpy):
+    scene_index.install()
+    bpy.data.objects.clear()
+    bpy.data.objects.add(FakeObject("Fresh"))
+    for handler in bpy.app.handlers.load_post:
+        handler(None)
+
+    assert [record.name for record in scene_index.SCENE_INDEX.find()[0]] == ["Fresh"]
+
+
+def test_handler_fan_out_installs_one_blender_handler(bpy):
+    calls = []
+    first = lambda *args: calls.append("first")  # noqa: E731
+    second = lambda *args: calls.append("second")  # noqa: E731
+    handlers.subscribe("depsgraph_update_post", first)
+    handlers.subscribe("depsgraph_update_post", second)
+
+    assert len(bpy.app.handlers.depsgraph_update_post) == 1
+    depsgraph_update(bpy)
+    assert calls == ["first", "second"]
+
+    handlers.unsubscribe("depsgraph_update_post", first)
+    handlers.unsubscribe("depsgraph_update_post", second)
+    assert bpy.app.handlers.depsgraph_update_post == []
@@ -0,0 +1,110 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, os.fspath(ROOT))
+
+from src.blender_tools.registry import ToolRegistry
+from src.mcp_core.schema import ValidatorCache, compile_schema
+from src.mcp_core.server import handle_request
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "count": {"type": "integer", "minimum": 1, "maximum": 10},
+        "mode": {"enum": ["fast", "exact"]},
+        "location": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3},
+    },
+    "required": ["name"],
+    "additionalProperties": False,
+}
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"name": "a"},
+        {"name": "a", "count": 3, "mode": "fast", "location": [0, 1.5, 2]},
+    ],
+)
+def test_valid_arguments_pass(arguments):
+    assert compile_schema(SCHEMA)(arguments) is None
+
+
+@pytest.mark.parametrize(
+    "arguments, message",
+    [
+        ({}, "arguments.name is required"),
+        ({"name": 1}, "arguments.name must be string"),
+        ({"name": ""}, "arguments.name length must be >= 1"),
+        ({"name": "a", "count": True}, "arguments.count must be integer"),
+        ({"name": "a", "count": 2.0}, "arguments.count must be integer"),
+        ({"name": "a", "count": 11}, "arguments.count must be <= 10"),
+        ({"name": "a", "mode": "slow"}, "arguments.mode must be one of ['fast', 'exact']"),
+        ({"name": "a", "location": [0, "1", 2]}, "arguments.location[] must be number"),
+        ({"name": "a", "location": [0, 1]}, "arguments.location item count must be >= 3"),
+        ({"name": "a", "extra": 1}, "arguments.extra is not allowed"),
+    ],
+)
+def test_invalid_arguments_report_path(arguments, message):
+    assert compile_schema(SCHEMA)(arguments) == message
+
+
+def test_schema_without_constraints_compiles_to_none():
+    assert compile_schema({}) is None
+    assert compile_schema({"properties": {}, "required": []}) is None
+    assert compile_schema(None) is None
+
+
+def test_cache_compiles_once_and_invalidates_on_new_list():
+    tools = [{"name": "t", "input_schema": {"type": "object", "required": ["x"]}}]
+    cache = ValidatorCache()
+
+    assert cache.validate(tools, "t", {}) == "arguments.x is required"
+    compiled = cache._state[2]["t"]
+    assert cache.validate(tools, "t", {"x": 1}) is None
+    assert cache._state[2]["t"] is compiled
+
+    changed = [{"name": "t", "input_schema": {"type": "object"}}]
+    assert cache.validate(changed, "t", {}) is None
+    assert cache.validate(changed, "unknown", {"anything": 1}) is None
+    assert "unknown" not in cache._state[2]
+
+
+def test_invalid_arguments_never_reach_executor():
+    registry = ToolRegistry()
+    calls = []
+    registry.register("demo.scale", lambda arguments: calls.append(arguments) or {}, "Scale", SCHEMA)
+    request = {
+        "jsonrpc": "2.0",
+        "id": "v-1",
+        "method": "tools/call",
+        "params": {"name": "demo.scale", "arguments": {"name": 3}},
+    }
+
+    response = handle_request(request, tool_executor=registry.execute, tool_lister=registry.list_tools)
+
+    assert response["error"]["code"] == -32602
+    assert response["error"]["message"] == "arguments.name must be string"
+    assert response["id"] == "v-1"
+    assert calls == []
+
+
+def test_registry_change_invalidates_validators():
+    registry = ToolRegistry()
+    registry.register("demo.t", lambda arguments: {}, "T", {"type": "object", "required": ["x"]})
+    request = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "demo.t", "arguments": {}}}
+
+    first = handle_request(request, tool_executor=registry.execute, tool_lister=registry.list_tools)
+    registry.unregister("demo.t")
+    registry.register("demo.t", lambda arguments: {"ok": 1}, "T", {"type": "object"})
+    second = handle_request(request, tool_executor=registry.execute, tool_lister=registry.list_tools)
+
+    assert first["error"]["code"] == -32602
+    assert second["result"]["data"] == {"ok": 1}
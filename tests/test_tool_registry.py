@@ -0,0 +1,86 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, os.fspath(ROOT))
+
+from src.blender_tools import REGISTRY, ToolRegistry
+from src.mcp_core.server import handle_request
+
+
+def test_decorator_registers_dispatch_and_descriptor():
+    registry = ToolRegistry()
+
+    @registry.tool("demo.echo", "Echo arguments back.", {"type": "object", "properties": {"v": {"type": "string"}}})
+    def echo(arguments):
+        return {"v": arguments["v"]}
+
+    assert registry.execute("demo.echo", {"v": "hi"}) == {"v": "hi"}
+    assert registry.list_tools() == [
+        {
+            "name": "demo.echo",
+            "description": "Echo arguments back.",
+            "input_schema": {"type": "object", "properties": {"v": {"type": "string"}}},
+        }
+    ]
+
+
+def test_unknown_tool_raises_key_error():
+    with pytest.raises(KeyError):
+        ToolRegistry().execute("missing", {})
+
+
+def test_duplicate_registration_is_rejected():
+    registry = ToolRegistry()
+    registry.register("demo.a", lambda arguments: {}, "A")
+
+    with pytest.raises(ValueError):
+        registry.register("demo.a", lambda arguments: {}, "A again")
+
+
+def test_listing_is_cached_until_registry_changes():
+    registry = ToolRegistry()
+    registry.register("demo.a", lambda arguments: {}, "A")
+    first = registry.list_tools()
+    version = registry.version
+
+    assert registry.list_tools() is first
+
+    registry.register("demo.b", lambda arguments: {}, "B")
+    assert registry.list_tools() is not first
+    assert registry.version > version
+    assert [tool["name"] for tool in registry.list_tools()] == ["demo.a", "demo.b"]
+
+    registry.unregister("demo.a")
+    assert [tool["name"] for tool in registry.list_tools()] == ["demo.b"]
+
+
+def test_builtin_tools_are_registered():
+    assert "blender.ping" in REGISTRY
+    assert "blender.add_cube" in REGISTRY
+    assert REGISTRY.execute("blender.ping", {}) == {"message": "pong"}
+
+
+def test_registry_drives_handle_request():
+    request = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "blender.ping", "arguments": {}}}
+
+    response = handle_request(request, tool_executor=REGISTRY.execute, tool_lister=REGISTRY.list_tools)
+
+    assert response["result"]["data"] == {"message": "pong"}
+
+
+def test_stepwise_tool_runs_to_completion_unless_started():
+    registry = ToolRegistry()
+
+    @registry.tool("demo.steps", "Count in steps.")
+    def steps(arguments):
+        for step in range(3):
+            yield step / 3
+        return {"steps": 3}
+
+    assert registry.execute("demo.steps", {}) == {"steps": 3}
+    assert list(registry.start("demo.steps", {})) == [0.0, 1 / 3, 2 / 3]
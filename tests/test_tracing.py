@@ -0,0 +1,189 @@
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from blender_bridge.dispatcher import MainThreadDispatcher
+from mcp_core.server import handle_request
+from mcp_core.tracing import TRACER, Tracer
+from mcp_core.transport_stdio import _parse
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    path = tmp_path / "spans.jsonl"
+    monkeypatch.setattr(TRACER, "path", os.fspath(path))
+    monkeypatch.setattr(TRACER, "enabled", True)
+    monkeypatch.setattr(TRACER, "sample_rate", 1.0)
+    yield path
+    TRACER.close()
+
+
+def read_spans(path):
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def call_line(request_id, name, meta=None):
+    params = {"name": name, "arguments": {}}
+    if meta is not None:
+        params["_meta"] = meta
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": params}).encode()
+
+
+def test_disabled_tracer_starts_no_spans(tmp_path):
+    tracer = Tracer(None)
+
+    assert tracer.start("tools/call", {}) is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_spans_follow_a_call_from_the_daemon_into_the_provider(trace_file, monkeypatch):
+    from mcp_core.transport_http import run_http
+    from mcp_daemon.main import execute_tool
+
+    dispatcher = MainThreadDispatcher(lambda name, arguments: {"message": "pong"}, interval=0.001)
+    stop = threading.Event()
+
+    def main_thread():
+        while not stop.is_set():
+            stop.wait(dispatcher.tick())
+
+    ticker = threading.Thread(target=main_thread, daemon=True)
+    ticker.start()
+    server = run_http(port=0, tool_executor=dispatcher.submit)
+    try:
+        host, port = server.server_address
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", f"http://{host}:{port}/mcp")
+        response = handle_request(_parse(call_line(7, "blender.ping")), tool_executor=execute_tool)
+    finally:
+        server.shutdown()
+        server.server_close()
+        stop.set()
+        ticker.join()
+
+    assert "error" not in response
+    spans = {span["name"]: span for span in read_spans(trace_file)}
+    roots = [span for span in read_spans(trace_file) if span["name"] == "tools/call"]
+    daemon = next(span for span in roots if span["parent_id"] is None)
+    provider = next(span for span in roots if span["parent_id"] is not None)
+    hop = spans["proxy.hop"]
+
+    assert {span["trace_id"] for span in read_spans(trace_file)} == {daemon["trace_id"]}
+    assert spans["stdio.parse"]["parent_id"] == daemon["span_id"]
+    assert hop["parent_id"] == daemon["span_id"]
+    assert provider["parent_id"] == hop["span_id"]
+    assert provider["attributes"]["request_id"] == 7
+    for name in ("http.parse", "dispatch.wait", "tool.execute"):
+        assert spans[name]["parent_id"] == provider["span_id"]
+    assert daemon["duration_ms"] >= hop["duration_ms"] >= provider["duration_ms"]
+
+
+def test_client_trace_is_continued_and_errors_are_recorded(trace_file):
+    def executor(name, arguments):
+        raise RuntimeError("boom")
+
+    meta = {"trace": {"trace_id": "abc", "parent_id": "client", "sampled": True}}
+    handle_request(_parse(call_line(1, "boom", meta)), tool_executor=executor)
+
+    parse, request = sorted(read_spans(trace_file), key=lambda span: span["name"])
+    assert request["trace_id"] == parse["trace_id"] == "abc"
+    assert request["parent_id"] == "client"
+    assert request["attributes"]["error"] == -32003
+
+
+def test_unsampled_traces_write_nothing_and_stay_unsampled_downstream(trace_file, monkeypatch):
+    monkeypatch.setattr(TRACER, "sample_rate", 0.0)
+    propagated = []
+
+    def executor(name, arguments):
+        from mcp_core.cancellation import current_request
+
+        propagated.append(current_request().span.propagate())
+        return {}
+
+    handle_request(_parse(call_line(1, "blender.ping")), tool_executor=executor)
+    meta = {"trace": propagated[0]}
+    handle_request(_parse(call_line(2, "blender.ping", meta)), tool_executor=lambda name, arguments: {})
+
+    assert propagated[0]["sampled"] is False
+    assert read_spans(trace_file) == []
+
+
+def test_batch_members_are_traced_through_the_daemon(trace_file, monkeypatch):
+    from mcp_core.transport_http import run_http
+    from mcp_daemon.main import execute_tool, execute_tool_batch
+
+    server = run_http(port=0, tool_executor=lambda name, arguments: {"message": "pong"})
+    try:
+        host, port = server.server_address
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", f"http://{host}:{port}/mcp")
+        batch = [json.loads(call_line(request_id, "blender.ping")) for request_id in ("a", "b")]
+        response = handle_request(batch, tool_executor=execute_tool, batch_executor=execute_tool_batch)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [item["id"] for item in response] == ["a", "b"]
+    spans = read_spans(trace_file)
+    roots = [span for span in spans if span["name"] == "tools/call"]
+    daemon = {span["attributes"]["request_id"]: span for span in roots if span["parent_id"] is None}
+    providers = [span for span in roots if span["parent_id"] is not None]
+    hops = {span["parent_id"]: span for span in spans if span["name"] == "proxy.hop"}
+
+    assert sorted(daemon) == ["a", "b"]
+    assert len({span["trace_id"] for span in daemon.values()}) == 2
+    for request_id, root in daemon.items():
+        hop = hops[root["span_id"]]
+        provider = next(span for span in providers if span["parent_id"] == hop["span_id"])
+        assert provider["trace_id"] == root["trace_id"]
+        assert provider["attributes"]["request_id"] == request_id
+
+
+def test_async_daemon_reuses_client_ids_and_continues_the_trace(trace_file, monkeypatch):
+    import asyncio
+
+    from mcp_core.metrics import METRICS
+    from mcp_core.server_async import handle_request_async
+    from mcp_core.transport_http import run_http
+    from mcp_daemon.proxy_async import execute_tool_async
+
+    seen = []
+
+    def provider(name, arguments):
+        from mcp_core.cancellation import current_request
+
+        seen.append(current_request().request_id)
+        return {"message": "pong"}
+
+    server = run_http(port=0, tool_executor=provider)
+    METRICS.reset()
+    try:
+        host, port = server.server_address
+        monkeypatch.setenv("BLENDER_MCP_HTTP_URL", f"http://{host}:{port}/mcp")
+        request = _parse(call_line(9, "blender.ping"))
+        response = asyncio.run(handle_request_async(request, tool_executor=execute_tool_async))
+        asyncio.run(execute_tool_async("blender.ping", {}))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "error" not in response
+    assert seen[0] == 9 and seen[1].startswith("daemon-")
+    spans = read_spans(trace_file)
+    daemon = next(span for span in spans if span["name"] == "tools/call" and span["parent_id"] is None)
+    hop = next(span for span in spans if span["name"] == "proxy.hop")
+    provider_span = next(span for span in spans if span["name"] == "tools/call" and span["parent_id"] == hop["span_id"])
+    assert hop["parent_id"] == daemon["span_id"]
+    assert provider_span["trace_id"] == daemon["trace_id"]
+    assert METRICS.snapshot()["proxy"]["blender.ping"]["count"] == 2
+    METRICS.reset()
@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+import threading
 import time
 from http.client import HTTPConnection
 from pathlib import Path
@@ -96,3 +97,86 @@ def test_get_route_returns_method_not_found():
         assert response["jsonrpc"] == "2.0"
     finally:
         stop_server(server)
+
+
+def test_post_batch_returns_array():
+    server = start_server(tool_executor=lambda name, arguments: {"tool": name})
+    try:
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"tool": f"t{i}", "arguments": {}}}
+            for i in range(3)
+        ]
+        response = request_json(server, body=batch)
+        assert [item["result"]["data"]["tool"] for item in response] == ["t0", "t1", "t2"]
+    finally:
+        stop_server(server)
+
+
+def test_post_notification_batch_returns_no_content():
+    server = start_server()
+    try:
+        host, port = server.server_address
+        conn = HTTPConnection(host, port, timeout=2)
+        body = json.dumps([{"jsonrpc": "2.0", "method": "notifications/initialized", "params": {}}])
+        conn.request("POST", "/mcp", body=body.encode("utf-8"), headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        assert resp.status == 204
+        assert resp.read() == b""
+        conn.close()
+    finally:
+        stop_server(server)
+
+
+def test_connection_is_kept_alive_between_requests():
+    server = start_server(tool_executor=lambda name, arguments: {"tool": name})
+    try:
+        host, port = server.server_address
+        conn = HTTPConnection(host, port, timeout=2)
+        for index in range(3):
+            body = {"jsonrpc": "2.0", "id": index, "method": "tools/call", "params": {"tool": "t", "arguments": {}}}
+            conn.request("POST", "/mcp", body=json.dumps(body).encode("utf-8"), headers={"Content-Type": "application/json"})
+            resp = conn.getresponse()
+            payload = json.loads(resp.read().decode("utf-8"))
+            assert resp.version == 11
+            assert not resp.will_close
+            assert payload["id"] == index
+        conn.close()
+    finally:
+        stop_server(server)
+
+
+def test_worker_pool_rejects_calls_beyond_queue_and_keeps_listing_fast():
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_executor(tool_name, arguments):
+        started.set()
+        release.wait(5)
+        return {"tool": tool_name}
+
+    server = run_http(port=0, tool_executor=slow_executor, workers=1, queue_size=1)
+    assert server is not None
+    call = {"jsonrpc": "2.0", "id": "slow", "method": "tools/call", "params": {"tool": "slow", "arguments": {}}}
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(request_json(server, body=call))) for _ in range(2)]
+    try:
+        threads[0].start()
+        assert started.wait(2)
+        threads[1].start()
+        time.sleep(0.1)
+
+        overloaded = request_json(server, body={**call, "id": "third"})
+        assert overloaded["error"]["code"] == -32005
+        assert overloaded["id"] == "third"
+
+        begin = time.perf_counter()
+        listing = request_json(server, body={"jsonrpc": "2.0", "id": "list", "method": "tools/list", "params": {}})
+        assert listing["result"]["tools"] == []
+        assert time.perf_counter() - begin < 1.0
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        stop_server(server)
+
+    assert [item["result"]["data"]["tool"] for item in results] == ["slow", "slow"]
@@ -1,7 +1,9 @@
 import json
 import os
 import sys
-from io import StringIO
+import threading
+from io import BytesIO, StringIO
+from types import SimpleNamespace
 from pathlib import Path
 
 import pytest
@@ -10,7 +12,10 @@ import pytest
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, os.fspath(ROOT))
 
+from src.mcp_core.codec import available_codecs
+from src.mcp_core.framing import HEADER, FrameReader, encode_frame
 from src.mcp_core.server import handle_request
+from src.mcp_core import transport_stdio
 from src.mcp_core.transport_stdio import run_stdio
 
 
@@ -86,3 +91,152 @@ def test_valid_json_invalid_request_returns_invalid_request_code():
     assert response["jsonrpc"] == "2.0"
     assert response["error"]["code"] == -32600
     assert response["id"] is None
+
+
+def test_batch_line_produces_single_array_line():
+    batch = [
+        {"jsonrpc": "2.0", "id": "b-1", "method": "tools/list", "params": {}},
+        {"jsonrpc": "2.0", "method": "notifications/initialized", "params": {}},
+        {"jsonrpc": "2.0", "id": "b-2", "method": "tools/call", "params": {"tool": "echo", "arguments": {}}},
+    ]
+    output_lines = run_with_io(json.dumps(batch) + "\n")
+
+    assert len(output_lines) == 1
+    responses = json.loads(output_lines[0])
+    assert [item["id"] for item in responses] == ["b-1", "b-2"]
+    assert responses[1]["error"]["code"] == -32004
+
+
+def run_concurrently(input_lines, executor, max_in_flight=4):
+    stdin = StringIO(input_lines)
+    stdout = StringIO()
+    orig_stdin, orig_stdout = sys.stdin, sys.stdout
+    sys.stdin, sys.stdout = stdin, stdout
+    try:
+        run_stdio(tool_executor=executor, tool_lister=lambda: [], max_in_flight=max_in_flight)
+    finally:
+        sys.stdin, sys.stdout = orig_stdin, orig_stdout
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+def test_concurrent_mode_answers_out_of_order():
+    fast_done = threading.Event()
+
+    def executor(tool_name, arguments):
+        if tool_name == "slow":
+            fast_done.wait(2)
+            return {"tool": "slow", "after_fast": fast_done.is_set()}
+        fast_done.set()
+        return {"tool": "fast"}
+
+    requests = [
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"tool": "slow", "arguments": {}}},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"tool": "fast", "arguments": {}}},
+    ]
+    responses = run_concurrently("\n".join(json.dumps(r) for r in requests) + "\n", executor)
+
+    assert [item["id"] for item in responses] == [2, 1]
+    assert responses[1]["result"]["data"]["after_fast"] is True
+
+
+def test_concurrent_mode_answers_listing_while_all_workers_busy(monkeypatch):
+    listed = threading.Event()
+    write_message = transport_stdio.write_message
+
+    def write_and_signal(message):
+        write_message(message)
+        if isinstance(message, dict) and message.get("id") == "list":
+            listed.set()
+
+    monkeypatch.setattr(transport_stdio, "write_message", write_and_signal)
+
+    def executor(tool_name, arguments):
+        listed.wait(2)
+        return {"listed_first": listed.is_set()}
+
+    lines = [
+        json.dumps({"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"tool": "slow", "arguments": {}}})
+        for i in range(2)
+    ]
+    lines += [json.dumps({"jsonrpc": "2.0", "id": "list", "method": "tools/list", "params": {}}), "not-json"]
+
+    responses = run_concurrently("\n".join(lines) + "\n", executor, max_in_flight=2)
+
+    assert responses[0]["id"] == "list"
+    assert responses[1]["error"]["code"] == -32700
+    assert all(item["result"]["data"]["listed_first"] for item in responses[2:])
+
+
+class CountingBytesIO(BytesIO):
+    writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+def run_framed(frames, executor=None, max_in_flight=1):
+    stdout = CountingBytesIO()
+    orig_stdin, orig_stdout = sys.stdin, sys.stdout
+    sys.stdin = SimpleNamespace(buffer=BytesIO(b"".join(encode_frame(frame) for frame in frames)))
+    sys.stdout = SimpleNamespace(buffer=stdout)
+    try:
+        run_stdio(tool_executor=executor, tool_lister=lambda: [], max_in_flight=max_in_flight, framing="length")
+    finally:
+        sys.stdin, sys.stdout = orig_stdin, orig_stdout
+    responses = [json.loads(frame) for frame in FrameReader(BytesIO(stdout.getvalue()))]
+    return responses, stdout.writes
+
+
+def test_framed_mode_coalesces_pipelined_responses():
+    frames = [
+        json.dumps({"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"tool": "t", "arguments": {}}}).encode()
+        for i in range(3)
+    ]
+    frames += [b"", b'{"jsonrpc": "2.0", "method": "notifications/initialized"}', b"not-json"]
+
+    responses, writes = run_framed(frames, executor=lambda name, arguments: {"tool": name})
+
+    assert [item["id"] for item in responses] == [0, 1, 2, None]
+    assert responses[3]["error"]["code"] == -32700
+    assert writes == 1
+
+
+def test_framed_mode_concurrent_answers_every_call():
+    frames = [
+        json.dumps({"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"tool": "t", "arguments": {}}}).encode()
+        for i in range(20)
+    ]
+
+    responses, _ = run_framed(frames, executor=lambda name, arguments: {"tool": name}, max_in_flight=4)
+
+    assert sorted(item["id"] for item in responses) == list(range(20))
+
+
+def test_frame_reader_handles_split_chunks_and_truncation():
+    data = encode_frame(b"abc") + encode_frame(b"defgh") + HEADER.pack(10) + b"xy"
+    reader = FrameReader(BytesIO(data), chunk_size=3)
+
+    assert next(reader) == b"abc"
+    assert next(reader) == b"defgh"
+    assert not reader.pending()
+    assert list(reader) == []
+
+
+@pytest.mark.skipif(os.getenv("BLENDER_MCP_JSON") == "orjson", reason="orjson explicitly requested for stdio")
+@pytest.mark.parametrize("backend", sorted(available_codecs()))
+def test_newline_mode_output_is_unchanged(backend, monkeypatch):
+    # Whichever backend the codec picked, newline mode writes what json.dumps wrote before it.
+    monkeypatch.setattr(transport_stdio, "dumps", available_codecs()[backend].dumps)
+    request = {"jsonrpc": "2.0", "id": "n-1", "method": "tools/call", "params": {"tool": "t\u00e9", "arguments": {}}}
+    stdout = BytesIO()
+    orig_stdin, orig_stdout = sys.stdin, sys.stdout
+    sys.stdin = SimpleNamespace(buffer=BytesIO(json.dumps(request).encode() + b"\n"))
+    sys.stdout = SimpleNamespace(buffer=stdout)
+    try:
+        run_stdio(tool_executor=lambda name, arguments: {"tool": name, "value": float("nan")})
+    finally:
+        sys.stdin, sys.stdout = orig_stdin, orig_stdout
+
+    expected = b'{"jsonrpc": "2.0", "id": "n-1", "result": {"ok": true, "data": {"tool": "t\\u00e9", "value": NaN}}}'
+    assert stdout.getvalue() == expected + b"\n"
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core.framing import FrameError, encode_frame, recv_frame, send_frame
+from mcp_core.transport_uds import run_uds
+from mcp_daemon import main as daemon
+from mcp_daemon import proxy_async
+from mcp_daemon.uds_pool import UnixConnectionPool
+
+
+def echo_executor(tool_name, arguments):
+    return {"tool": tool_name, "arguments": arguments}
+
+
+@pytest.fixture
+def server(tmp_path):
+    path = os.fspath(tmp_path / "provider.sock")
+    server = run_uds(path, tool_executor=echo_executor, tool_lister=lambda: [])
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def exchange(path, payload):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        send_frame(sock, payload)
+        return recv_frame(sock)
+
+
+def test_frames_round_trip_over_a_socket_pair():
+    left, right = socket.socketpair()
+    with left, right:
+        send_frame(left, b'{"a": 1}')
+        send_frame(left, b"")
+        assert recv_frame(right) == b'{"a": 1}'
+        assert recv_frame(right) == b""
+        left.close()
+        assert recv_frame(right) is None
+
+
+def test_oversized_frame_is_rejected():
+    left, right = socket.socketpair()
+    with left, right:
+        left.sendall(encode_frame(b"x" * 32))
+        with pytest.raises(FrameError):
+            recv_frame(right, max_size=16)
+
+
+def test_call_notification_and_invalid_json(server):
+    path = server.server_address
+    call = {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": {"tool": "t", "arguments": {"x": 1}}}
+
+    assert json.loads(exchange(path, json.dumps(call).encode())) == {
+        "jsonrpc": "2.0",
+        "id": 7,
+        "result": {"ok": True, "data": {"tool": "t", "arguments": {"x": 1}}},
+    }
+    assert exchange(path, b'{"jsonrpc": "2.0", "method": "notifications/initialized"}') == b""
+    assert json.loads(exchange(path, b"{nope"))["error"]["code"] == -32700
+    assert oct(os.stat(path).st_mode & 0o777) == "0o600"
+
+
+def test_socket_file_is_removed_and_stale_file_replaced(tmp_path):
+    path = os.fspath(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    server = run_uds(path, tool_executor=echo_executor)
+    assert server is not None
+    assert run_uds(path, tool_executor=echo_executor) is None
+    server.shutdown()
+    server.server_close()
+    assert not os.path.exists(path)
+
+
+def test_daemon_selects_unix_transport_by_url_scheme(server, monkeypatch):
+    url = f"unix://{server.server_address}"
+    monkeypatch.setenv("BLENDER_MCP_HTTP_URL", url)
+
+    assert daemon.execute_tool("blender.ping", {})["data"] == {"tool": "blender.ping", "arguments": {}}
+    results = daemon.execute_tool_batch([("a", {}), ("b", {"n": 2})])
+    assert [result["data"]["tool"] for result in results] == ["a", "b"]
+    assert isinstance(daemon._POOLS[url], UnixConnectionPool)
+    assert daemon._POOLS[url].idle_count() == 1
+
+
+def test_pool_replays_once_after_provider_restart(server):
+    path = server.server_address
+    pool = UnixConnectionPool(f"unix://{path}")
+    body = b'{"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"tool": "t"}}'
+    assert json.loads(pool.post(body))["id"] == 1
+
+    server.shutdown()
+    server.server_close()
+    restarted = run_uds(path, tool_executor=echo_executor)
+    try:
+        assert json.loads(pool.post(body))["result"]["data"]["tool"] == "t"
+    finally:
+        pool.close()
+        restarted.shutdown()
+        restarted.server_close()
+
+
+def test_async_proxy_over_unix_socket(server, monkeypatch):
+    monkeypatch.setenv("BLENDER_MCP_HTTP_URL", f"unix://{server.server_address}")
+
+    async def scenario():
+        results = await asyncio.gather(*(proxy_async.execute_tool_async("t", {"i": i}) for i in range(5)))
+        return [result["data"]["arguments"]["i"] for result in results]
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
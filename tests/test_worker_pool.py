@@ -0,0 +1,145 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, os.fspath(SRC))
+
+from mcp_core.cancellation import RequestContext, RequestTimeout
+from mcp_daemon import worker_pool
+from mcp_daemon.worker_pool import PROVIDER_SCRIPT, BlenderWorkerPool, WorkerRestarted
+
+
+# The stdio provider runs without bpy for blender.ping; the banner stands in for Blender's own output.
+WORKER_COMMAND = [
+    sys.executable,
+    "-c",
+    "import runpy, sys; print('Blender 4.2.0 (hash abc)'); sys.stdout.flush(); "
+    f"runpy.run_path({os.fspath(PROVIDER_SCRIPT)!r}, run_name='__main__')",
+]
+
+
+# Answers every request line, but hangs on one that names blender.hang.
+HANGING_COMMAND = [
+    sys.executable,
+    "-c",
+    "import json, sys, time\n"
+    "for line in sys.stdin:\n"
+    "    request = json.loads(line)\n"
+    "    if request['params']['name'] == 'blender.hang':\n"
+    "        time.sleep(60)\n"
+    "    print(json.dumps({'jsonrpc': '2.0', 'id': request['id'], 'result': {}}), flush=True)\n",
+]
+
+
+def ping(pool, request_id=1, **kwargs):
+    body = json.dumps({"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": {"name": "blender.ping"}})
+    return json.loads(pool.post(body.encode(), **kwargs))
+
+
+@pytest.fixture
+def make_pool(monkeypatch):
+    monkeypatch.setattr(worker_pool, "MIN_RESTART_DELAY", 0.01)
+    pools = []
+
+    def make(size, command=WORKER_COMMAND, **kwargs):
+        pool = BlenderWorkerPool(size, command, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.close()
+
+
+def test_calls_skip_banner_and_reach_every_worker(make_pool):
+    pool = make_pool(2)
+
+    response = ping(pool, request_id=7)
+    assert response["id"] == 7 and "result" in response
+    batch = json.dumps([{"jsonrpc": "2.0", "id": i, "method": "tools/list"} for i in range(2)]).encode()
+    assert [item["id"] for item in json.loads(pool.post(batch))] == [0, 1]
+    assert all(worker["alive"] for worker in pool.stats()["workers"])
+
+
+def test_crashed_worker_is_restarted(make_pool):
+    pool = make_pool(1)
+    ping(pool)
+    worker = pool.workers[0]
+    worker.process.kill()
+    worker.process.wait()
+
+    assert "result" in ping(pool)
+    assert worker.restarts == 1 and worker.alive
+
+
+def test_sessions_pin_to_one_worker_and_report_restarts(make_pool):
+    pool = make_pool(2)
+    worker = pool._choose("scene-a")
+    assert pool._choose("scene-a") is worker
+    assert pool._choose("scene-b") is not worker
+
+    worker.process.kill()
+    for _ in range(300):
+        if worker.generation:
+            break
+        time.sleep(0.01)
+    with pytest.raises(WorkerRestarted):
+        ping(pool, session="scene-a")
+    assert "result" in ping(pool, session="scene-a")
+
+
+def test_pin_all_routes_every_call_to_one_worker(make_pool):
+    pool = make_pool(2, pin_all=True)
+    for request_id in range(3):
+        ping(pool, request_id)
+
+    assert list(pool._sessions) == [BlenderWorkerPool.DEFAULT_SESSION]
+
+
+def test_expired_call_is_not_sent(make_pool):
+    pool = make_pool(1)
+    context = RequestContext("late", 0.0)
+
+    with pytest.raises(RequestTimeout):
+        ping(pool, context=context)
+    assert "result" in ping(pool)
+
+
+def test_stuck_worker_is_restarted_after_the_deadline(make_pool, monkeypatch):
+    monkeypatch.setattr(worker_pool, "DEADLINE_GRACE", 0.1)
+    pool = make_pool(1, HANGING_COMMAND)
+    worker = pool.workers[0]
+    hang = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "blender.hang"}}
+    with pytest.raises(RequestTimeout):
+        pool.post(json.dumps(hang).encode(), context=RequestContext(None, 0.2))
+
+    started = time.monotonic()
+    response = ping(pool, request_id=2, context=RequestContext(None, 5.0))
+    assert response["id"] == 2 and "result" in response
+    assert time.monotonic() - started < 3.0
+    assert worker.restarts == 1
+
+
+def test_missing_binary_fails_calls(make_pool):
+    pool = BlenderWorkerPool(1, ["/nonexistent/blender"])
+    try:
+        with pytest.raises(RuntimeError, match="worker not running"):
+            ping(pool)
+    finally:
+        pool.close()
+
+
+def test_daemon_routes_tool_calls_to_workers(make_pool, monkeypatch):
+    from mcp_daemon import main
+
+    monkeypatch.setenv("BLENDER_MCP_WORKERS", "1")
+    monkeypatch.setattr(main, "_WORKERS", make_pool(1))
+
+    assert main.execute_tool("blender.ping", {}) == {"ok": True, "data": {"message": "pong"}}